@@ -0,0 +1,78 @@
+"""Benchmark: SDK record conformance vs. the compiled and trusted conformers.
+
+Run from the repository root with ``python -m benchmarks.conformance``.
+No network access is needed.
+"""
+
+from __future__ import annotations
+
+import copy
+import decimal
+import json
+import logging
+import time
+from importlib import resources
+
+from singer_sdk.helpers._typing import TypeConformanceLevel, conform_record_data_types
+
+from tap_NHL.conformance import compile_record_conformer
+from tap_NHL.streams import PlayerLandingStream
+
+LOGGER = logging.getLogger("benchmarks.conformance")
+
+
+def sample_value(schema, array_length=20):
+    """Return a value filling every property declared by ``schema``."""
+    types = schema.get("type", [])
+    types = types if isinstance(types, list) else [types]
+    if "properties" in schema:
+        return {name: sample_value(sub, array_length) for name, sub in schema["properties"].items()}
+    if "items" in schema:
+        return [sample_value(schema["items"], array_length) for _ in range(array_length)]
+    if "boolean" in types:
+        return True
+    if "integer" in types:
+        return 7
+    if "number" in types:
+        return decimal.Decimal("0.915")
+    if "object" in types:
+        return {"default": "Edmonton Oilers", "fr": "Oilers d'Edmonton"}
+    return "2025-01-07"
+
+
+def records_per_second(func, records):
+    """Return how many records ``func`` conforms per second."""
+    start = time.perf_counter()
+    for record in records:
+        func(record)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(number=2000):
+    """Print records/sec for each conformance mode on both landing schemas."""
+    for stream_name in ("skaters", "goalies"):
+        schema = json.loads(
+            (resources.files("tap_NHL") / "schemas" / f"{stream_name}.json").read_text()
+        )
+        record = sample_value(schema)
+        records = [copy.deepcopy(record) for _ in range(number)]
+
+        def sdk(record, schema=schema, stream_name=stream_name):
+            return conform_record_data_types(
+                stream_name, record, schema, TypeConformanceLevel.RECURSIVE, LOGGER,
+            )
+
+        compiled = compile_record_conformer(schema)
+        trusted = compile_record_conformer(
+            schema, trusted_properties=PlayerLandingStream.trusted_properties,
+        )
+        assert compiled(copy.deepcopy(record))[0] == sdk(copy.deepcopy(record))
+
+        print(f"{stream_name} ({number} records):")
+        for label, func in (("sdk", sdk), ("compiled", compiled), ("trusted", trusted)):
+            rate = records_per_second(func, records)
+            print(f"  {label:>8}: {rate:10,.0f} records/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+"""Local stand-in for the NHL landing, roster, game and stats summary endpoints.
+
+Serves the recorded payloads in ``benchmarks/fixtures`` so the tap can be
+benchmarked without network access. Run it on its own with
+``python -m benchmarks.fake_api --port 8080`` and point ``api_url`` at
+``http://127.0.0.1:8080`` and ``stats_api_url`` at
+``http://127.0.0.1:8080/stats/rest/en``.
+
+Latency, ``429`` injection and the dataset size are configurable. Request
+counters are served as JSON at ``/__stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+STATS_PREFIX = "/stats/rest/en"
+SKATER_ID_BASE = 8470000
+GOALIE_ID_BASE = 8460000
+
+LANDING_PATH = re.compile(r"^/v1/player/(\d+)/landing$")
+ROSTER_PATH = re.compile(r"^/v1/roster/(\w+)/current$")
+SCHEDULE_PATH = re.compile(r"^/v1/schedule/(\d{4}-\d{2}-\d{2})$")
+GAMECENTER_PATH = re.compile(r"^/v1/gamecenter/(\d+)/(boxscore|play-by-play)$")
+SEASON_FILTER = re.compile(r"seasonId=(\d+)")
+SEASON_RANGE_FILTER = re.compile(r"seasonId>=(\d+) and seasonId<=(\d+)")
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Players and seasons served by the fake API.
+
+    Each season's roster is a sliding window over the player IDs, so
+    consecutive seasons overlap like real rosters do and every player appears
+    in at least one season. The players of the last season are dealt out to
+    ``teams`` teams as their current rosters. Every calendar day has
+    ``games_per_day`` games of ``plays_per_game`` plays; games before today
+    are finished.
+    """
+
+    skaters: int = 1000
+    goalies: int = 100
+    seasons: tuple[int, ...] = (20202021, 20212022, 20222023, 20232024, 20242025)
+    roster_share: float = 0.5
+    teams: int = 4
+    games_per_day: int = 2
+    plays_per_game: int = 300
+
+    @property
+    def skater_ids(self) -> range:
+        """Return every skater ID of the dataset."""
+        return range(SKATER_ID_BASE, SKATER_ID_BASE + self.skaters)
+
+    @property
+    def goalie_ids(self) -> range:
+        """Return every goalie ID of the dataset."""
+        return range(GOALIE_ID_BASE, GOALIE_ID_BASE + self.goalies)
+
+    def roster(self, player_ids: range, season_id: int) -> list[int]:
+        """Return the IDs listed for ``season_id`` by a summary endpoint."""
+        if season_id not in self.seasons or not player_ids:
+            return []
+        count = len(player_ids)
+        size = max(int(count * self.roster_share), 1)
+        shift = (count - size) // max(len(self.seasons) - 1, 1)
+        offset = self.seasons.index(season_id) * shift
+        return [player_ids[(offset + index) % count] for index in range(size)]
+
+    @property
+    def team_abbrevs(self) -> list[str]:
+        """Return the abbreviation of every current team."""
+        return [f"T{index:02d}" for index in range(self.teams)]
+
+    def current_roster(self, team: str) -> dict[str, list[int]] | None:
+        """Return the player IDs of each roster section of ``team``, or None if unknown."""
+        if team not in self.team_abbrevs:
+            return None
+        index = self.team_abbrevs.index(team)
+        skaters = self.roster(self.skater_ids, self.seasons[-1])[index :: self.teams]
+        return {
+            "forwards": skaters[::2],
+            "defensemen": skaters[1::2],
+            "goalies": self.roster(self.goalie_ids, self.seasons[-1])[index :: self.teams],
+        }
+
+    def games_on(self, day: date) -> list[dict]:
+        """Return the schedule entries of the games played on ``day``."""
+        today = datetime.now(UTC).date()
+        state = "OFF" if day < today else "LIVE" if day == today else "FUT"
+        teams = self.team_abbrevs
+        return [
+            {
+                "id": int(day.strftime("%Y%m%d")) * 10 + number,
+                "gameType": 2,
+                "gameState": state,
+                "awayTeam": {"abbrev": teams[(2 * number) % len(teams)]},
+                "homeTeam": {"abbrev": teams[(2 * number + 1) % len(teams)]},
+            }
+            for number in range(self.games_per_day)
+        ]
+
+
+@dataclass
+class ServerOptions:
+    """How the fake API answers requests."""
+
+    dataset: Dataset = field(default_factory=Dataset)
+    latency: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: float = 0.0
+    gzip: bool = True
+    fixtures_dir: Path = FIXTURES_DIR
+    # Rows past this index are left out of summary pages (``total`` still
+    # counts them), like an API capping its result window. None: no cap.
+    max_result_rows: int | None = None
+
+
+class FakeNHLAPI(ThreadingHTTPServer):
+    """Threaded HTTP server answering like the NHL APIs the tap reads."""
+
+    daemon_threads = True
+
+    def __init__(self, options: ServerOptions, address: tuple[str, int] = ("127.0.0.1", 0)) -> None:
+        """Load the fixtures and bind to ``address``."""
+        super().__init__(address, FakeNHLHandler)
+        self.options = options
+        self.stats = {
+            "requests": 0,
+            "landing": 0,
+            "roster": 0,
+            "schedule": 0,
+            "gamecenter": 0,
+            "summary": 0,
+            "throttled": 0,
+            "bytes_sent": 0,
+            "connections": 0,
+        }
+        self._stats_lock = threading.Lock()
+        self._landing_templates = {
+            "skater": self._load_landing_template("skater_landing.json"),
+            "goalie": self._load_landing_template("goalie_landing.json"),
+        }
+        self._summary_rows = {
+            "skater": json.loads((options.fixtures_dir / "skater_summary_row.json").read_text()),
+            "goalie": json.loads((options.fixtures_dir / "goalie_summary_row.json").read_text()),
+        }
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to use as ``api_url``."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def count(self, key: str, amount: int = 1) -> int:
+        """Increment a request counter and return the new total request count."""
+        with self._stats_lock:
+            self.stats[key] += amount
+            return self.stats["requests"]
+
+    def snapshot(self) -> dict[str, int]:
+        """Return a copy of the request counters."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def should_throttle(self, request_number: int) -> bool:
+        """Return whether the ``request_number``-th request gets a 429."""
+        rate = self.options.throttle_rate
+        return int(request_number * rate) != int((request_number - 1) * rate)
+
+    def landing(self, player_id: int) -> bytes | None:
+        """Return the landing payload of ``player_id``, or None if unknown."""
+        dataset = self.options.dataset
+        if player_id in dataset.skater_ids:
+            kind = "skater"
+        elif player_id in dataset.goalie_ids:
+            kind = "goalie"
+        else:
+            return None
+        head, tail = self._landing_templates[kind]
+        return b"%s%d%s" % (head, player_id, tail)
+
+    def summary(
+        self,
+        kind: str,
+        season_ids: list[int],
+        start: int,
+        limit: int,
+        *,
+        aggregate: bool = False,
+    ) -> bytes:
+        """Return one page of a summary endpoint for the given seasons.
+
+        Aggregated pages hold one row per player over all seasons, others one
+        row per player and season.
+        """
+        dataset = self.options.dataset
+        player_ids = dataset.skater_ids if kind == "skater" else dataset.goalie_ids
+        rows: list[tuple[int, int | None]] = [
+            (player_id, season_id)
+            for season_id in season_ids
+            for player_id in dataset.roster(player_ids, season_id)
+        ]
+        if aggregate:
+            rows = [(player_id, None) for player_id in sorted({player_id for player_id, _ in rows})]
+        end = start + limit
+        if self.options.max_result_rows is not None:
+            end = min(end, self.options.max_result_rows)
+        row = self._summary_rows[kind]
+        data = [
+            {**row, "playerId": player_id, "seasonId": season_id}
+            for player_id, season_id in rows[start:end]
+        ]
+        return json.dumps({"data": data, "total": len(rows)}).encode()
+
+    def schedule(self, start: date) -> bytes:
+        """Return the schedule week starting on ``start``."""
+        days = [start + timedelta(days=offset) for offset in range(7)]
+        week = [
+            {"date": day.isoformat(), "games": self.options.dataset.games_on(day)}
+            for day in days
+        ]
+        return json.dumps(
+            {"nextStartDate": (start + timedelta(days=7)).isoformat(), "gameWeek": week},
+        ).encode()
+
+    def boxscore(self, game_id: int) -> bytes:
+        """Return the box score of ``game_id``."""
+        return json.dumps(
+            {
+                "id": game_id,
+                "gameDate": datetime.strptime(str(game_id // 10), "%Y%m%d").date().isoformat(),
+                "gameState": "OFF",
+                "awayTeam": {"score": 2, "sog": 30},
+                "homeTeam": {"score": 3, "sog": 28},
+                "playerByGameStats": {"awayTeam": {"forwards": []}, "homeTeam": {"forwards": []}},
+            },
+        ).encode()
+
+    def play_by_play(self, game_id: int) -> bytes:
+        """Return the play-by-play document of ``game_id``."""
+        plays = [
+            {
+                "eventId": event_id,
+                "sortOrder": event_id,
+                "periodDescriptor": {"number": (event_id - 1) * 3 // self.options.dataset.plays_per_game + 1},
+                "timeInPeriod": f"{event_id % 20:02d}:00",
+                "typeDescKey": "shot-on-goal",
+                "details": {"xCoord": 54.5, "yCoord": -12.25, "shootingPlayerId": SKATER_ID_BASE},
+            }
+            for event_id in range(1, self.options.dataset.plays_per_game + 1)
+        ]
+        return json.dumps({"id": game_id, "plays": plays, "rosterSpots": []}).encode()
+
+    def _load_landing_template(self, name: str) -> tuple[bytes, bytes]:
+        """Split a landing fixture around its top-level ``playerId`` value."""
+        payload = json.loads((self.options.fixtures_dir / name).read_text())
+        payload = {"playerId": 0, **{k: v for k, v in payload.items() if k != "playerId"}}
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        head, tail = body.split(b"0", 1)
+        return head, tail
+
+
+class FakeNHLHandler(BaseHTTPRequestHandler):
+    """Request handler of :class:`FakeNHLAPI`."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; Nagle's algorithm would hold
+    # the body back until the client's delayed ACK.
+    disable_nagle_algorithm = True
+    server: FakeNHLAPI
+
+    def setup(self) -> None:
+        """Count every accepted connection, to measure keep-alive reuse."""
+        super().setup()
+        self.server.count("connections")
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Serve landing, roster and summary pages and the request counters."""
+        url = urlsplit(self.path)
+        if url.path == "/__stats":
+            self._send(200, json.dumps(self.server.snapshot()).encode(), compress=False)
+            return
+
+        options = self.server.options
+        request_number = self.server.count("requests")
+        if options.latency:
+            time.sleep(options.latency)
+        if self.server.should_throttle(request_number):
+            self.server.count("throttled")
+            self._send(429, b'{"message": "Too Many Requests"}', {"Retry-After": f"{options.retry_after:g}"})
+            return
+
+        match = LANDING_PATH.match(url.path)
+        if match:
+            self.server.count("landing")
+            body = self.server.landing(int(match.group(1)))
+            if body is None:
+                self._send(404, b'{"message": "Not Found"}')
+            else:
+                self._send(200, body)
+            return
+
+        if url.path == "/v1/standings/now":
+            self.server.count("roster")
+            standings = [{"teamAbbrev": {"default": team}} for team in options.dataset.team_abbrevs]
+            self._send(200, json.dumps({"standings": standings}).encode())
+            return
+
+        match = ROSTER_PATH.match(url.path)
+        if match:
+            self.server.count("roster")
+            roster = options.dataset.current_roster(match.group(1))
+            if roster is None:
+                self._send(404, b'{"message": "Not Found"}')
+            else:
+                sections = {
+                    section: [{"id": player_id} for player_id in player_ids]
+                    for section, player_ids in roster.items()
+                }
+                self._send(200, json.dumps(sections).encode())
+            return
+
+        match = SCHEDULE_PATH.match(url.path)
+        if match:
+            self.server.count("schedule")
+            self._send(200, self.server.schedule(date.fromisoformat(match.group(1))))
+            return
+
+        match = GAMECENTER_PATH.match(url.path)
+        if match:
+            self.server.count("gamecenter")
+            game_id, kind = int(match.group(1)), match.group(2)
+            body = self.server.boxscore(game_id) if kind == "boxscore" else self.server.play_by_play(game_id)
+            self._send(200, body)
+            return
+
+        kind = url.path.removeprefix(f"{STATS_PREFIX}/").removesuffix("/summary")
+        if url.path.startswith(STATS_PREFIX) and kind in ("skater", "goalie"):
+            self.server.count("summary")
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            body = self.server.summary(
+                kind,
+                self._season_filter(params.get("cayenneExp", "")),
+                int(params.get("start", 0)),
+                int(params.get("limit", 50)),
+                aggregate=params.get("isAggregate") == "true",
+            )
+            self._send(200, body)
+            return
+
+        self._send(404, b'{"message": "Not Found"}')
+
+    def _season_filter(self, expression: str) -> list[int]:
+        """Return the dataset seasons selected by a ``cayenneExp`` filter."""
+        seasons = self.server.options.dataset.seasons
+        season_range = SEASON_RANGE_FILTER.search(expression)
+        if season_range:
+            first, last = int(season_range.group(1)), int(season_range.group(2))
+            return [season_id for season_id in seasons if first <= season_id <= last]
+        season = SEASON_FILTER.search(expression)
+        return [int(season.group(1))] if season else []
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        headers: dict[str, str] | None = None,
+        *,
+        compress: bool = True,
+    ) -> None:
+        if compress and self.server.options.gzip and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count("bytes_sent", len(body))
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Keep request logs off the benchmark output."""
+
+
+def add_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the dataset and behaviour options of the fake API to ``parser``."""
+    group = parser.add_argument_group("fake API")
+    group.add_argument("--skaters", type=int, default=Dataset.skaters, help="number of skaters")
+    group.add_argument("--goalies", type=int, default=Dataset.goalies, help="number of goalies")
+    group.add_argument("--seasons", type=int, default=len(Dataset.seasons), help="number of seasons")
+    group.add_argument("--teams", type=int, default=Dataset.teams, help="number of current teams")
+    group.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    group.add_argument("--throttle-rate", type=float, default=0.0, help="share of requests answered with 429")
+    group.add_argument("--retry-after", type=float, default=0.0, help="Retry-After sent with 429 responses")
+    group.add_argument("--no-gzip", action="store_true", help="never compress responses")
+    group.add_argument("--max-result-rows", type=int, help="cap the rows a summary query returns")
+    group.add_argument("--fixtures", type=Path, default=FIXTURES_DIR, help="directory of recorded payloads")
+
+
+def server_options(args: argparse.Namespace) -> ServerOptions:
+    """Build :class:`ServerOptions` from arguments added by :func:`add_server_arguments`."""
+    last_season = Dataset.seasons[-1] % 10000
+    seasons = tuple(
+        int(f"{year - 1}{year}") for year in range(last_season - args.seasons + 1, last_season + 1)
+    )
+    return ServerOptions(
+        dataset=Dataset(skaters=args.skaters, goalies=args.goalies, seasons=seasons, teams=args.teams),
+        latency=args.latency,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        gzip=not args.no_gzip,
+        fixtures_dir=args.fixtures,
+        max_result_rows=args.max_result_rows,
+    )
+
+
+def server_arguments(options: ServerOptions) -> list[str]:
+    """Return the command-line arguments reproducing ``options``."""
+    arguments = [
+        f"--skaters={options.dataset.skaters}",
+        f"--goalies={options.dataset.goalies}",
+        f"--seasons={len(options.dataset.seasons)}",
+        f"--teams={options.dataset.teams}",
+        f"--latency={options.latency}",
+        f"--throttle-rate={options.throttle_rate}",
+        f"--retry-after={options.retry_after}",
+        f"--fixtures={options.fixtures_dir}",
+    ]
+    if not options.gzip:
+        arguments.append("--no-gzip")
+    if options.max_result_rows is not None:
+        arguments.append(f"--max-result-rows={options.max_result_rows}")
+    return arguments
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Serve the fake API until interrupted, printing its URL first."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = FakeNHLAPI(server_options(args), (args.host, args.port))
+    print(server.url, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""Micro-benchmark: compiled locale normalizer vs. the former LOCALE_FIELDS loops.
+
+Run from the repository root with ``python -m benchmarks.normalize_locales``.
+No network access is needed.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import timeit
+from importlib import resources
+
+from tap_NHL.normalize import compile_locale_normalizer
+from tests.locale_fixtures import legacy_normalize, make_landing
+
+
+def main(number=2000):
+    """Print per-record timings for both implementations."""
+    schema = json.loads((resources.files("tap_NHL") / "schemas" / "skaters.json").read_text())
+    normalize = compile_locale_normalizer(schema)
+    payload = make_landing()
+    rows = [copy.deepcopy(payload) for _ in range(number)]
+
+    for label, func in (("LOCALE_FIELDS loops", legacy_normalize), ("compiled", normalize)):
+        batch = copy.deepcopy(rows)
+        it = iter(batch)
+        seconds = timeit.timeit(lambda: func(next(it)), number=number)  # noqa: B023
+        print(f"{label:>20}: {seconds / number * 1e6:8.1f} us/record")
+
+
+if __name__ == "__main__":
+    main()
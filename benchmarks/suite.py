@@ -0,0 +1,364 @@
+"""Offline benchmark suite running the tap against the fake NHL API.
+
+Run from the repository root with ``python -m benchmarks.suite``. The fake
+API (:mod:`benchmarks.fake_api`) is started in a subprocess, so no network
+access is needed. Results are printed as JSON, or written with ``--output``.
+Compare two result files, e.g. from two commits, with
+``python -m benchmarks.suite --compare BASE.json HEAD.json``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+import urllib.request
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+import requests
+
+from benchmarks.fake_api import (
+    STATS_PREFIX,
+    ServerOptions,
+    add_server_arguments,
+    server_arguments,
+    server_options,
+)
+from benchmarks.tap_process import PEAK_RSS_FILE, peak_rss_kib
+from tap_NHL.decoding import fast_json_available
+from tap_NHL.tap import TapNHL
+
+if t.TYPE_CHECKING:
+    from tap_NHL.streams import PlayerLandingStream
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = ("startup", "discovery", "landing", "post_process", "decode", "end_to_end")
+RESULTS_VERSION = 1
+
+
+@contextmanager
+def fake_api(options: ServerOptions):
+    """Run the fake API in a subprocess and yield its base URL."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_api", "--port=0", *server_arguments(options)],
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        url = process.stdout.readline().strip() if process.stdout else ""
+        if not url:
+            msg = "The fake API did not start."
+            raise RuntimeError(msg)
+        yield url
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def server_stats(url: str) -> dict[str, int]:
+    """Return the fake API's request counters."""
+    with urllib.request.urlopen(f"{url}/__stats") as response:  # noqa: S310
+        return json.load(response)
+
+
+def landing_stream(tap: TapNHL, name: str) -> PlayerLandingStream:
+    """Return one of the tap's landing streams."""
+    return t.cast("PlayerLandingStream", tap.streams[name])
+
+
+def tap_config(url: str, options: ServerOptions, settings: dict) -> dict:
+    """Return a tap config pointing every stream at the fake API."""
+    return {
+        "api_url": url,
+        "stats_api_url": f"{url}{STATS_PREFIX}",
+        "discovery_seasons": list(options.dataset.seasons),
+        "max_requests_per_second": 1000,
+        "rate_limit_max_rps": 1000,
+        **settings,
+    }
+
+
+def bench_startup(url: str, options: ServerOptions, settings: dict, runs: int) -> dict:
+    """Time ``tap-nhl --discover`` and ``--about`` and count the requests they make."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / "config.json"
+        config_path.write_text(json.dumps(tap_config(url, options, settings)))
+        before = server_stats(url)
+        results = {}
+        for name, arguments in (
+            ("discover", ["--config", str(config_path), "--discover"]),
+            ("about", ["--about"]),
+        ):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                subprocess.run(
+                    [sys.executable, "-m", "benchmarks.tap_process", *arguments],
+                    cwd=REPO_ROOT,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                )
+                timings.append(time.perf_counter() - start)
+            results[f"{name}_seconds_median"] = statistics.median(timings)
+            results[f"{name}_seconds_max"] = max(timings)
+    results["requests"] = server_stats(url)["requests"] - before["requests"]
+    return results
+
+
+def bench_discovery(url: str, options: ServerOptions, settings: dict) -> dict:
+    """Time player discovery of both landing streams."""
+    tap = TapNHL(config=tap_config(url, options, settings))
+    before = server_stats(url)
+    start = time.perf_counter()
+    players = sum(
+        len(landing_stream(tap, name)._fetch_all_player_ids())
+        for name in ("skaters", "goalies")
+    )
+    seconds = time.perf_counter() - start
+    pages = server_stats(url)["summary"] - before["summary"]
+    return {
+        "seconds": seconds,
+        "players": players,
+        "pages": pages,
+        "pages_per_second": pages / seconds,
+    }
+
+
+def bench_landing(url: str, options: ServerOptions, settings: dict, count: int) -> dict:
+    """Measure landing requests per second, honouring landing_concurrency."""
+    player_ids = list(options.dataset.skater_ids)[:count]
+    config = {**tap_config(url, options, settings), "skater_ids": player_ids}
+    skaters = landing_stream(TapNHL(config=config), "skaters")
+    start = time.perf_counter()
+    if skaters._get_landing_concurrency() > 1:
+        prefetcher = skaters._get_landing_prefetcher()
+        responses = [prefetcher.get(player_id) for player_id in player_ids]
+    else:
+        responses = [skaters._fetch_landing_response(player_id) for player_id in player_ids]
+    seconds = time.perf_counter() - start
+    return {
+        "requests": len(responses),
+        "seconds": seconds,
+        "requests_per_second": len(responses) / seconds,
+        "response_bytes": sum(len(response.content) for response in responses),
+    }
+
+
+def bench_post_process(options: ServerOptions, settings: dict, count: int) -> dict:
+    """Measure records per second through parse_response and post_process."""
+    results = {}
+    for name, fixture in (("skaters", "skater_landing.json"), ("goalies", "goalie_landing.json")):
+        stream = landing_stream(TapNHL(config=settings), name)
+        response = requests.Response()
+        response._content = (options.fixtures_dir / fixture).read_bytes()
+
+        start = time.perf_counter()
+        records = [record for _ in range(count) for record in stream.parse_response(response)]
+        parse_seconds = time.perf_counter() - start
+
+        context = {"player_id": records[0]["playerId"]}
+        start = time.perf_counter()
+        for record in records:
+            stream.post_process(record, context)
+        post_process_seconds = time.perf_counter() - start
+
+        results[name] = {
+            "records": len(records),
+            "parse_records_per_second": len(records) / parse_seconds,
+            "post_process_records_per_second": len(records) / post_process_seconds,
+        }
+    return results
+
+
+def bench_decode(options: ServerOptions, settings: dict, count: int) -> dict:
+    """Measure records per second through parse_response with each JSON decoder."""
+    if not fast_json_available():
+        return {"skipped": "fast_json_decode requires the fast-json extra"}
+    results = {}
+    for name, fixture in (("skaters", "skater_landing.json"), ("goalies", "goalie_landing.json")):
+        response = requests.Response()
+        response._content = (options.fixtures_dir / fixture).read_bytes()
+        rates = {}
+        for decoder, fast in (("standard", False), ("fast", True)):
+            config = {**settings, "fast_json_decode": fast}
+            stream = landing_stream(TapNHL(config=config), name)
+            start = time.perf_counter()
+            for _ in range(count):
+                for _record in stream.parse_response(response):
+                    pass
+            rates[decoder] = count / (time.perf_counter() - start)
+        results[name] = {
+            "standard_records_per_second": rates["standard"],
+            "fast_records_per_second": rates["fast"],
+            "fast_speedup": rates["fast"] / rates["standard"],
+        }
+    return results
+
+
+def bench_end_to_end(url: str, options: ServerOptions, settings: dict) -> dict:
+    """Run the tap CLI against the fake API and measure its output throughput."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = Path(tmp_dir) / "config.json"
+        config_path.write_text(json.dumps(tap_config(url, options, settings)))
+        peak_rss_path = Path(tmp_dir) / "peak_rss"
+        before = server_stats(url)
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.tap_process", "--config", str(config_path)],
+            cwd=REPO_ROOT,
+            env={**os.environ, PEAK_RSS_FILE: str(peak_rss_path)},
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        records = output_bytes = 0
+        for line in process.stdout or ():
+            output_bytes += len(line)
+            if line.startswith(b'{"type":"RECORD"'):
+                records += 1
+        returncode = process.wait()
+        seconds = time.perf_counter() - start
+        peak_rss = int(peak_rss_path.read_text()) if peak_rss_path.exists() else 0
+    if returncode:
+        msg = f"The tap exited with status {returncode}."
+        raise RuntimeError(msg)
+    after = server_stats(url)
+    return {
+        "seconds": seconds,
+        "records": records,
+        "records_per_second": records / seconds,
+        "output_bytes": output_bytes,
+        "requests": after["requests"] - before["requests"],
+        "throttled_requests": after["throttled"] - before["throttled"],
+        "peak_rss_mb": peak_rss / 1024,
+    }
+
+
+def git_commit() -> str | None:
+    """Return the checked-out commit, if the suite runs from a git checkout."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run the selected benchmarks and return the results document."""
+    options = server_options(args)
+    settings = dict(args.setting)
+    selected = args.only or BENCHMARKS
+    results: dict[str, dict] = {}
+    with fake_api(options) as url:
+        if "startup" in selected:
+            results["startup"] = bench_startup(url, options, settings, args.startup_runs)
+        if "discovery" in selected:
+            results["discovery"] = bench_discovery(url, options, settings)
+        if "landing" in selected:
+            results["landing"] = bench_landing(url, options, settings, args.landing_requests)
+        if "post_process" in selected:
+            results["post_process"] = bench_post_process(options, settings, args.records)
+        if "decode" in selected:
+            results["decode"] = bench_decode(options, settings, args.records)
+        if "end_to_end" in selected:
+            results["end_to_end"] = bench_end_to_end(url, options, settings)
+    results["suite"] = {"peak_rss_mb": peak_rss_kib() / 1024}
+    return {
+        "version": RESULTS_VERSION,
+        "commit": git_commit(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            **{key: value for key, value in vars(args).items() if key not in ("output", "compare", "fixtures")},
+            "seasons": list(options.dataset.seasons),
+        },
+        "results": results,
+    }
+
+
+def flatten(results: dict, prefix: str = "") -> dict[str, float]:
+    """Return the numeric metrics of ``results`` keyed by dotted path."""
+    metrics = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            metrics.update(flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[path] = value
+    return metrics
+
+
+def compare(base_path: Path, head_path: Path) -> None:
+    """Print every metric of two result files with its relative change."""
+    base = flatten(json.loads(base_path.read_text())["results"])
+    head = flatten(json.loads(head_path.read_text())["results"])
+    print(f"{'metric':<55} {'base':>14} {'head':>14} {'change':>8}")
+    for metric in sorted(base.keys() | head.keys()):
+        before, after = base.get(metric), head.get(metric)
+        change = f"{(after - before) / before:+.1%}" if before and after is not None else ""
+        print(
+            f"{metric:<55} "
+            f"{'' if before is None else f'{before:,.2f}':>14} "
+            f"{'' if after is None else f'{after:,.2f}':>14} "
+            f"{change:>8}",
+        )
+
+
+def parse_setting(value: str) -> tuple[str, object]:
+    """Parse a ``KEY=VALUE`` tap setting; the value is decoded as JSON if possible."""
+    key, _, raw = value.partition("=")
+    try:
+        return key, json.loads(raw)
+    except json.JSONDecodeError:
+        return key, raw
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the suite, or compare two result files."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS, help="benchmarks to run")
+    parser.add_argument("--startup-runs", type=int, default=5, help="runs per startup command")
+    parser.add_argument("--landing-requests", type=int, default=500, help="landing pages to fetch")
+    parser.add_argument("--records", type=int, default=2000, help="records to post-process per stream")
+    parser.add_argument(
+        "--setting",
+        type=parse_setting,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="tap setting to apply, e.g. landing_concurrency=8 (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BASE", "HEAD"))
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    document = json.dumps(run(args), indent=2)
+    if args.output:
+        args.output.write_text(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
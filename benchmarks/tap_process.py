@@ -0,0 +1,42 @@
+"""Run the tap CLI and record the process's peak memory when it exits.
+
+Used by the end-to-end benchmark of :mod:`benchmarks.suite`. A child's
+``ru_maxrss`` also counts the parent's memory at fork time, so the process
+reports its own high-water mark to the file named by ``PEAK_RSS_FILE``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import resource
+import sys
+from pathlib import Path
+
+from tap_NHL.tap import TapNHL
+
+PEAK_RSS_FILE = "TAP_NHL_BENCHMARK_PEAK_RSS_FILE"
+
+
+def peak_rss_kib() -> int:
+    """Return the peak resident set size of this process in KiB."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def write_peak_rss() -> None:
+    """Write the peak resident set size to the file named in the environment."""
+    path = os.environ.get(PEAK_RSS_FILE)
+    if path:
+        Path(path).write_text(str(peak_rss_kib()))
+
+
+if __name__ == "__main__":
+    atexit.register(write_peak_rss)
+    TapNHL.cli()
@@ -0,0 +1,19 @@
+-- This file contains season-level queries against the narrow season totals tables
+
+-- Top 25 single-season goal totals by NHL skaters in the regular season.
+-- Adjust LIMIT 25 to your desired value to view a different number of results.
+SELECT s."firstName", s."lastName", t."season", t."teamName", t."goals"
+FROM tap_nhl.skater_season_totals AS t
+JOIN tap_nhl.skaters AS s ON s."playerId" = t."playerId"
+WHERE t."leagueAbbrev" = 'NHL' AND t."gameTypeId" = 2 AND t."goals" IS NOT NULL
+ORDER BY t."goals" DESC
+LIMIT 25;
+
+-- Top 25 single-season win totals by NHL goalies in the regular season.
+-- Adjust LIMIT 25 to your desired value to view a different number of results.
+SELECT g."firstName", g."lastName", t."season", t."teamName", t."wins"
+FROM tap_nhl.goalie_season_totals AS t
+JOIN tap_nhl.goalies AS g ON g."playerId" = t."playerId"
+WHERE t."leagueAbbrev" = 'NHL' AND t."gameTypeId" = 2 AND t."wins" IS NOT NULL
+ORDER BY t."wins" DESC
+LIMIT 25;
@@ -0,0 +1,256 @@
+"""Append-only archive of raw API responses for offline replays."""
+
+from __future__ import annotations
+
+import functools
+import io
+import json
+import mmap
+import shutil
+import tempfile
+import threading
+import time
+import typing as t
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from tap_NHL.constants import (
+    ARCHIVE_COMPRESSION_LEVEL,
+    ARCHIVE_READ_SIZE,
+    ARCHIVE_SPOOL_SIZE,
+)
+
+if t.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+    from urllib3 import BaseHTTPResponse
+
+# Response headers kept with an archived body.
+ARCHIVED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+DATA_FILE = "responses.zlib"
+INDEX_FILE = "index.jsonl"
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """Location of one archived response body in the data file."""
+
+    url: str
+    fetched_at: float
+    offset: int
+    length: int
+    headers: dict[str, str]
+
+
+class ResponseArchive:
+    """Directory of captured response bodies, indexed by URL and fetch time.
+
+    Each captured body is compressed on its own and appended to
+    ``responses.zlib``; a JSON line recording its URL, fetch time, offset and
+    length is then appended to ``index.jsonl``. Nothing is ever rewritten, so
+    several captures accumulate and an interrupted capture loses at most the
+    response being written. Streamed bodies are compressed while the consumer
+    reads them, so capturing never holds one in memory as a whole.
+
+    Replays map the data file into memory and hand out responses whose body
+    is decompressed as it is read, so a replayed document is never held in
+    memory as a whole. Each URL replays its latest capture, or its latest
+    capture at or before ``as_of``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        replay: bool = False,
+        as_of: float | None = None,
+    ) -> None:
+        """Open (or create) the archive.
+
+        Args:
+            path: Directory holding the data and index files.
+            replay: Open the archive for reading instead of capturing.
+            as_of: Unix timestamp of the newest capture replayed; None replays
+                the latest capture of every URL.
+        """
+        self.path = Path(path)
+        self.replay = replay
+        self.as_of = as_of
+        self._lock = threading.Lock()
+        self._entries: dict[str, ArchiveEntry] = {}
+        self._data: mmap.mmap | None = None
+        if replay:
+            self._load()
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._data_file = (self.path / DATA_FILE).open("ab")
+            self._index_file = (self.path / INDEX_FILE).open("a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        """Return the number of URLs the archive replays."""
+        return len(self._entries)
+
+    def get(self, request: requests.PreparedRequest) -> requests.Response | None:
+        """Return the archived response to ``request``, or None if none was captured."""
+        entry = self._entries.get(request.url or "")
+        if entry is None or self._data is None:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        body = memoryview(self._data)[entry.offset : entry.offset + entry.length]
+        response.raw = io.BufferedReader(
+            _InflatingReader(body),
+            buffer_size=ARCHIVE_READ_SIZE,
+        )
+        response.from_archive = True  # type: ignore[attr-defined]
+        return response
+
+    def append(self, response: requests.Response, *, streamed: bool = False) -> None:
+        """Capture the body of a successful response.
+
+        A ``streamed`` body is captured as the consumer reads it and archived
+        once read to the end; one abandoned part way is not archived.
+        """
+        headers = {
+            name: response.headers[name]
+            for name in ARCHIVED_HEADERS
+            if name in response.headers
+        }
+        if streamed and response.raw is not None:
+            write = functools.partial(self._write, response.url, headers=headers)
+            capture = _StreamCapture(write)
+            response.raw = _TeeStream(response.raw, capture)
+            return
+        body = zlib.compress(response.content, ARCHIVE_COMPRESSION_LEVEL)
+        self._write(response.url, io.BytesIO(body), headers=headers)
+
+    def _write(self, url: str, body: t.IO[bytes], *, headers: dict[str, str]) -> None:
+        """Append a compressed body to the data file, then index it."""
+        with self._lock:
+            offset = self._data_file.tell()
+            shutil.copyfileobj(body, self._data_file, ARCHIVE_READ_SIZE)
+            self._data_file.flush()
+            line = {
+                "url": url,
+                "fetched_at": time.time(),
+                "offset": offset,
+                "length": self._data_file.tell() - offset,
+                "headers": headers,
+            }
+            self._index_file.write(json.dumps(line) + "\n")
+            self._index_file.flush()
+
+    def close(self) -> None:
+        """Close the archive files."""
+        if self.replay:
+            return
+        with self._lock:
+            self._data_file.close()
+            self._index_file.close()
+
+    def _load(self) -> None:
+        """Index the latest replayable capture of every URL and map the data file."""
+        index_path = self.path / INDEX_FILE
+        data_path = self.path / DATA_FILE
+        if not index_path.exists() or not data_path.stat().st_size:
+            msg = f"No captured responses in archive {self.path}."
+            raise FileNotFoundError(msg)
+        data_size = data_path.stat().st_size
+        with index_path.open(encoding="utf-8") as index:
+            for line in index:
+                try:
+                    entry = ArchiveEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue  # A line cut short by an interrupted capture.
+                if entry.offset + entry.length > data_size:
+                    continue
+                if self.as_of is not None and entry.fetched_at > self.as_of:
+                    continue
+                previous = self._entries.get(entry.url)
+                if previous is None or entry.fetched_at >= previous.fetched_at:
+                    self._entries[entry.url] = entry
+        with data_path.open("rb") as data:
+            self._data = mmap.mmap(data.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _StreamCapture:
+    """Compressed copy of a streamed body, spilled to disk once it grows large."""
+
+    def __init__(self, write: t.Callable[[t.IO[bytes]], None]) -> None:
+        self._write = write
+        self._compressor = zlib.compressobj(ARCHIVE_COMPRESSION_LEVEL)
+        self._compressed = tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_SIZE)  # noqa: SIM115
+
+    def feed(self, chunk: bytes) -> None:
+        self._compressed.write(self._compressor.compress(chunk))
+
+    def finish(self) -> None:
+        self._compressed.write(self._compressor.flush())
+        self._compressed.seek(0)
+        try:
+            self._write(self._compressed)
+        finally:
+            self._compressed.close()
+
+
+class _TeeStream:
+    """urllib3 response stand-in handing each decoded chunk to a capture."""
+
+    def __init__(self, raw: BaseHTTPResponse, capture: _StreamCapture) -> None:
+        self._raw = raw
+        self._capture = capture
+
+    def stream(
+        self,
+        amt: int = 2**16,
+        decode_content: bool | None = None,  # noqa: FBT001
+    ) -> Iterator[bytes]:
+        for chunk in self._raw.stream(amt, decode_content=decode_content):
+            self._capture.feed(chunk)
+            yield chunk
+        self._capture.finish()
+
+    def __getattr__(self, name: str) -> t.Any:  # noqa: ANN401
+        return getattr(self._raw, name)
+
+
+class _InflatingReader(io.RawIOBase):
+    """Raw stream decompressing one archived body as it is read."""
+
+    def __init__(self, compressed: memoryview) -> None:
+        self._compressed = compressed
+        self._position = 0
+        self._decompressor = zlib.decompressobj()
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:  # noqa: ANN401
+        while not self._pending:
+            if self._position >= len(self._compressed):
+                if self._decompressor.eof:
+                    return 0
+                self._pending = memoryview(self._decompressor.flush())
+                if not self._pending:
+                    return 0
+                break
+            end = self._position + ARCHIVE_READ_SIZE
+            chunk = self._compressed[self._position : end]
+            self._position += len(chunk)
+            self._pending = memoryview(self._decompressor.decompress(chunk))
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
@@ -0,0 +1,248 @@
+"""Compact, crash-resumable sync progress kept in a stream's state."""
+
+from __future__ import annotations
+
+import base64
+import time
+import typing as t
+import zlib
+from datetime import UTC, date, datetime, timedelta
+
+from tap_NHL.scheduling import season_of
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def encode_ids(player_ids: Iterable[int]) -> str:
+    """Pack player IDs into a short ASCII string, preserving their order.
+
+    IDs are stored as zigzag-encoded varint deltas and zlib-compressed, so a
+    sorted list of NHL IDs costs well under a byte per player.
+    """
+    buffer = bytearray()
+    previous = 0
+    for player_id in player_ids:
+        delta = player_id - previous
+        previous = player_id
+        value = delta << 1 if delta >= 0 else ((-delta) << 1) - 1
+        while value >= 0x80:  # noqa: PLR2004
+            buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        buffer.append(value)
+    return base64.b64encode(zlib.compress(bytes(buffer), 9)).decode("ascii")
+
+
+def decode_ids(encoded: str) -> list[int]:
+    """Unpack a string produced by :func:`encode_ids`."""
+    player_ids: list[int] = []
+    previous = value = shift = 0
+    for byte in zlib.decompress(base64.b64decode(encoded)):
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        delta = value >> 1 if not value & 1 else -((value + 1) >> 1)
+        previous += delta
+        player_ids.append(previous)
+        value = shift = 0
+    return player_ids
+
+
+def _load_buckets(
+    buckets: dict[str, str] | None,
+    parse: t.Callable[[str], t.Any],
+) -> dict[int, t.Any]:
+    """Map each player ID in encoded ``buckets`` to its parsed bucket key."""
+    return {
+        player_id: parse(key)
+        for key, encoded in (buckets or {}).items()
+        for player_id in decode_ids(encoded)
+    }
+
+
+def _dump_buckets(
+    keys: dict[int, t.Any],
+    format_key: t.Callable[[t.Any], str],
+) -> dict[str, str]:
+    """Group player IDs by their bucket key and encode each group."""
+    buckets: dict[t.Any, list[int]] = {}
+    for player_id, key in keys.items():
+        buckets.setdefault(key, []).append(player_id)
+    return {
+        format_key(key): encode_ids(sorted(player_ids))
+        for key, player_ids in sorted(buckets.items())
+    }
+
+
+class CompactCheckpoint:
+    """Sync progress and player activity for one stream in bounded state.
+
+    The state holds, under the stream's ``checkpoint`` key:
+
+    - ``run``: the player IDs planned for the current run and how many of them
+      are finished, so a restarted run resumes at the next unfinished player
+      without repeating discovery. It is removed once the run completes.
+    - ``inactive``: IDs of players last seen inactive, bucketed by the day
+      they were synced. Buckets older than the re-check window are dropped.
+    - ``active``: IDs of players last seen active, used to sync them first.
+    - ``synced``: IDs of every synced player, bucketed by the day they were
+      last synced, so scheduling can tell them from players never synced.
+    - ``seasons``: IDs of players bucketed by the season of their last game,
+      used to sync players of recent seasons early.
+
+    Changes are kept in memory and written to the state dict by :meth:`save`,
+    which callers invoke whenever :meth:`due` reports the flush interval has
+    passed.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        state: dict,
+        *,
+        flush_interval: float,
+        recheck_days: int,
+    ) -> None:
+        """Load the checkpoint stored in ``state``.
+
+        Args:
+            state: The stream's ``checkpoint`` state dict, updated in place.
+            flush_interval: Minimum number of seconds between saves.
+            recheck_days: Days an inactive player is skipped after being synced.
+        """
+        self.state = state
+        self.flush_interval = flush_interval
+        self.recheck_days = recheck_days
+        self._saved_at = time.monotonic()
+        if state.get("version") not in (None, self.VERSION):
+            state.clear()
+        run = state.get("run") or {}
+        self._scope: str | None = run.get("scope")
+        self._run_ids = decode_ids(run["player_ids"]) if run else []
+        self._completed: int = run.get("completed", 0)
+        active = state.get("active")
+        self._active = set(decode_ids(active)) if active else set()
+        self._inactive_on = _load_buckets(state.get("inactive"), date.fromisoformat)
+        self._synced_on = _load_buckets(state.get("synced"), date.fromisoformat)
+        self._last_season = _load_buckets(state.get("seasons"), int)
+        for player_id, synced_on in self._inactive_on.items():
+            self._synced_on.setdefault(player_id, synced_on)
+
+    def resume(self, scope: str) -> list[int] | None:
+        """Return the unfinished player IDs of an interrupted run, if any.
+
+        Args:
+            scope: Identifies the run's player selection (e.g. the shard); a
+                checkpoint from another scope is discarded.
+        """
+        if not self._run_ids or self._scope != scope:
+            return None
+        return self._run_ids[self._completed :]
+
+    @property
+    def completed(self) -> int:
+        """Return how many players of the current run are finished."""
+        return self._completed
+
+    @property
+    def planned(self) -> int:
+        """Return how many players the current run covers."""
+        return len(self._run_ids)
+
+    def start(self, player_ids: list[int], scope: str) -> None:
+        """Begin a new run over ``player_ids``, replacing any unfinished one."""
+        self._scope = scope
+        self._run_ids = list(player_ids)
+        self._completed = 0
+
+    def complete(self, player_id: int) -> None:
+        """Mark ``player_id`` and every player planned before it as finished."""
+        try:
+            self._completed = self._run_ids.index(player_id, self._completed) + 1
+        except ValueError:
+            return
+        if self._completed >= len(self._run_ids):
+            self._run_ids = []
+            self._completed = 0
+            self.save()
+
+    def mark(
+        self,
+        player_id: int,
+        *,
+        is_active: bool | None,
+        synced_on: date,
+        last_game_date: str | None = None,
+    ) -> None:
+        """Record a player's activity when synced on ``synced_on`` and its last game."""
+        self._synced_on[player_id] = synced_on
+        if last_game_date:
+            last_game = date.fromisoformat(last_game_date[:10])
+            self._last_season[player_id] = season_of(last_game)
+        if is_active is False:
+            self._inactive_on[player_id] = synced_on
+        else:
+            self._inactive_on.pop(player_id, None)
+        if is_active:
+            self._active.add(player_id)
+        else:
+            self._active.discard(player_id)
+
+    def activity(self) -> dict[int, dict[str, t.Any]]:
+        """Return what the checkpoint knows about each player as partition state.
+
+        Active players saved before sync days were kept count as synced
+        longest ago.
+        """
+        activity: dict[int, dict[str, t.Any]] = {}
+        for player_id in self._synced_on.keys() | self._active:
+            activity[player_id] = {
+                "is_active": player_id in self._active,
+                "last_synced_at": self._synced_on.get(player_id, date.min).isoformat(),
+                "last_season": self._last_season.get(player_id),
+            }
+        return activity
+
+    def is_recently_inactive(self, player_id: int, today: date) -> bool:
+        """Return whether a player was synced inactive within the re-check window."""
+        synced_on = self._inactive_on.get(player_id)
+        if synced_on is None:
+            return False
+        return today - synced_on < timedelta(days=self.recheck_days)
+
+    def due(self) -> bool:
+        """Return whether the flush interval has passed since the last save."""
+        return time.monotonic() - self._saved_at >= self.flush_interval
+
+    def save(self, today: date | None = None) -> None:
+        """Write the checkpoint into the state dict."""
+        today = today or datetime.now(UTC).date()
+        buckets: dict[date, list[int]] = {}
+        for player_id, synced_on in self._inactive_on.items():
+            if today - synced_on < timedelta(days=self.recheck_days):
+                buckets.setdefault(synced_on, []).append(player_id)
+        self._inactive_on = {
+            player_id: synced_on
+            for synced_on, player_ids in buckets.items()
+            for player_id in player_ids
+        }
+
+        self.state.clear()
+        self.state["version"] = self.VERSION
+        if self._run_ids:
+            self.state["run"] = {
+                "scope": self._scope,
+                "player_ids": encode_ids(self._run_ids),
+                "completed": self._completed,
+            }
+        if self._active:
+            self.state["active"] = encode_ids(sorted(self._active))
+        self.state["inactive"] = {
+            synced_on.isoformat(): encode_ids(sorted(player_ids))
+            for synced_on, player_ids in sorted(buckets.items())
+        }
+        self.state["synced"] = _dump_buckets(self._synced_on, date.isoformat)
+        self.state["seasons"] = _dump_buckets(self._last_season, str)
+        self._saved_at = time.monotonic()
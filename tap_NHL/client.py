@@ -3,22 +3,55 @@
 from __future__ import annotations
 
 import decimal
+import json
 import typing as t
+from functools import cached_property
 from importlib import resources
 
 from singer_sdk.authenticators import APIAuthenticatorBase
+from singer_sdk.batch import Batcher
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._typing import (
+    TypeConformanceLevel,
+    _warn_unmapped_properties,
+    conform_record_data_types,
+)
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.pagination import JSONPathPaginator  # noqa: TC002
 from singer_sdk.streams import RESTStream
-from singer_sdk.streams.rest import _HTTPStream
 
+from tap_NHL.conformance import compile_record_conformer
 from tap_NHL.constants import DEFAULT_API_URL
+from tap_NHL.decoding import compile_decimal_converter, fast_json_available, loads
 
 if t.TYPE_CHECKING:
+    from importlib.resources.abc import Traversable
+
     import requests
-    from singer_sdk.helpers.types import Context
+    from backoff.types import Details
+    from singer_sdk import Tap
+    from singer_sdk._singerlib import RecordMessage
+    from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchConfig
+    from singer_sdk.helpers.types import Context, Record
+    from singer_sdk.streams.rest import _HTTPStream
+
+    from tap_NHL.conformance import RecordConformer
+    from tap_NHL.tap import TapNHL
 
 SCHEMAS_DIR = resources.files(__package__) / "schemas"
+_SCHEMAS: dict[str, dict] = {}
+
+
+def load_schema(filepath: Traversable) -> dict:
+    """Return the parsed schema file, parsing each file once per process.
+
+    The returned dict is shared by every stream built from the file and must
+    be treated as read-only.
+    """
+    key = str(filepath)
+    if key not in _SCHEMAS:
+        _SCHEMAS[key] = json.loads(filepath.read_text())
+    return _SCHEMAS[key]
 
 
 class NHLPaginator(JSONPathPaginator):
@@ -71,6 +104,40 @@ class NHLStream(RESTStream):
     # Update this value if necessary or override `get_new_paginator`.
     next_page_token_jsonpath = "$.pagination.nextCursor"  # noqa: S105
 
+    # Top-level properties whose subtrees skip conformance in "trusted" mode.
+    trusted_properties: t.ClassVar[tuple[str, ...]] = ()
+
+    def __init__(self, tap: Tap, *args: t.Any, **kwargs: t.Any) -> None:
+        """Initialize the stream without touching the network or the disk caches.
+
+        The schema comes from the process-wide :func:`load_schema` cache, and
+        the HTTP session, response cache and record conformer are only built
+        when a sync first needs them, so discovery and catalog validation stay
+        cheap.
+
+        Args:
+            tap: Singer Tap this stream belongs to.
+            *args: Positional arguments for :class:`singer_sdk.RESTStream`.
+            **kwargs: Keyword arguments for :class:`singer_sdk.RESTStream`.
+        """
+        if "schema" not in kwargs and self.schema_filepath is not None:
+            kwargs["schema"] = load_schema(self.schema_filepath)
+            # Keep the SDK from parsing the file a second time.
+            self.schema_filepath = None  # type: ignore[misc]
+        super().__init__(tap, *args, **kwargs)
+        if self.config.get("conformance_mode", "sdk") != "sdk":
+            self.TYPE_CONFORMANCE_LEVEL = TypeConformanceLevel.NONE
+
+    @cached_property
+    def requests_session(self) -> requests.Session:  # type: ignore[override]
+        """Return the stream's session on the tap's shared HTTP transport."""
+        return self.tap.http_transport.session()
+
+    @property
+    def tap(self) -> TapNHL:
+        """Return the tap this stream belongs to, with its shared resources."""
+        return t.cast("TapNHL", self._tap)
+
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
@@ -88,6 +155,28 @@ class NHLStream(RESTStream):
         headers = {"Content-type": "application/json", }
         return headers
 
+    def calculate_sync_cost(
+        self,
+        request: requests.PreparedRequest,  # noqa: ARG002
+        response: requests.Response,
+        context: Context | None,  # noqa: ARG002
+    ) -> dict[str, t.Any]:
+        """Report the time each request spent waiting on the shared rate limiter.
+
+        Args:
+            request: The API request that was just sent.
+            response: The :class:`requests.Response` object.
+            context: The stream context.
+
+        Returns:
+            Throttle wait seconds and whether the request had to wait.
+        """
+        wait = getattr(response, "throttle_wait_seconds", 0.0)
+        return {
+            "throttle_wait_seconds": wait,
+            "throttled_requests": int(wait > 0),
+        }
+
     def get_new_paginator(self) -> NHLPaginator:
         """Create a new pagination helper instance.
 
@@ -128,13 +217,154 @@ class NHLStream(RESTStream):
     def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
         """Parse the response and return an iterator of result records.
 
+        With ``fast_json_decode`` enabled the body is decoded by orjson, the
+        JSONPath lookup is skipped when ``records_jsonpath`` selects the root,
+        and only floats at numeric properties the stream schema declares are
+        converted to Decimal. Every number is emitted in its shortest float
+        form, so ``0.50`` becomes ``0.5`` and long mantissas are rounded.
+
         Args:
             response: The HTTP ``requests.Response`` object.
 
         Yields:
             Each record from the source.
         """
-        yield from extract_jsonpath(
-            self.records_jsonpath,
-            input=response.json(parse_float=decimal.Decimal),
+        if not self._fast_json_decode:
+            with self.tap.metrics.timer("decode"):
+                document = response.json(parse_float=decimal.Decimal)
+            yield from extract_jsonpath(self.records_jsonpath, input=document)
+            return
+
+        with self.tap.metrics.timer("decode"):
+            document = loads(response.content)
+        if self.records_jsonpath == "$":
+            records: t.Iterable[t.Any] = [document]
+        else:
+            records = extract_jsonpath(self.records_jsonpath, input=document)
+        for record in records:
+            yield self._decimal_converter(record)
+
+    def _generate_record_messages(
+        self,
+        record: Record,
+    ) -> t.Generator[RecordMessage, None, None]:
+        """Conform the record with the compiled conformer, if enabled, then emit it."""
+        if self._record_conformer is not None:
+            record = self._conform_record(record)
+        yield from super()._generate_record_messages(record)
+        self._count_record()
+
+    def _count_record(self) -> None:
+        """Count an emitted record and log sync progress when it is due."""
+        metrics = self.tap.metrics
+        metrics.count_records(self.name)
+        if metrics.progress_due():
+            self.logger.info("Sync progress: %s", json.dumps(metrics.progress()))
+
+    def log_sync_costs(self) -> None:
+        """Log the sync costs; the tap finishes the sync after its last stream."""
+        super().log_sync_costs()
+        self.tap.finish_stream(self)
+
+    def backoff_handler(self, details: Details) -> None:
+        """Record the retry and its backoff in the sync metrics, then log it."""
+        request = details.get("args", (None,))[0]
+        url = getattr(request, "url", None)
+        if url:
+            self.tap.metrics.observe_retry(url)
+            self.tap.metrics.observe_retry_sleep(url, details.get("wait") or 0.0)
+        super().backoff_handler(details)
+
+    def get_batches(
+        self,
+        batch_config: BatchConfig,
+        context: Context | None = None,
+    ) -> t.Iterable[tuple[BaseBatchFileEncoding, list[str]]]:
+        """Write records to batch files and yield a manifest for each file.
+
+        Unlike the SDK default, records go through the same property selection
+        and conformance as RECORD messages before they are written. Parquet
+        files store numbers as floats because Arrow cannot infer a single
+        column type from a mix of integers and Decimals.
+
+        Args:
+            batch_config: Batch config for this stream.
+            context: Stream partition or context dictionary.
+
+        Yields:
+            A tuple of (encoding, manifest) for each batch.
+        """
+        with batch_config.storage.fs(create=True):
+            pass
+        to_floats = batch_config.encoding.format == "parquet"
+        records = (
+            self._prepare_batch_record(record, to_floats=to_floats)
+            for record in self._sync_records(context, write_messages=False)
+        )
+        batcher = Batcher(
+            tap_name=self.tap_name,
+            stream_name=self.name,
+            batch_config=batch_config,
         )
+        for manifest in batcher.get_batches(records=records):
+            yield batch_config.encoding, manifest
+
+    def _prepare_batch_record(self, record: Record, *, to_floats: bool) -> Record:
+        pop_deselected_record_properties(record, self.schema, self.mask)
+        record = self._conform_record(record)
+        self._count_record()
+        return _decimals_to_floats(record) if to_floats else record
+
+    def _conform_record(self, record: Record) -> Record:
+        """Conform a record to the stream schema using the configured mode."""
+        if self._record_conformer is None:
+            with self.tap.metrics.timer("conform"):
+                return conform_record_data_types(
+                    stream_name=self.name,
+                    record=record,
+                    schema=self.schema,
+                    level=self.TYPE_CONFORMANCE_LEVEL,
+                    logger=self.logger,
+                )
+        with self.tap.metrics.timer("conform"):
+            record, unmapped = self._record_conformer(record)
+        if unmapped:
+            _warn_unmapped_properties(self.name, tuple(unmapped), self.logger)
+        return record
+
+    @cached_property
+    def _record_conformer(self) -> RecordConformer | None:
+        """Return the conformer compiled from the schema, or None for the SDK path."""
+        mode = self.config.get("conformance_mode", "sdk")
+        if mode == "sdk":
+            return None
+        trusted = self.trusted_properties if mode == "trusted" else ()
+        return compile_record_conformer(self.schema, trusted_properties=trusted)
+
+    @cached_property
+    def _fast_json_decode(self) -> bool:
+        """Return whether responses are decoded with the fast JSON path."""
+        if not self.config.get("fast_json_decode", False):
+            return False
+        if not fast_json_available():
+            self.logger.warning(
+                "fast_json_decode is enabled but orjson is not installed; "
+                "falling back to the standard decoder.",
+            )
+            return False
+        return True
+
+    @cached_property
+    def _decimal_converter(self) -> t.Callable[[t.Any], t.Any]:
+        """Return the converter restoring Decimal values the schema declares."""
+        return compile_decimal_converter(self.schema)
+
+
+def _decimals_to_floats(value: t.Any) -> t.Any:  # noqa: ANN401
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _decimals_to_floats(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decimals_to_floats(item) for item in value]
+    return value
@@ -0,0 +1,130 @@
+"""Record conformance compiled once from a stream schema."""
+
+from __future__ import annotations
+
+import decimal
+import typing as t
+
+from singer_sdk.helpers._typing import (
+    _conform_primitive_property,
+    _is_exclusive_boolean_type,
+    is_object_type,
+    is_uniform_list,
+)
+
+# Values decoded from JSON that the SDK's primitive conformance returns unchanged.
+JSON_TYPES = frozenset({str, int, float, decimal.Decimal, type(None), dict, list})
+
+# (value, path of the value, unmapped property paths) -> conformed value
+PropertyConformer = t.Callable[[t.Any, str, list[str]], t.Any]
+RecordConformer = t.Callable[[dict], tuple[dict, list[str]]]
+
+
+def compile_record_conformer(
+    schema: dict,
+    *,
+    trusted_properties: t.Iterable[str] = (),
+) -> RecordConformer:
+    """Compile a conformer equivalent to the SDK's recursive record conformance.
+
+    The SDK re-inspects the schema of every property of every record to decide
+    how to conform it. This walks the schema once and builds a plan per object,
+    so conforming a record only costs one dict lookup per property. Output and
+    unmapped-property reporting match
+    :func:`singer_sdk.helpers._typing.conform_record_data_types` at the
+    ``RECURSIVE`` level.
+
+    Args:
+        schema: JSON schema of the records to conform.
+        trusted_properties: Top-level properties whose subtrees are known to be
+            stable and are passed through without being walked.
+
+    Returns:
+        A function returning the conformed record and its unmapped property paths.
+    """
+    conform_object = _compile_object(schema, frozenset(trusted_properties))
+
+    def conform_record(record: dict) -> tuple[dict, list[str]]:
+        unmapped: list[str] = []
+        return conform_object(record, "", unmapped), unmapped
+
+    return conform_record
+
+
+def _compile_object(
+    schema: dict,
+    trusted: frozenset[str] = frozenset(),
+) -> PropertyConformer:
+    properties: dict[str, dict] = schema["properties"]
+    keep_unmapped = bool(schema.get("additionalProperties"))
+    plan: dict[str, PropertyConformer | None] = {
+        name: None if name in trusted else _compile_property(subschema)
+        for name, subschema in properties.items()
+    }
+
+    def conform_object(value: dict, path: str, unmapped: list[str]) -> dict:
+        output = {}
+        for name, elem in value.items():
+            try:
+                conformer = plan[name]
+            except KeyError:
+                if keep_unmapped:
+                    output[name] = elem
+                unmapped.append(f"{path}.{name}" if path else name)
+                continue
+            if conformer is not None:
+                child_path = f"{path}.{name}" if path else name
+                output[name] = conformer(elem, child_path, unmapped)
+            elif type(elem) in JSON_TYPES:
+                output[name] = elem
+            else:
+                output[name] = _conform_primitive_property(elem, properties[name])
+        return output
+
+    return conform_object
+
+
+def _compile_property(schema: dict) -> PropertyConformer | None:
+    """Return how to conform one property, or ``None`` to keep JSON values as-is."""
+    conform_list = _compile_list(schema["items"]) if is_uniform_list(schema) else None
+    conform_object = (
+        _compile_object(schema)
+        if is_object_type(schema) and "properties" in schema
+        else None
+    )
+    if conform_list is None and conform_object is None:
+        if _is_exclusive_boolean_type(schema):
+            return lambda elem, path, unmapped: _conform_primitive_property(  # noqa: ARG005
+                elem,
+                schema,
+            )
+        return None
+
+    def conform_property(elem: t.Any, path: str, unmapped: list[str]) -> t.Any:  # noqa: ANN401
+        if conform_list is not None and isinstance(elem, list):
+            return conform_list(elem, path, unmapped)
+        if conform_object is not None and isinstance(elem, dict):
+            return conform_object(elem, path, unmapped)
+        return _conform_primitive_property(elem, schema)
+
+    return conform_property
+
+
+def _compile_list(item_schema: dict) -> PropertyConformer:
+    conform_item = (
+        _compile_object(item_schema)
+        if is_object_type(item_schema) and "properties" in item_schema
+        else None
+    )
+
+    def conform_list(elem: list, path: str, unmapped: list[str]) -> list:
+        if conform_item is None:
+            return [_conform_primitive_property(item, item_schema) for item in elem]
+        return [
+            conform_item(item, path, unmapped)
+            if isinstance(item, dict)
+            else _conform_primitive_property(item, item_schema)
+            for item in elem
+        ]
+
+    return conform_list
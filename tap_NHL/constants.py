@@ -2,11 +2,37 @@
 
 DEFAULT_API_URL = "https://api-web.nhle.com"
 STATS_API_BASE_URL = "https://api.nhle.com/stats/rest/en"
-SKATER_DISCOVERY_ENDPOINT = f"{STATS_API_BASE_URL}/skater/summary"
-GOALIE_DISCOVERY_ENDPOINT = f"{STATS_API_BASE_URL}/goalie/summary"
+SKATER_DISCOVERY_PATH = "/skater/summary"
+GOALIE_DISCOVERY_PATH = "/goalie/summary"
+TEAM_STANDINGS_PATH = "/v1/standings/now"  # Lists every current team's abbreviation.
+TEAM_ROSTER_PATH = "/v1/roster/{team}/current"
 PLAYER_DISCOVERY_PAGE_SIZE = 250
 PLAYER_DISCOVERY_TIMEOUT = 60  # seconds
 PLAYER_DISCOVERY_MAX_RETRIES = 5
+PLAYER_DISCOVERY_MAX_WORKERS = 4  # Concurrent discovery page requests.
+PLAYER_DISCOVERY_CACHE_TTL = 6 * 60 * 60  # seconds; only applies to unfinished seasons
+PLAYER_DISCOVERY_RANGE_SEASONS = 20  # Most finished seasons covered by one range query.
+SEASON_ROLLOVER_MONTH = 9  # Seasons are finished from September 1st of their end year.
+INACTIVE_PLAYER_RECHECK_DAYS = 30  # Days before inactive players are fetched again.
+PRIORITY_RECENT_SEASONS = 2  # Latest seasons whose players are scheduled as recent.
+CHECKPOINT_FLUSH_INTERVAL = 60  # seconds between compact checkpoint STATE messages.
+RESPONSE_CACHE_MAX_BYTES = 512 * 1024 * 1024
+RESPONSE_CACHE_MAX_AGE = 60 * 60  # seconds; for responses without ETag/Last-Modified
+RATE_LIMIT_SECONDS = 0.35  # Spacing between API calls when no rate is configured.
+RATE_LIMIT_MIN_RPS = 0.5  # Floor the adaptive limiter backs off to after 429/5xx.
+RATE_LIMIT_MAX_RPS = 8.0  # Ceiling the adaptive limiter probes up to when healthy.
+HTTP_MAX_CONNECTIONS_PER_HOST = 10  # Connections kept open to each API host.
+HTTP_MAX_HOSTS = 10  # Hosts whose connection pools are kept at once.
+GAME_SCHEDULE_LOOKBACK_DAYS = 7  # Days synced without a bookmark or games_start_date.
+GAME_SCHEDULE_WEEK_DAYS = 7  # Days covered by one schedule response.
+FINISHED_GAME_STATES = ("OFF", "FINAL")  # Games whose boxscore and plays are synced.
+STREAMING_JSON_CHUNK_SIZE = 64 * 1024  # bytes read at a time from streamed responses.
+ARCHIVE_COMPRESSION_LEVEL = 6  # zlib level of captured response bodies.
+ARCHIVE_READ_SIZE = 64 * 1024  # compressed bytes inflated at a time during replays.
+ARCHIVE_SPOOL_SIZE = 1024 * 1024  # compressed bytes of a streamed capture in memory.
+DEAD_LETTER_MAX_ATTEMPTS = 3  # Tries of a failing player before it is dead-lettered.
+DEAD_LETTER_BACKOFF_SECONDS = 2.0  # Wait before the second try; doubles after each.
+DEAD_LETTER_SNIPPET_CHARS = 500  # Characters of the failing response body kept.
 
 # Configure season discovery:
 # - If PLAYER_DISCOVERY_SEASONS is not empty, those season IDs are used.
@@ -0,0 +1,128 @@
+"""Persistent record of players whose landing fetch kept failing."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import typing as t
+from datetime import UTC, datetime
+from pathlib import Path
+
+from tap_NHL.constants import DEAD_LETTER_SNIPPET_CHARS
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+    import requests
+
+
+class DeadLetterQueue:
+    """JSON file of failed player IDs per stream, with the error that stopped them.
+
+    Each entry keeps the error, a snippet of the last response body, the
+    number of attempts and when the player last failed. The file is rewritten
+    through a temporary file on every change, so an interrupted sync never
+    leaves it half written. Players are removed once they sync successfully.
+
+    Shards may share the file: every change holds an inter-process lock, is
+    applied to the file as it is on disk and saved before the lock is released,
+    so no shard overwrites another's entries. The lock is advisory and only
+    available on POSIX systems.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Load (or start) the dead-letter file.
+
+        Args:
+            path: JSON file holding the dead-lettered players.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def __len__(self) -> int:
+        """Return the number of dead-lettered players across all streams."""
+        return sum(len(players) for players in self._entries.values())
+
+    def player_ids(self, stream: str) -> list[int]:
+        """Return the dead-lettered player IDs of ``stream``, in ID order."""
+        return sorted(int(player_id) for player_id in self._entries.get(stream, {}))
+
+    def get(self, stream: str, player_id: int) -> dict[str, t.Any] | None:
+        """Return the dead-letter entry of a player, if any."""
+        return self._entries.get(stream, {}).get(str(player_id))
+
+    def add(
+        self,
+        stream: str,
+        player_id: int,
+        *,
+        error: BaseException,
+        response: requests.Response | None,
+        attempts: int,
+    ) -> None:
+        """Record that a player failed ``attempts`` times in a row."""
+        with self._updating() as entries:
+            previous = entries.get(stream, {}).get(str(player_id)) or {}
+            entries.setdefault(stream, {})[str(player_id)] = {
+                "error": f"{type(error).__name__}: {error}",
+                "status_code": response.status_code if response is not None else None,
+                "response_snippet": _snippet(response),
+                "attempts": previous.get("attempts", 0) + attempts,
+                "failed_at": datetime.now(UTC).isoformat(),
+            }
+
+    def discard(self, stream: str, player_id: int) -> bool:
+        """Remove a player that synced successfully; return whether it was listed."""
+        if str(player_id) not in self._entries.get(stream, {}):
+            return False
+        with self._updating() as entries:
+            players = entries.get(stream, {})
+            listed = players.pop(str(player_id), None) is not None
+            if not players:
+                entries.pop(stream, None)
+        return listed
+
+    @contextlib.contextmanager
+    def _updating(self) -> Iterator[dict[str, dict[str, dict[str, t.Any]]]]:
+        """Lock the file, yield its entries as on disk, then save the changes."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(f"{self.path.suffix}.lock")
+        with self._lock, lock_path.open("a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                self._entries = self._load()
+                yield self._entries
+                self._save()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> dict[str, dict[str, dict[str, t.Any]]]:
+        if not self.path.exists():
+            return {}
+        return json.loads(self.path.read_text(encoding="utf-8"))
+
+    def _save(self) -> None:
+        temporary = self.path.with_name(f"{self.path.name}.tmp")
+        document = json.dumps(self._entries, indent=2, sort_keys=True)
+        temporary.write_text(document, encoding="utf-8")
+        temporary.replace(self.path)
+
+
+def _snippet(response: requests.Response | None) -> str | None:
+    """Return the start of a response body, or None without a readable body."""
+    if response is None:
+        return None
+    try:
+        return response.text[:DEAD_LETTER_SNIPPET_CHARS]
+    except (RuntimeError, ValueError):
+        return None  # Streamed bodies that were already consumed.
@@ -0,0 +1,140 @@
+"""Fast and incremental JSON decoding for API responses."""
+
+from __future__ import annotations
+
+import decimal
+import typing as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    ijson = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+Converter = t.Callable[[t.Any], t.Any]
+
+
+def fast_json_available() -> bool:
+    """Return whether the optional ``orjson`` decoder is installed."""
+    return orjson is not None
+
+
+def loads(content: bytes | str) -> t.Any:  # noqa: ANN401
+    """Decode a JSON document with ``orjson``.
+
+    Floats are returned as :class:`float`; use :func:`compile_decimal_converter`
+    to turn the ones a schema declares into :class:`decimal.Decimal`.
+    """
+    if orjson is None:
+        msg = "Fast JSON decoding requires orjson: pip install 'tap-nhl[fast-json]'."
+        raise RuntimeError(msg)
+    return orjson.loads(content)
+
+
+def streaming_json_available() -> bool:
+    """Return whether the optional ``ijson`` incremental parser is installed."""
+    return ijson is not None
+
+
+def iter_items(chunks: Iterable[bytes], prefix: str) -> Iterator[t.Any]:
+    """Yield the values found at ``prefix`` while a JSON document is still arriving.
+
+    Only the value being built is held in memory, so a large array is decoded
+    one item at a time. Non-integral numbers are returned as
+    :class:`decimal.Decimal`, like the standard decoding path.
+
+    Args:
+        chunks: Successive byte chunks of the document.
+        prefix: ijson path of the values, e.g. ``"plays.item"``.
+    """
+    if ijson is None:
+        msg = (
+            "Streaming JSON decoding requires ijson: "
+            "pip install 'tap-nhl[stream-json]'."
+        )
+        raise RuntimeError(msg)
+    items: list[t.Any] = ijson.sendable_list()
+    coroutine = ijson.items_coro(items, prefix)
+    for chunk in chunks:
+        coroutine.send(chunk)
+        yield from items
+        del items[:]
+    coroutine.close()
+    yield from items
+
+
+def compile_decimal_converter(schema: dict) -> Converter:
+    """Compile a function converting the floats a record schema declares to Decimal.
+
+    The standard path parses every float in a response as a Decimal. The
+    compiled converter walks only the numeric properties the schema declares
+    and rebuilds each float there from its shortest round-trip ``repr``, which
+    equals the source text for numbers written that way. Floats elsewhere,
+    inside free-form objects or undeclared properties the SDK keeps, stay
+    :class:`float`. Walking those would cost more than the faster decoder
+    saves.
+
+    Args:
+        schema: JSON schema of the records to convert.
+
+    Returns:
+        A function converting a decoded record in place and returning it.
+    """
+    return _compile(schema) or _identity
+
+
+def _identity(value: t.Any) -> t.Any:  # noqa: ANN401
+    return value
+
+
+def _to_decimal(value: t.Any) -> t.Any:  # noqa: ANN401
+    if type(value) is float:
+        return decimal.Decimal(repr(value))
+    return value
+
+
+def _compile(schema: dict) -> Converter | None:  # noqa: C901 - one schema walk
+    """Return a converter for ``schema``, or ``None`` if it can never hold floats."""
+    types = schema.get("type")
+    types = set(types) if isinstance(types, list) else {types}
+
+    properties = schema.get("properties")
+    leaves: set[str] = set()
+    nested: dict[str, Converter] = {}
+    for name, subschema in (properties or {}).items():
+        converter = _compile(subschema)
+        if converter is _to_decimal:
+            leaves.add(name)
+        elif converter is not None:
+            nested[name] = converter
+
+    items = schema.get("items")
+    item_converter = _compile(items) if isinstance(items, dict) else None
+
+    if not leaves and not nested and item_converter is None:
+        return _to_decimal if types & {"number", None} else None
+
+    def convert(value: t.Any) -> t.Any:  # noqa: ANN401
+        if isinstance(value, dict):
+            for name, converter in nested.items():
+                item = value.get(name)
+                if item is not None:
+                    value[name] = converter(item)
+            for name in leaves:
+                item = value.get(name)
+                if type(item) is float:
+                    value[name] = decimal.Decimal(repr(item))
+        elif isinstance(value, list) and item_converter is not None:
+            value[:] = [item_converter(item) for item in value]
+        elif type(value) is float:
+            return decimal.Decimal(repr(value))
+        return value
+
+    return convert
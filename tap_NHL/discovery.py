@@ -0,0 +1,538 @@
+"""Player discovery against the NHL stats API summary endpoints."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+import typing as t
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import UTC, datetime
+from pathlib import Path
+
+from tap_NHL.constants import (
+    PLAYER_DISCOVERY_CACHE_TTL,
+    PLAYER_DISCOVERY_MAX_WORKERS,
+    PLAYER_DISCOVERY_PAGE_SIZE,
+    PLAYER_DISCOVERY_TIMEOUT,
+    SEASON_ROLLOVER_MONTH,
+    TEAM_ROSTER_PATH,
+    TEAM_STANDINGS_PATH,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+if t.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+    import requests
+
+# First and last season ID (inclusive) covered by one summary query.
+SeasonSpan = tuple[int, int]
+Seasons = t.Union[int, SeasonSpan]
+
+
+class DiscoveryCache:
+    """On-disk index of discovered player IDs keyed by endpoint and season ID.
+
+    Rosters of a season that had already finished when it was scanned never
+    change, so those entries are kept permanently. Every other entry (the
+    current or an upcoming season) is only trusted for ``ttl_seconds``.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl_seconds: float = PLAYER_DISCOVERY_CACHE_TTL,
+    ) -> None:
+        """Create a cache backed by ``path``.
+
+        Args:
+            path: JSON file holding the index. Created on first save.
+            ttl_seconds: How long entries for unfinished seasons stay valid.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, dict]] = self._load()
+
+    def get(self, endpoint: str, seasons: Seasons) -> list[int] | None:
+        """Return the cached IDs for a season or span, or None if missing or stale."""
+        with self._lock:
+            entry = self._entries.get(endpoint, {}).get(season_key(seasons))
+        if entry is None:
+            return None
+        if not entry.get("complete"):
+            age = time.time() - entry.get("fetched_at", 0)
+            if age >= self.ttl_seconds:
+                return None
+        return entry["player_ids"]
+
+    def put(self, endpoint: str, seasons: Seasons, player_ids: t.Iterable[int]) -> None:
+        """Store the IDs discovered for a season or span."""
+        now = time.time()
+        entry = {
+            "player_ids": sorted(player_ids),
+            "fetched_at": now,
+            "complete": is_season_complete(season_span(seasons)[1], now),
+        }
+        with self._lock:
+            self._entries.setdefault(endpoint, {})[season_key(seasons)] = entry
+
+    def save(self) -> None:
+        """Atomically write the index to disk."""
+        with self._lock:
+            payload = {"version": self.VERSION, "seasons": self._entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+            tmp_path.replace(self.path)
+
+    @contextlib.contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold an inter-process lock on the index and reload it from disk.
+
+        Shards started together then scan each missing season only once: the
+        first one to take the lock scans and saves, the others wait and then
+        find its results in the reloaded index. The lock is advisory and only
+        available on POSIX systems; elsewhere the index is just reloaded.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(f"{self.path.suffix}.lock")
+        with lock_path.open("a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                entries = self._load()
+                with self._lock:
+                    self._entries = entries
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> dict[str, dict[str, dict]]:
+        try:
+            payload = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        if payload.get("version") != self.VERSION:
+            return {}
+        return payload.get("seasons") or {}
+
+
+def is_season_complete(season_id: int, timestamp: float) -> bool:
+    """Return True if the season had finished (playoffs included) at ``timestamp``.
+
+    A season such as 20232024 is treated as finished from September 1st of its
+    second year, after the playoffs and before the next season starts.
+    """
+    end_year = season_id % 10000
+    finished_at = datetime(end_year, SEASON_ROLLOVER_MONTH, 1, tzinfo=UTC)
+    return datetime.fromtimestamp(timestamp, UTC) >= finished_at
+
+
+def season_span(seasons: Seasons) -> SeasonSpan:
+    """Return ``seasons`` as a ``(first, last)`` span."""
+    return (seasons, seasons) if isinstance(seasons, int) else seasons
+
+
+def season_key(seasons: Seasons) -> str:
+    """Return the cache key of a season (``"20232024"``) or span (``"A-B"``)."""
+    first, last = season_span(seasons)
+    return str(first) if first == last else f"{first}-{last}"
+
+
+def season_expression(seasons: Seasons) -> str:
+    """Return the ``cayenneExp`` filter selecting a season or span."""
+    first, last = season_span(seasons)
+    if first == last:
+        return f"seasonId={first}"
+    return f"seasonId>={first} and seasonId<={last}"
+
+
+def next_season_id(season_id: int) -> int:
+    """Return the ID of the season after ``season_id`` (20232024 -> 20242025)."""
+    return season_id + 10001
+
+
+def seasons_in_span(seasons: Seasons) -> list[int]:
+    """Return every season ID from the first to the last season of a span."""
+    first, last = season_span(seasons)
+    season_ids = [first]
+    while season_ids[-1] < last:
+        season_ids.append(next_season_id(season_ids[-1]))
+    return season_ids
+
+
+def plan_season_spans(
+    season_ids: t.Iterable[int],
+    *,
+    max_seasons: int,
+    now: float | None = None,
+) -> list[SeasonSpan]:
+    """Group season IDs into spans that one range query each can cover.
+
+    Consecutive finished seasons are merged as long as they start in the same
+    block of ``max_seasons`` years. Fixed blocks keep the spans, and so their
+    cache keys, stable as new seasons are added. An unfinished season always
+    gets its own span so its short cache TTL never expires finished history.
+    With ``max_seasons`` of 1 every season is queried on its own.
+    """
+    now = time.time() if now is None else now
+    block_size = max(max_seasons, 1)
+
+    def block(season_id: int) -> int:
+        return season_id // 10000 // block_size
+
+    spans: list[SeasonSpan] = []
+    for season_id in sorted(set(season_ids)):
+        if spans:
+            first, last = spans[-1]
+            if (
+                season_id == next_season_id(last)
+                and block(season_id) == block(first)
+                and is_season_complete(season_id, now)
+            ):
+                spans[-1] = (first, season_id)
+                continue
+        spans.append((season_id, season_id))
+    return spans
+
+
+class PlayerDiscovery:
+    """Collect player IDs from the summary endpoints with a bounded worker pool.
+
+    The first page of every ``(endpoint, season)`` pair is requested up front.
+    Each first page reports the season's ``total`` row count, so the remaining
+    ``start`` offsets are planned immediately and fanned out to the same pool
+    instead of being walked one page at a time.
+
+    Only IDs are needed, so :meth:`discover` asks for one aggregated row per
+    player and, with ``range_seasons`` above 1, covers consecutive finished
+    seasons with a single range query (see :func:`plan_season_spans`). A span
+    that returns fewer distinct players than its reported ``total`` is
+    re-scanned season by season.
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only tuning settings
+        self,
+        session: requests.Session,
+        *,
+        max_workers: int = PLAYER_DISCOVERY_MAX_WORKERS,
+        page_size: int = PLAYER_DISCOVERY_PAGE_SIZE,
+        timeout: int = PLAYER_DISCOVERY_TIMEOUT,
+        cache: DiscoveryCache | None = None,
+        range_seasons: int = 1,
+    ) -> None:
+        """Create a new discovery engine.
+
+        Args:
+            session: Session carrying the discovery retry/backoff policy.
+            max_workers: Maximum number of concurrent discovery requests.
+            page_size: Rows requested per page.
+            timeout: Per-request timeout in seconds.
+            cache: Optional on-disk index consulted before scanning a season.
+            range_seasons: Most seasons :meth:`discover` covers with one query.
+        """
+        self.session = session
+        self.cache = cache
+        self.range_seasons = max(range_seasons, 1)
+        self.max_workers = max(max_workers, 1)
+        self.page_size = page_size
+        self.timeout = timeout
+
+    def discover(
+        self,
+        endpoints: t.Sequence[str],
+        season_ids: t.Sequence[int],
+    ) -> list[int]:
+        """Return the sorted player IDs found for every endpoint and season."""
+        with self.cache.exclusive() if self.cache else contextlib.nullcontext():
+            return self._discover(endpoints, season_ids)
+
+    def _discover(
+        self,
+        endpoints: t.Sequence[str],
+        season_ids: t.Sequence[int],
+    ) -> list[int]:
+        player_ids: set[int] = set()
+        missing: list[tuple[str, Seasons]] = []
+        for span in plan_season_spans(season_ids, max_seasons=self.range_seasons):
+            for endpoint in endpoints:
+                cached = self._cached(endpoint, span) if self.cache else None
+                if cached is None:
+                    missing.append((endpoint, span))
+                else:
+                    player_ids.update(cached)
+
+        scanned = self.scan(missing)
+        for season_player_ids in scanned.values():
+            player_ids.update(season_player_ids)
+        if self.cache and missing:
+            self._store(scanned)
+        return sorted(player_ids)
+
+    def _cached(self, endpoint: str, span: SeasonSpan) -> list[int] | None:
+        """Return a span's cached IDs, falling back to its per-season entries.
+
+        A truncated span is re-scanned and cached season by season.
+        """
+        cached = self.cache.get(endpoint, span)  # type: ignore[union-attr]
+        if cached is not None or span[0] == span[1]:
+            return cached
+        player_ids: list[int] = []
+        for season_id in seasons_in_span(span):
+            season_player_ids = self.cache.get(endpoint, season_id)  # type: ignore[union-attr]
+            if season_player_ids is None:
+                return None
+            player_ids.extend(season_player_ids)
+        return player_ids
+
+    def remember(
+        self,
+        scanned: t.Mapping[tuple[str, Seasons], t.Iterable[int]],
+    ) -> None:
+        """Add per-season IDs scanned outside :meth:`discover` to the cache, if any.
+
+        The IDs are stored under the spans :meth:`discover` looks up, so a
+        later discovery of the same seasons is served from the cache.
+        """
+        if not self.cache or not scanned:
+            return
+        season_ids = {season_span(seasons)[0] for _, seasons in scanned}
+        spans = plan_season_spans(season_ids, max_seasons=self.range_seasons)
+        span_of = {
+            season_id: span for span in spans for season_id in seasons_in_span(span)
+        }
+        by_span: dict[tuple[str, Seasons], set[int]] = {}
+        for (endpoint, seasons), season_player_ids in scanned.items():
+            span = span_of[season_span(seasons)[0]]
+            by_span.setdefault((endpoint, span), set()).update(season_player_ids)
+        with self.cache.exclusive():
+            self._store(by_span)
+
+    def _store(self, scanned: t.Mapping[tuple[str, Seasons], t.Iterable[int]]) -> None:
+        for (endpoint, seasons), season_player_ids in scanned.items():
+            self.cache.put(endpoint, seasons, season_player_ids)  # type: ignore[union-attr]
+        self.cache.save()  # type: ignore[union-attr]
+
+    def scan(
+        self,
+        targets: t.Sequence[tuple[str, Seasons]],
+    ) -> dict[tuple[str, Seasons], set[int]]:
+        """Collect the player IDs of the given ``(endpoint, season or span)`` pairs.
+
+        Truncated spans are replaced by one entry per season in the result.
+        """
+        results: dict[tuple[str, Seasons], set[int]] = {
+            target: set() for target in targets
+        }
+        totals: dict[tuple[str, Seasons], int] = {}
+        for endpoint, seasons, payload in self.iter_pages(targets, aggregate=True):
+            results[endpoint, seasons].update(self.extract_player_ids(payload))
+            total = payload.get("total") or 0
+            totals[endpoint, seasons] = max(totals.get((endpoint, seasons), 0), total)
+
+        truncated = [
+            (endpoint, seasons)
+            for endpoint, seasons in targets
+            if len(seasons_in_span(seasons)) > 1
+            and len(results[endpoint, seasons]) < totals.get((endpoint, seasons), 0)
+        ]
+        if truncated:
+            for target in truncated:
+                del results[target]
+            results.update(
+                self.scan(
+                    [
+                        (endpoint, season_id)
+                        for endpoint, seasons in truncated
+                        for season_id in seasons_in_span(seasons)
+                    ],
+                ),
+            )
+        return results
+
+    def iter_pages(
+        self,
+        targets: t.Sequence[tuple[str, Seasons]],
+        *,
+        aggregate: bool = False,
+    ) -> Iterator[tuple[str, Seasons, dict]]:
+        """Yield ``(endpoint, season_id, payload)`` for every page as it arrives.
+
+        Pages come in completion order, not in offset order. Pages not yet
+        requested are cancelled if the caller stops iterating early.
+        """
+        if not targets:
+            return
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="tap-nhl-discovery",
+        ) as executor:
+            pending: dict[Future[dict], tuple[str, Seasons, int]] = {}
+            for endpoint, seasons in targets:
+                future = executor.submit(
+                    self.fetch_page,
+                    endpoint,
+                    seasons,
+                    0,
+                    aggregate=aggregate,
+                )
+                pending[future] = (endpoint, seasons, 0)
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        endpoint, seasons, start = pending.pop(future)
+                        payload = future.result()
+                        if not start:
+                            for offset in self.plan_offsets(payload):
+                                follow_up = executor.submit(
+                                    self.fetch_page,
+                                    endpoint,
+                                    seasons,
+                                    offset,
+                                    aggregate=aggregate,
+                                )
+                                pending[follow_up] = (endpoint, seasons, offset)
+                        yield endpoint, seasons, payload
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def plan_offsets(self, first_page: dict) -> range:
+        """Return the ``start`` offsets still needed after the first page."""
+        if not first_page.get("data"):
+            return range(0)
+        total = first_page.get("total") or 0
+        return range(self.page_size, total, self.page_size)
+
+    def fetch_page(
+        self,
+        endpoint: str,
+        seasons: Seasons,
+        start: int,
+        *,
+        aggregate: bool = False,
+    ) -> dict:
+        """Request a single page of the summary endpoint for a season or span.
+
+        Aggregated pages hold one row per player over the whole span instead
+        of one row per player and season.
+        """
+        params = {
+            "isAggregate": "true" if aggregate else "false",
+            "isGame": "false",
+            "start": start,
+            "limit": self.page_size,
+            "cayenneExp": season_expression(seasons),
+        }
+        response = self.session.get(endpoint, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def extract_player_ids(payload: dict) -> set[int]:
+        """Return the player IDs contained in a summary page."""
+        return {
+            int(row["playerId"])
+            for row in payload.get("data") or []
+            if row.get("playerId") is not None
+        }
+
+
+class RosterDiscovery:
+    """Collect the IDs of currently rostered players from the team roster endpoints.
+
+    The current standings list every team. Each team's roster is requested
+    once, concurrently, and its players are grouped by the roster section
+    they are listed under (``forwards``, ``defensemen`` and ``goalies``). The
+    result is kept for the lifetime of the instance, so skaters and goalies
+    are served from a single pass.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        *,
+        max_workers: int = PLAYER_DISCOVERY_MAX_WORKERS,
+        timeout: int = PLAYER_DISCOVERY_TIMEOUT,
+    ) -> None:
+        """Create a new roster discovery.
+
+        Args:
+            session: Session carrying the discovery retry/backoff policy.
+            base_url: Base URL of the web API serving standings and rosters.
+            max_workers: Maximum number of concurrent roster requests.
+            timeout: Per-request timeout in seconds.
+        """
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max(max_workers, 1)
+        self.timeout = timeout
+        self._groups: dict[str, list[int]] | None = None
+        self._lock = threading.Lock()
+
+    def player_ids(self, groups: t.Iterable[str]) -> list[int]:
+        """Return the sorted IDs of players listed under any of ``groups``."""
+        rosters = self.rosters()
+        return sorted(
+            {player_id for group in groups for player_id in rosters.get(group, [])},
+        )
+
+    def rosters(self) -> dict[str, list[int]]:
+        """Return the sorted player IDs of every roster section, fetching them once."""
+        with self._lock:
+            if self._groups is None:
+                self._groups = self._fetch_rosters()
+            return self._groups
+
+    def _fetch_rosters(self) -> dict[str, list[int]]:
+        groups: dict[str, set[int]] = {}
+        teams = self.fetch_teams()
+        if not teams:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(teams)),
+            thread_name_prefix="tap-nhl-rosters",
+        ) as executor:
+            for roster in executor.map(self.fetch_roster, teams):
+                for group, players in roster.items():
+                    if isinstance(players, list):
+                        groups.setdefault(group, set()).update(
+                            int(player["id"])
+                            for player in players
+                            if player.get("id") is not None
+                        )
+        return {group: sorted(player_ids) for group, player_ids in groups.items()}
+
+    def fetch_teams(self) -> list[str]:
+        """Return the abbreviations of every team in the current standings."""
+        payload = self._get(TEAM_STANDINGS_PATH)
+        return sorted(
+            {
+                row["teamAbbrev"]["default"]
+                for row in payload.get("standings") or []
+                if (row.get("teamAbbrev") or {}).get("default")
+            },
+        )
+
+    def fetch_roster(self, team: str) -> dict:
+        """Return the current roster payload of one team."""
+        return self._get(TEAM_ROSTER_PATH.format(team=team))
+
+    def _get(self, path: str) -> dict:
+        response = self.session.get(f"{self.base_url}{path}", timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
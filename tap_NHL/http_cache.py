@@ -0,0 +1,189 @@
+"""Local HTTP response cache with conditional-request support."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if t.TYPE_CHECKING:
+    import os
+
+# Response headers worth replaying from a cached entry.
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response body plus the validators needed to revalidate it."""
+
+    url: str
+    body: bytes
+    headers: dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """Return the entity tag sent by the server, if any."""
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """Return the Last-Modified timestamp sent by the server, if any."""
+        return self.headers.get("Last-Modified")
+
+    @property
+    def has_validators(self) -> bool:
+        """Return True if the server supports conditional requests for this URL."""
+        return bool(self.etag or self.last_modified)
+
+    def age(self) -> float:
+        """Return the number of seconds since the entry was stored or revalidated."""
+        return time.time() - self.stored_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the request headers that revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build a ``200 OK`` response carrying the cached body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url or self.url
+        response.request = request
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.body  # noqa: SLF001
+        # Lets iter_content() serve the body to streaming readers.
+        response._content_consumed = True  # type: ignore[attr-defined]  # noqa: SLF001
+        response.from_cache = True  # type: ignore[attr-defined]
+        return response
+
+
+class ResponseCache:
+    """SQLite-backed response store with least-recently-used, size-based eviction."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int,
+        max_age_seconds: float,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite file holding the cached responses.
+            max_bytes: Total body size kept before the oldest entries are evicted.
+            max_age_seconds: How long entries without validators are served
+                without touching the network.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)",
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at"
+            " ON responses (accessed_at)",
+        )
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses",
+        ).fetchone()
+        self._total_bytes = total
+
+    def get(self, url: str) -> CacheEntry | None:
+        """Return the cached entry for ``url``, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, headers, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                (time.time(), url),
+            )
+        body, headers, stored_at = row
+        return CacheEntry(
+            url=url,
+            body=body,
+            headers=json.loads(headers),
+            stored_at=stored_at,
+        )
+
+    def put(self, url: str, response: requests.Response) -> None:
+        """Store a successful response body and its validators."""
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+        headers = {
+            name: response.headers[name]
+            for name in CACHED_HEADERS
+            if name in response.headers
+        }
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT size FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (url, body, headers, size, stored_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body, json.dumps(headers), len(body), now, now),
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as revalidated by the server."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the store fits ``max_bytes``."""
+        while self._total_bytes > self.max_bytes:
+            row = self._db.execute(
+                "SELECT url, size FROM responses ORDER BY accessed_at LIMIT 1",
+            ).fetchone()
+            if row is None:
+                self._total_bytes = 0
+                return
+            url, size = row
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total_bytes -= size
@@ -0,0 +1,277 @@
+"""Sync instrumentation: per-endpoint request statistics and per-phase timings."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import re
+import threading
+import time
+import typing as t
+from collections import Counter
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+if t.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+PERCENTILES = (50, 90, 95, 99)
+# Path segments replaced by a placeholder in endpoint labels, checked in order.
+_PATH_SEGMENTS = (
+    (re.compile(r"/\d{4}-\d{2}-\d{2}(?=/|$)"), "/{date}"),
+    (re.compile(r"/(?:19|20)\d{2}(?:19|20)\d{2}(?=/|$)"), "/{season}"),
+    (re.compile(r"/[A-Z]{3}(?=/|$)"), "/{team}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+)
+
+
+def endpoint_label(url: str) -> str:
+    """Return the path template of ``url``.
+
+    Dates, season IDs, team codes and other numeric segments become
+    ``{date}``, ``{season}``, ``{team}`` and ``{id}``.
+    """
+    path = urlsplit(url).path
+    for segment, placeholder in _PATH_SEGMENTS:
+        path = segment.sub(placeholder, path)
+    return path or "/"
+
+
+class LatencyHistogram:
+    """Latency distribution in logarithmic buckets of bounded size.
+
+    Each bucket spans ``growth`` times the previous one, so percentiles are
+    accurate to about ``(growth - 1) / 2`` regardless of how many samples are
+    recorded.
+    """
+
+    def __init__(self, *, smallest: float = 0.0005, growth: float = 1.1) -> None:
+        """Create an empty histogram.
+
+        Args:
+            smallest: Upper bound in seconds of the first bucket.
+            growth: Ratio between consecutive bucket bounds.
+        """
+        self.smallest = smallest
+        self.growth = growth
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: Counter[int] = Counter()
+        self._log_growth = math.log(growth)
+
+    def add(self, seconds: float) -> None:
+        """Record one sample."""
+        index = (
+            0
+            if seconds <= self.smallest
+            else math.ceil(math.log(seconds / self.smallest) / self._log_growth)
+        )
+        self._buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent: float) -> float:
+        """Return the upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self.smallest * self.growth**index, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float | int]:
+        """Return the sample count, mean, percentiles and maximum in milliseconds."""
+        summary: dict[str, float | int] = {
+            "count": self.count,
+            "mean_ms": round(1000 * self.total / self.count, 3) if self.count else 0.0,
+        }
+        for percent in PERCENTILES:
+            summary[f"p{percent}_ms"] = round(1000 * self.percentile(percent), 3)
+        summary["max_ms"] = round(1000 * self.max, 3)
+        return summary
+
+
+class EndpointStats:
+    """Request counters of one endpoint."""
+
+    def __init__(self) -> None:
+        """Create zeroed counters."""
+        self.requests = 0
+        self.statuses: Counter[int] = Counter()
+        self.retries = 0
+        self.cache_hits = 0
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.rate_limit_wait_seconds = 0.0
+        self.retry_sleep_seconds = 0.0
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict[str, t.Any]:
+        """Return the counters as JSON-serializable values."""
+        return {
+            "requests": self.requests,
+            "statuses": {
+                str(status): count for status, count in sorted(self.statuses.items())
+            },
+            "throttled_429": self.statuses[HTTPStatus.TOO_MANY_REQUESTS],
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "wire_bytes": self.wire_bytes,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait_seconds, 3),
+            "retry_sleep_seconds": round(self.retry_sleep_seconds, 3),
+            "latency": self.latency.summary(),
+        }
+
+
+class SyncMetrics:
+    """Thread-safe collector of what a sync spent its time and requests on.
+
+    Requests are grouped by endpoint path template. Phases (discovery, JSON
+    decoding, ``post_process``, conformance, ...) accumulate wall-clock time
+    across threads, so concurrent phases can add up to more than the elapsed
+    time of the sync.
+    """
+
+    def __init__(self, *, log_interval: float | None = None) -> None:
+        """Create an empty collector.
+
+        Args:
+            log_interval: Seconds between progress log lines, or None to disable.
+        """
+        self.log_interval = log_interval
+        self.started_at = time.monotonic()
+        self._endpoints: dict[str, EndpointStats] = {}
+        self._phases: dict[str, list[float]] = {}
+        self._records: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._logged_at = self.started_at
+
+    def _endpoint(self, url: str) -> EndpointStats:
+        label = endpoint_label(url)
+        stats = self._endpoints.get(label)
+        if stats is None:
+            stats = self._endpoints[label] = EndpointStats()
+        return stats
+
+    def observe_response(  # noqa: PLR0913 - one call per response
+        self,
+        url: str,
+        status_code: int,
+        *,
+        seconds: float,
+        size: int = 0,
+        wire_size: int = 0,
+        rate_limit_wait: float = 0.0,
+    ) -> None:
+        """Record a response that came back over the network."""
+        with self._lock:
+            stats = self._endpoint(url)
+            stats.requests += 1
+            stats.statuses[status_code] += 1
+            stats.bytes += size
+            stats.wire_bytes += wire_size
+            stats.rate_limit_wait_seconds += rate_limit_wait
+            stats.latency.add(seconds)
+            self._add_time("rate_limit_wait", rate_limit_wait)
+
+    def observe_cache_hit(self, url: str) -> None:
+        """Record a response served from the response cache."""
+        with self._lock:
+            self._endpoint(url).cache_hits += 1
+
+    def observe_retry(self, url: str, *, status_code: int | None = None) -> None:
+        """Record a retried request.
+
+        Args:
+            url: URL of the retried request.
+            status_code: Status of a response that was retried before it
+                reached the session, if any; it is counted like a response.
+        """
+        with self._lock:
+            stats = self._endpoint(url)
+            stats.retries += 1
+            if status_code is not None:
+                stats.statuses[status_code] += 1
+
+    def observe_retry_sleep(self, url: str, seconds: float) -> None:
+        """Record time slept before retrying a request."""
+        with self._lock:
+            self._endpoint(url).retry_sleep_seconds += seconds
+            self._add_time("retry_backoff", seconds)
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Add ``seconds`` spent in ``phase``."""
+        with self._lock:
+            self._add_time(phase, seconds)
+
+    def _add_time(self, phase: str, seconds: float) -> None:
+        totals = self._phases.get(phase)
+        if totals is None:
+            totals = self._phases[phase] = [0.0, 0]
+        totals[0] += seconds
+        totals[1] += 1
+
+    @contextlib.contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block as ``phase``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+    def count_records(self, stream_name: str, count: int = 1) -> None:
+        """Count records emitted by a stream."""
+        with self._lock:
+            self._records[stream_name] += count
+
+    def progress_due(self) -> bool:
+        """Return whether a periodic progress line should be logged now."""
+        if self.log_interval is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            if now - self._logged_at < self.log_interval:
+                return False
+            self._logged_at = now
+        return True
+
+    def progress(self) -> dict[str, t.Any]:
+        """Return a compact snapshot for periodic progress logging."""
+        with self._lock:
+            return {
+                "elapsed_seconds": round(time.monotonic() - self.started_at, 1),
+                "records": sum(self._records.values()),
+                "endpoints": {
+                    label: {
+                        "requests": stats.requests,
+                        "throttled_429": stats.statuses[HTTPStatus.TOO_MANY_REQUESTS],
+                        "retries": stats.retries,
+                        "p50_ms": round(1000 * stats.latency.percentile(50), 1),
+                        "p95_ms": round(1000 * stats.latency.percentile(95), 1),
+                    }
+                    for label, stats in self._endpoints.items()
+                },
+            }
+
+    def summary(self) -> dict[str, t.Any]:
+        """Return every collected metric as a JSON-serializable document."""
+        with self._lock:
+            return {
+                "elapsed_seconds": round(time.monotonic() - self.started_at, 3),
+                "records": dict(self._records),
+                "phases": {
+                    phase: {"seconds": round(seconds, 3), "count": int(count)}
+                    for phase, (seconds, count) in sorted(self._phases.items())
+                },
+                "endpoints": {
+                    label: stats.summary()
+                    for label, stats in sorted(self._endpoints.items())
+                },
+            }
@@ -0,0 +1,109 @@
+"""Schema-compiled normalization of localized landing fields."""
+
+from __future__ import annotations
+
+import typing as t
+
+LOCALE_PREFERENCE = ("default", "en", "eng")
+
+Normalizer = t.Callable[[t.Any], t.Any]
+
+
+def extract_default_locale(value: t.Any) -> t.Any:  # noqa: ANN401
+    """Return the preferred locale value of a localized object.
+
+    Prefers the ``default``, ``en`` and ``eng`` keys in that order and falls
+    back to the first non-empty value. Non-dict values are returned unchanged.
+    """
+    if not isinstance(value, dict):
+        return value
+    for key in LOCALE_PREFERENCE:
+        text = value.get(key)
+        if text:
+            return text
+    for text in value.values():
+        if text:
+            return text
+    return None
+
+
+def compile_locale_normalizer(schema: dict) -> Normalizer:
+    """Compile a function flattening localized objects into plain strings.
+
+    The NHL API returns names as ``{"default": ..., "fr": ...}`` objects. Any
+    property whose schema allows a string is flattened with
+    :func:`extract_default_locale` when the payload holds an object there.
+    The schema is walked once; each record is then normalized in a single
+    pass over its keys, descending only into objects and arrays that contain
+    such properties.
+
+    Args:
+        schema: JSON schema of the records to normalize.
+
+    Returns:
+        A function normalizing a record in place and returning it.
+    """
+    return _compile(schema) or _identity
+
+
+def _identity(value: t.Any) -> t.Any:  # noqa: ANN401
+    return value
+
+
+def _compile(schema: dict) -> Normalizer | None:  # noqa: C901 - one schema walk
+    """Return a normalizer for ``schema``, or ``None`` if nothing is localized."""
+    types = schema.get("type")
+    types = set(types) if isinstance(types, list) else {types}
+    if "string" in types:
+        return extract_default_locale
+
+    locale_fields: list[str] = []
+    nested_fields: list[tuple[str, Normalizer]] = []
+    for name, subschema in (schema.get("properties") or {}).items():
+        normalizer = _compile(subschema)
+        if normalizer is extract_default_locale:
+            locale_fields.append(name)
+        elif normalizer is not None:
+            nested_fields.append((name, normalizer))
+
+    if locale_fields or nested_fields:
+        locale_plan = tuple(locale_fields)
+        nested_plan = tuple(nested_fields)
+
+        def normalize_object(value: t.Any) -> t.Any:  # noqa: ANN401
+            if type(value) is not dict:
+                return value
+            for name in locale_plan:
+                item = value.get(name)
+                if type(item) is dict:
+                    value[name] = item.get("default") or extract_default_locale(item)
+            for name, normalizer in nested_plan:
+                item = value.get(name)
+                if item:
+                    value[name] = normalizer(item)
+            return value
+
+        return normalize_object
+
+    items = schema.get("items")
+    item_normalizer = _compile(items) if isinstance(items, dict) else None
+    if item_normalizer is extract_default_locale:
+
+        def normalize_strings(value: t.Any) -> t.Any:  # noqa: ANN401
+            if type(value) is list:
+                value[:] = [extract_default_locale(item) for item in value]
+            return value
+
+        return normalize_strings
+
+    if item_normalizer is not None:
+
+        def normalize_array(value: t.Any) -> t.Any:  # noqa: ANN401
+            if type(value) is list:
+                for item in value:
+                    item_normalizer(item)  # objects are normalized in place
+            return value
+
+        return normalize_array
+
+    return None
@@ -0,0 +1,85 @@
+"""Ordered, bounded prefetching of per-partition work."""
+
+from __future__ import annotations
+
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+
+K = t.TypeVar("K")
+V = t.TypeVar("V")
+
+
+class OrderedPrefetcher(t.Generic[K, V]):
+    """Keep a window of fetches running ahead of an in-order consumer.
+
+    Keys are submitted to a thread pool in plan order, at most
+    ``max_in_flight`` at a time. The consumer asks for results one key at a
+    time with :meth:`get`, so records are still emitted in the plan order no
+    matter which request finishes first.
+    """
+
+    def __init__(
+        self,
+        keys: t.Iterable[K],
+        fetch: t.Callable[[K], V],
+        *,
+        max_workers: int,
+        max_in_flight: int | None = None,
+    ) -> None:
+        """Create a new prefetcher.
+
+        Args:
+            keys: Keys in the order the consumer will request them.
+            fetch: Callable producing the value for a single key.
+            max_workers: Number of worker threads.
+            max_in_flight: Size of the look-ahead window. Defaults to twice the
+                number of workers so a worker never idles waiting for the consumer.
+        """
+        self._plan = iter(keys)
+        self._fetch = fetch
+        self._max_in_flight = max_in_flight or max_workers * 2
+        self._executor: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="tap-nhl-prefetch",
+        )
+        self._futures: dict[K, Future[V]] = {}
+        self._exhausted = False
+
+    def get(self, key: K) -> V:
+        """Return the fetched value for ``key``, re-raising any fetch error.
+
+        Keys that were not part of the plan are fetched synchronously.
+        """
+        while key not in self._futures and self._submit_next():
+            pass
+        future = self._futures.pop(key, None)
+        self._top_up()
+        if future is None:
+            return self._fetch(key)
+        try:
+            return future.result()
+        finally:
+            if self._exhausted and not self._futures:
+                self.close()
+
+    def close(self) -> None:
+        """Cancel queued fetches and release the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._futures.clear()
+
+    def _top_up(self) -> None:
+        while len(self._futures) < self._max_in_flight and self._submit_next():
+            pass
+
+    def _submit_next(self) -> bool:
+        if self._exhausted or self._executor is None:
+            return False
+        try:
+            key = next(self._plan)
+        except StopIteration:
+            self._exhausted = True
+            return False
+        self._futures[key] = self._executor.submit(self._fetch, key)
+        return True
@@ -0,0 +1,106 @@
+"""Priority ordering of player partitions and the sync time budget."""
+
+from __future__ import annotations
+
+import enum
+import time
+import typing as t
+from datetime import date
+
+from tap_NHL.constants import PRIORITY_RECENT_SEASONS, SEASON_ROLLOVER_MONTH
+
+if t.TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class Priority(enum.IntEnum):
+    """Scheduling tier of a player; lower tiers are synced first."""
+
+    ACTIVE = 0
+    RECENT = 1
+    UNSYNCED = 2
+    OTHER = 3
+
+
+def season_of(day: date) -> int:
+    """Return the ID of the season ``day`` falls in, e.g. 20242025."""
+    start_year = day.year if day.month >= SEASON_ROLLOVER_MONTH else day.year - 1
+    return int(f"{start_year}{start_year + 1}")
+
+
+def partition_priority(
+    state: Mapping[str, t.Any] | None,
+    *,
+    today: date,
+    recent_seasons: int = PRIORITY_RECENT_SEASONS,
+) -> Priority:
+    """Return the tier of a player from its partition state.
+
+    Args:
+        state: The player's state entry, or None if it was never synced.
+            Entries without ``last_synced_at`` count as never synced. The
+            season of the last game is taken from ``last_season`` if set,
+            else from ``replication_key_value``.
+        today: Date the current season is derived from.
+        recent_seasons: Seasons, counting the current one, whose players are
+            considered recent.
+    """
+    if not state or not state.get("last_synced_at"):
+        return Priority.UNSYNCED
+    if state.get("is_active"):
+        return Priority.ACTIVE
+    last_season = state.get("last_season")
+    last_game_date = state.get("replication_key_value")
+    if not last_season and last_game_date:
+        last_season = season_of(date.fromisoformat(str(last_game_date)[:10]))
+    first_recent_season = season_of(today) - (max(recent_seasons, 1) - 1) * 10001
+    if last_season and last_season >= first_recent_season:
+        return Priority.RECENT
+    return Priority.OTHER
+
+
+def order_by_priority(
+    player_ids: t.Iterable[int],
+    states: Mapping[int, Mapping[str, t.Any]],
+    *,
+    today: date,
+    recent_seasons: int = PRIORITY_RECENT_SEASONS,
+) -> list[int]:
+    """Order players by tier, least recently synced first within a tier.
+
+    Players synced by a run cut short by the time budget therefore move to
+    the back of their tier, and the next run picks up where it stopped.
+    Ties keep the order of ``player_ids``.
+    """
+
+    def key(player_id: int) -> tuple[int, str]:
+        state = states.get(player_id)
+        priority = partition_priority(state, today=today, recent_seasons=recent_seasons)
+        return priority, (state or {}).get("last_synced_at") or ""
+
+    return sorted(player_ids, key=key)
+
+
+class SyncBudget:
+    """Wall-clock allowance shared by every stream of a sync run."""
+
+    def __init__(self, max_seconds: float | None) -> None:
+        """Start the clock.
+
+        Args:
+            max_seconds: Seconds the run may take; None for no limit.
+        """
+        self.max_seconds = max_seconds
+        self._started = time.monotonic()
+
+    def elapsed(self) -> float:
+        """Return the seconds since the run started."""
+        return time.monotonic() - self._started
+
+    def exhausted(self) -> bool:
+        """Return whether the run has used up its time."""
+        return self.max_seconds is not None and self.elapsed() >= self.max_seconds
+
+    def allows(self, seconds: float) -> bool:
+        """Return whether ``seconds`` more still fit in the run's time."""
+        return self.max_seconds is None or self.elapsed() + seconds < self.max_seconds
@@ -0,0 +1,51 @@
+"""Deterministic assignment of players to tap shards."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+
+def shard_of(player_id: int, shard_count: int) -> int:
+    """Return the shard a player belongs to.
+
+    The assignment hashes the decimal player ID, so it is the same in every
+    process and run (unlike ``hash()``) and spreads the mostly sequential NHL
+    IDs evenly across shards.
+    """
+    digest = hashlib.blake2b(str(player_id).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+@dataclass(frozen=True)
+class Shard:
+    """The slice of the player-ID space handled by one tap process."""
+
+    index: int = 0
+    count: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the shard bounds.
+
+        Raises:
+            ValueError: If ``count`` is not positive or ``index`` is out of range.
+        """
+        if self.count < 1 or not 0 <= self.index < self.count:
+            msg = (
+                "Sharding requires shard_count >= 1 "
+                "and 0 <= shard_index < shard_count."
+            )
+            raise ValueError(msg)
+
+    @property
+    def is_sharded(self) -> bool:
+        """Return whether the player-ID space is split across several shards."""
+        return self.count > 1
+
+    def owns(self, player_id: int) -> bool:
+        """Return whether this shard handles ``player_id``."""
+        return not self.is_sharded or shard_of(player_id, self.count) == self.index
+
+    def __str__(self) -> str:
+        """Return the shard as ``index/count``."""
+        return f"{self.index}/{self.count}"
@@ -2,27 +2,51 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 import typing as t
 from importlib import resources
-import time
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+from singer_sdk.exceptions import FatalAPIError
+from singer_sdk.pagination import SinglePagePaginator
 
-from tap_NHL.client import NHLStream
+from tap_NHL.checkpoint import CompactCheckpoint
+from tap_NHL.client import NHLStream, load_schema
+from tap_NHL.decoding import iter_items, streaming_json_available
+from tap_NHL.discovery import PlayerDiscovery
+from tap_NHL.normalize import compile_locale_normalizer
+from tap_NHL.prefetch import OrderedPrefetcher
+from tap_NHL.scheduling import order_by_priority
 from tap_NHL.constants import (
-    GOALIE_DISCOVERY_ENDPOINT,
-    PLAYER_DISCOVERY_MAX_RETRIES,
-    PLAYER_DISCOVERY_PAGE_SIZE,
+    CHECKPOINT_FLUSH_INTERVAL,
+    DEAD_LETTER_BACKOFF_SECONDS,
+    DEAD_LETTER_MAX_ATTEMPTS,
+    FINISHED_GAME_STATES,
+    GAME_SCHEDULE_LOOKBACK_DAYS,
+    GAME_SCHEDULE_WEEK_DAYS,
+    GOALIE_DISCOVERY_PATH,
+    INACTIVE_PLAYER_RECHECK_DAYS,
+    PLAYER_DISCOVERY_MAX_WORKERS,
+    PLAYER_DISCOVERY_RANGE_SEASONS,
     PLAYER_DISCOVERY_SEASON_END,
     PLAYER_DISCOVERY_SEASON_START,
     PLAYER_DISCOVERY_SEASONS,
-    PLAYER_DISCOVERY_TIMEOUT,
-    SKATER_DISCOVERY_ENDPOINT,
+    SKATER_DISCOVERY_PATH,
+    STATS_API_BASE_URL,
+    STREAMING_JSON_CHUNK_SIZE,
 )
 
+if t.TYPE_CHECKING:
+    import requests
+    from singer_sdk.helpers.types import Context
+
+    from tap_NHL.dead_letters import DeadLetterQueue
+    from tap_NHL.discovery import Seasons
+
 SCHEMAS_DIR = resources.files(__package__) / "schemas"
 
 
@@ -31,32 +55,217 @@ class PlayerLandingStream(NHLStream):
 
     path = "/v1/player/{player_id}/landing"
     primary_keys: t.ClassVar[list[str]] = ["playerId"]
+    replication_key = "lastGameDate"
     records_jsonpath = "$"
-    discovery_endpoints: t.ClassVar[tuple[str, ...]] = ()
+    discovery_paths: t.ClassVar[tuple[str, ...]] = ()
+    roster_groups: t.ClassVar[tuple[str, ...]] = ()
     config_player_ids_keys: t.ClassVar[tuple[str, ...]] = ("player_ids",)
+    trusted_properties: t.ClassVar[tuple[str, ...]] = (
+        "featuredStats",
+        "careerTotals",
+        "seasonTotals",
+        "last5Games",
+    )
     _auto_player_ids: list[int] | None = None
     _season_ids: list[int] | None = None
-    _discovery_session: requests.Session | None = None
-    _last_request_ts: float | None = None
-    RATE_LIMIT_SECONDS = 0.35
-    LOCALE_FIELDS = [
-        "fullTeamName",
-        "teamCommonName",
-        "teamPlaceNameWithPreposition",
-        "firstName",
-        "lastName",
-        "birthCity",
-        "birthStateProvince",
-    ]
+    _landing_prefetcher: OrderedPrefetcher[int, requests.Response] | None = None
+    _suppressed_records = 0
+    _child_source: dict | None = None
+    _player_ids: list[int] | None = None
+    _stopped_for_budget = False
 
     @property
     def partitions(self) -> list[dict[str, int]] | None:
-        """Partition records by configured player IDs or discover all players."""
+        """Partition by configured or discovered player IDs owned by this shard."""
+        partitions = [{"player_id": player_id} for player_id in self._get_player_ids()]
+        return partitions or None
+
+    @property
+    def state_partitioning_keys(self) -> list[str] | None:
+        """Keep a single stream-level state entry when checkpointing compactly."""
+        return [] if self._compact_checkpointing else self._state_partitioning_keys
+
+    @state_partitioning_keys.setter
+    def state_partitioning_keys(self, new_value: list[str] | None) -> None:
+        """Set partition keys used when not checkpointing compactly."""
+        self._state_partitioning_keys = new_value
+
+    @cached_property
+    def _compact_checkpointing(self) -> bool:
+        """Return whether progress is kept in a compact checkpoint."""
+        if self.config.get("checkpoint_mode") != "compact":
+            return False
+        if self.config.get("skip_unchanged_records"):
+            self.logger.warning(
+                "skip_unchanged_records needs per-player state and is ignored "
+                "in compact checkpoint mode.",
+            )
+        return True
+
+    @cached_property
+    def _checkpoint(self) -> CompactCheckpoint:
+        """Return the compact checkpoint kept in this stream's state."""
+        state = self.stream_state
+        checkpoint_state = state.setdefault("checkpoint", {})
+        partitions = state.pop("partitions", None)
+        flush_interval = self.config.get("checkpoint_interval_seconds")
+        if flush_interval is None:
+            flush_interval = CHECKPOINT_FLUSH_INTERVAL
+        checkpoint = CompactCheckpoint(
+            checkpoint_state,
+            flush_interval=flush_interval,
+            recheck_days=self._get_inactive_recheck_days(),
+        )
+        if partitions:
+            self._migrate_partition_state(partitions, state, checkpoint)
+        return checkpoint
+
+    def _migrate_partition_state(
+        self,
+        partitions: list[dict],
+        state: dict,
+        checkpoint: CompactCheckpoint,
+    ) -> None:
+        """Fold per-player state entries into the stream's compact checkpoint."""
+        bookmarks = [
+            partition["replication_key_value"]
+            for partition in partitions
+            if partition.get("replication_key_value")
+        ]
+        if bookmarks and not state.get("replication_key_value"):
+            state["replication_key"] = self.replication_key
+            state["replication_key_value"] = max(bookmarks)
+        for partition in partitions:
+            player_id = (partition.get("context") or {}).get("player_id")
+            synced_at = partition.get("last_synced_at")
+            if player_id is None or not synced_at:
+                continue
+            checkpoint.mark(
+                player_id,
+                is_active=partition.get("is_active"),
+                synced_on=datetime.fromisoformat(synced_at).date(),
+                last_game_date=partition.get("replication_key_value"),
+            )
+        checkpoint.save()
+        self.logger.info(
+            "Migrated %d per-player state entries of %s to a compact checkpoint.",
+            len(partitions),
+            self.name,
+        )
+
+    def _get_player_ids(self) -> list[int]:
+        """Return the configured or discovered player IDs owned by this shard."""
+        if self._player_ids is not None:
+            return self._player_ids
+        if self.tap.sync_budget.exhausted():
+            self.logger.info(
+                "Sync time budget used up; %s is left for the next run.",
+                self.name,
+            )
+            self._player_ids = []
+            return self._player_ids
+        if self._redriving:
+            shard = self.tap.shard
+            dead_letters = t.cast("DeadLetterQueue", self.tap.dead_letters)
+            self._player_ids = [
+                player_id
+                for player_id in dead_letters.player_ids(self.name)
+                if shard.owns(player_id)
+            ]
+            self.logger.info(
+                "Redriving %d dead-lettered %s.",
+                len(self._player_ids),
+                self.name,
+            )
+            return self._player_ids
+        if self._compact_checkpointing:
+            remaining = self._checkpoint.resume(self._get_run_scope())
+            if remaining is not None:
+                self.logger.info(
+                    "Resuming %s from checkpoint at player %d of %d.",
+                    self.name,
+                    self._checkpoint.completed + 1,
+                    self._checkpoint.planned,
+                )
+                self._player_ids = remaining
+                return self._player_ids
         player_ids = self._get_configured_player_ids()
         if not player_ids:
             player_ids = self._get_all_player_ids()
-        partitions = [{"player_id": player_id} for player_id in player_ids]
-        return partitions or None
+        shard = self.tap.shard
+        self._player_ids = self._schedule(
+            [player_id for player_id in player_ids if shard.owns(player_id)],
+        )
+        if shard.is_sharded:
+            self.logger.info(
+                "Shard %s syncs %d of %d %s.",
+                shard,
+                len(self._player_ids),
+                len(player_ids),
+                self.name,
+            )
+        if self._compact_checkpointing:
+            self._checkpoint.start(self._player_ids, self._get_run_scope())
+            self._flush_checkpoint()
+        return self._player_ids
+
+    def _schedule(self, player_ids: list[int]) -> list[int]:
+        """Order the players of a new run by priority, unless configured otherwise.
+
+        Active players come first, then players seen in the latest seasons,
+        then players never synced, then everyone else. Within a tier the
+        least recently synced player goes first.
+        """
+        if self.config.get("partition_order") == "player_id":
+            return player_ids
+        if self._compact_checkpointing:
+            states = self._checkpoint.activity()
+        else:
+            states = {
+                partition["context"]["player_id"]: partition
+                for partition in self.stream_state.get("partitions") or []
+                if "player_id" in (partition.get("context") or {})
+            }
+        return order_by_priority(player_ids, states, today=datetime.now(UTC).date())
+
+    def _stop_for_budget(self, context: dict) -> bool:
+        """Return whether the sync time budget is used up, winding the stream down once.
+
+        Queued landing fetches are cancelled and the compact checkpoint is
+        flushed, so the next run resumes at ``context``'s player.
+        """
+        if self._stopped_for_budget:
+            return True
+        if not self.tap.sync_budget.exhausted():
+            return False
+        self._stopped_for_budget = True
+        if self._landing_prefetcher is not None:
+            self._landing_prefetcher.close()
+        if self._compact_checkpointing:
+            self._flush_checkpoint()
+        player_ids = self._get_player_ids()
+        remaining = len(player_ids) - player_ids.index(context["player_id"])
+        self.logger.info(
+            "Sync time budget used up after %.0fs; "
+            "%d of %d %s are left for the next run.",
+            self.tap.sync_budget.elapsed(),
+            remaining,
+            len(player_ids),
+            self.name,
+        )
+        return True
+
+    def _get_run_scope(self) -> str:
+        """Identify the player selection a checkpointed run was planned for."""
+        scope = [
+            str(self.tap.shard),
+            self._get_configured_player_ids(),
+            self.config.get("discovery_seasons") or PLAYER_DISCOVERY_SEASONS,
+        ]
+        if self._discovers_active_rosters:
+            scope.append("active_rosters")
+        selection = json.dumps(scope)
+        return hashlib.blake2b(selection.encode(), digest_size=8).hexdigest()
 
     def get_records(
         self,
@@ -69,7 +278,267 @@ class PlayerLandingStream(NHLStream):
                 self.name,
             )
             return iter([])
-        return super().get_records(context)
+        if self._stop_for_budget(context):
+            return iter([])
+        if self._should_skip_player(context):
+            self.logger.debug(
+                "Skipping inactive player %s; synced within the re-check interval.",
+                context["player_id"],
+            )
+            records: t.Iterable[dict] = iter([])
+        elif self.tap.dead_letters is not None:
+            records = self._isolate_failures(context, self.tap.dead_letters)
+        elif self._get_landing_concurrency() > 1:
+            records = self._get_prefetched_records(context)
+        else:
+            records = super().get_records(context)
+        if self._compact_checkpointing:
+            return self._checkpoint_records(records, context)
+        if self.config.get("skip_unchanged_records"):
+            return self._suppress_unchanged_records(records, context)
+        return records
+
+    def _checkpoint_records(
+        self,
+        records: t.Iterable[dict],
+        context: dict,
+    ) -> t.Iterable[dict]:
+        """Yield a player's records, then mark the player finished in the checkpoint.
+
+        The player only counts as finished once its records have been written,
+        so a restarted run resumes at the first player that may be missing.
+        """
+        yield from records
+        checkpoint = self._checkpoint
+        if self._redriving:
+            # Redrives leave the planned run of an interrupted sync alone.
+            self._flush_checkpoint()
+            return
+        checkpoint.complete(context["player_id"])
+        if checkpoint.due():
+            self._flush_checkpoint()
+
+    def _flush_checkpoint(self) -> None:
+        """Save the compact checkpoint and emit it in a STATE message."""
+        self._checkpoint.save()
+        if self.get_batch_config(self.config) is None:
+            # BATCH syncs write state after each batch file instead.
+            self._is_state_flushed = False
+            self._write_state_message()
+
+    def _suppress_unchanged_records(
+        self,
+        records: t.Iterable[dict],
+        context: dict,
+    ) -> t.Iterable[dict]:
+        """Drop records whose fingerprint matches the one stored in state."""
+        state = self.get_context_state(context)
+        for record in records:
+            fingerprint = self._fingerprint_record(record)
+            if state.get("record_hash") == fingerprint:
+                self._suppressed_records += 1
+                # Still refresh activity tracking for the skipped record.
+                self._increment_stream_state(record, context=context)
+                continue
+            state["record_hash"] = fingerprint
+            yield record
+
+    @staticmethod
+    def _fingerprint_record(record: dict) -> str:
+        """Return a stable hash of the normalized record."""
+        payload = json.dumps(
+            record,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
+
+    def log_sync_costs(self) -> None:
+        """Log sync costs plus the number of unchanged records suppressed."""
+        if self._suppressed_records:
+            self.logger.info(
+                "Suppressed %d unchanged records for stream %s.",
+                self._suppressed_records,
+                self.name,
+            )
+        super().log_sync_costs()
+
+    def _get_prefetched_records(self, context: dict) -> t.Iterable[dict]:
+        """Yield records from a landing response fetched by the worker pool."""
+        response = self._get_landing_prefetcher().get(context["player_id"])
+        yield from self._records_from_response(response, context)
+
+    def _records_from_response(
+        self,
+        response: requests.Response,
+        context: dict,
+    ) -> t.Iterable[dict]:
+        """Yield the post-processed records of a landing response."""
+        self.update_sync_costs(response.request, response, context)
+        for record in self.parse_response(response):
+            transformed_record = self.post_process(record, context)
+            if transformed_record is None:
+                continue
+            yield transformed_record
+
+    @property
+    def _redriving(self) -> bool:
+        """Return whether this run only syncs dead-lettered players."""
+        return self.config.get("dead_letter_mode") == "redrive"
+
+    def _isolate_failures(
+        self,
+        context: dict,
+        dead_letters: DeadLetterQueue,
+    ) -> t.Iterable[dict]:
+        """Yield a player's records, dead-lettering the player if it keeps failing.
+
+        A player's records are collected before any is yielded, so a failure
+        part way through emits nothing for it. Each retry fetches the landing
+        page again after an exponential backoff. Retries whose backoff would
+        outlast the sync time budget are skipped and the player is
+        dead-lettered straight away, so the next redrive picks it up. A player
+        that succeeds is removed from the dead-letter file.
+        """
+        player_id = context["player_id"]
+        max_attempts = max(
+            int(
+                self.config.get("dead_letter_max_attempts")
+                or DEAD_LETTER_MAX_ATTEMPTS,
+            ),
+            1,
+        )
+        backoff = self.config.get("dead_letter_backoff_seconds")
+        if backoff is None:
+            backoff = DEAD_LETTER_BACKOFF_SECONDS
+        for attempt in range(1, max_attempts + 1):
+            response = None
+            try:
+                if attempt == 1 and self._get_landing_concurrency() > 1:
+                    response = self._get_landing_prefetcher().get(player_id)
+                else:
+                    response = self._fetch_landing_response(player_id)
+                records = list(self._records_from_response(response, context))
+            except Exception as error:  # noqa: BLE001 - isolate any failure of one player
+                delay = backoff * 2 ** (attempt - 1)
+                if attempt < max_attempts and self.tap.sync_budget.allows(delay):
+                    self.logger.warning(
+                        "Attempt %d of %d for player %s failed: %s",
+                        attempt,
+                        max_attempts,
+                        player_id,
+                        error,
+                    )
+                    time.sleep(delay)
+                    continue
+                if response is None:
+                    response = getattr(error, "response", None)
+                dead_letters.add(
+                    self.name,
+                    player_id,
+                    error=error,
+                    response=response,
+                    attempts=attempt,
+                )
+                self.logger.warning(
+                    "Dead-lettered player %s of %s after %d attempts%s: %s",
+                    player_id,
+                    self.name,
+                    attempt,
+                    "" if attempt == max_attempts else " (sync time budget used up)",
+                    error,
+                )
+                return
+            break
+        if dead_letters.discard(self.name, player_id):
+            self.logger.info(
+                "Player %s synced and left the dead-letter file.",
+                player_id,
+            )
+        yield from records
+
+    def validate_response(self, response: requests.Response) -> None:
+        """Validate a landing response, keeping it on fatal errors for dead letters."""
+        try:
+            super().validate_response(response)
+        except FatalAPIError as error:
+            error.response = response  # type: ignore[attr-defined]
+            raise
+
+    def _get_landing_concurrency(self) -> int:
+        """Return how many landing requests may be in flight at once."""
+        return max(int(self.config.get("landing_concurrency") or 1), 1)
+
+    def _get_landing_prefetcher(self) -> OrderedPrefetcher[int, requests.Response]:
+        """Create or return the pool fetching landing pages in partition order."""
+        if self._landing_prefetcher is None:
+            player_ids = [
+                partition["player_id"]
+                for partition in self.partitions or []
+                if not self._should_skip_player(partition)
+            ]
+            self._landing_prefetcher = OrderedPrefetcher(
+                player_ids,
+                self._fetch_landing_response,
+                max_workers=self._get_landing_concurrency(),
+            )
+        return self._landing_prefetcher
+
+    def _fetch_landing_response(self, player_id: int) -> requests.Response:
+        """Request a single landing page with the stream's retry handling."""
+        context = {"player_id": player_id}
+        prepared_request = self.prepare_request(context, next_page_token=None)
+        decorated_request = self.request_decorator(self._request)
+        return decorated_request(prepared_request, context)
+
+    def _should_skip_player(self, context: dict) -> bool:
+        """Return True for inactive players synced within the re-check window."""
+        if self.replication_method != "INCREMENTAL":
+            return False
+        if self._compact_checkpointing:
+            return self._checkpoint.is_recently_inactive(
+                context["player_id"],
+                datetime.now(UTC).date(),
+            )
+        state = self.get_context_state(context)
+        synced_at = state.get("last_synced_at")
+        if state.get("is_active") is not False or not synced_at:
+            return False
+        age = datetime.now(UTC) - datetime.fromisoformat(synced_at)
+        return age < timedelta(days=self._get_inactive_recheck_days())
+
+    def _get_inactive_recheck_days(self) -> int:
+        """Return how many days inactive players are skipped after a sync."""
+        recheck_days = self.config.get("inactive_recheck_days")
+        if recheck_days is None:
+            recheck_days = INACTIVE_PLAYER_RECHECK_DAYS
+        return recheck_days
+
+    def _increment_stream_state(
+        self,
+        latest_record: dict,
+        *,
+        context: Context | None = None,
+    ) -> None:
+        """Track player activity alongside the lastGameDate bookmark."""
+        if self.replication_method == "INCREMENTAL" and self._compact_checkpointing:
+            self._checkpoint.mark(
+                latest_record["playerId"],
+                is_active=latest_record.get("isActive"),
+                synced_on=datetime.now(UTC).date(),
+                last_game_date=latest_record.get(self.replication_key),
+            )
+            if latest_record.get(self.replication_key) is None:
+                return
+        elif self.replication_method == "INCREMENTAL":
+            state = self.get_context_state(context)
+            state["is_active"] = latest_record.get("isActive")
+            state["last_synced_at"] = datetime.now(UTC).isoformat()
+            if latest_record.get(self.replication_key) is None:
+                # Players without recent games have no bookmark to advance.
+                return
+        super()._increment_stream_state(latest_record, context=context)
 
     def post_process(  # noqa: D401
         self,
@@ -81,21 +550,41 @@ class PlayerLandingStream(NHLStream):
         if row is None:
             return None
 
-        for field in self.LOCALE_FIELDS:
-            if field in row:
-                row[field] = self._extract_default_locale(row.get(field))
+        with self.tap.metrics.timer("post_process"):
+            row = self._locale_normalizer(row)
+            row["lastGameDate"] = self._get_last_game_date(row)
+        return row
 
-        # Flatten localized fields inside seasonTotals entries.
-        for entry in row.get("seasonTotals") or []:
-            for nested_field in (
-                "teamName",
-                "teamCommonName",
-                "teamPlaceNameWithPreposition",
-            ):
-                if nested_field in entry:
-                    entry[nested_field] = self._extract_default_locale(entry.get(nested_field))
+    def get_child_context(
+        self,
+        record: dict,
+        context: Context | None,  # noqa: ARG002
+    ) -> dict | None:
+        """Keep the landing record for child streams and pass them its player ID."""
+        self._child_source = record
+        return {"player_id": record["playerId"]}
 
-        return row
+    def get_child_source(self, player_id: int) -> dict | None:
+        """Return the landing record currently being synced for ``player_id``."""
+        source = self._child_source
+        if source is None or source.get("playerId") != player_id:
+            return None
+        return source
+
+    @cached_property
+    def _locale_normalizer(self) -> t.Callable[[t.Any], t.Any]:
+        """Return the localized-field normalizer compiled from the stream schema."""
+        return compile_locale_normalizer(self.schema)
+
+    @staticmethod
+    def _get_last_game_date(row: dict) -> str | None:
+        """Return the most recent game date listed in last5Games, if any."""
+        game_dates = [
+            game["gameDate"]
+            for game in row.get("last5Games") or []
+            if game.get("gameDate")
+        ]
+        return max(game_dates, default=None)
 
     def _get_all_player_ids(self) -> list[int]:
         """Fetch player IDs for the entire NHL historical dataset."""
@@ -103,43 +592,96 @@ class PlayerLandingStream(NHLStream):
             self._auto_player_ids = self._fetch_all_player_ids()
         return self._auto_player_ids
 
+    @property
+    def _discovers_active_rosters(self) -> bool:
+        """Return whether players come from current team rosters instead of seasons."""
+        return self.config.get("discovery_mode") == "active_rosters"
+
     def _fetch_all_player_ids(self) -> list[int]:
-        """Retrieve every player ID using the stats API summary endpoint."""
-        player_ids: set[int] = set()
-        session = self._get_discovery_session()
-        if not self.discovery_endpoints:
-            msg = "discovery_endpoints must be defined on PlayerLandingStream subclasses."
+        """Retrieve every player ID using the stats API summary endpoint.
+
+        In ``active_rosters`` discovery mode, the IDs listed in this stream's
+        sections of the current team rosters are returned instead.
+        """
+        limiter = self.tap.rate_limiter
+        wait_before = limiter.wait_seconds
+        with self.tap.metrics.timer("discovery"):
+            if self._discovers_active_rosters:
+                player_ids = self.tap.roster_discovery.player_ids(self.roster_groups)
+            else:
+                player_ids = self._get_player_discovery().discover(
+                    self._get_discovery_endpoints(),
+                    self._fetch_season_ids(),
+                )
+        self.logger.info(
+            "Discovered %d %splayers for %s (%.1fs spent throttled).",
+            len(player_ids),
+            "rostered " if self._discovers_active_rosters else "",
+            self.name,
+            limiter.wait_seconds - wait_before,
+        )
+        return player_ids
+
+    def iter_discovery_rows(self) -> t.Iterator[dict]:
+        """Yield every row of this stream's discovery pages as the pages arrive.
+
+        Every endpoint and season is scanned (the discovery cache only holds
+        IDs), and the IDs found are kept as this stream's discovered players
+        and added to the discovery cache, so a sync of this stream afterwards
+        does not scan the same pages again. In ``active_rosters`` discovery
+        mode the stream keeps its roster-based players.
+        """
+        discovery = self._get_player_discovery()
+        targets = [
+            (endpoint, season_id)
+            for season_id in self._fetch_season_ids()
+            for endpoint in self._get_discovery_endpoints()
+        ]
+        scanned: dict[tuple[str, Seasons], set[int]] = {
+            target: set() for target in targets
+        }
+        for endpoint, season_id, payload in discovery.iter_pages(targets):
+            scanned[endpoint, season_id].update(discovery.extract_player_ids(payload))
+            yield from payload.get("data") or []
+        discovery.remember(scanned)
+        if self._discovers_active_rosters:
+            return
+        self._auto_player_ids = sorted(set().union(*scanned.values()))
+        self.logger.info(
+            "Discovered %d players for %s while reading season summaries.",
+            len(self._auto_player_ids),
+            self.name,
+        )
+
+    def _get_player_discovery(self) -> PlayerDiscovery:
+        """Return a discovery engine over this stream's session and cache."""
+        if not self.discovery_paths:
+            msg = "discovery_paths must be defined on PlayerLandingStream subclasses."
             raise ValueError(msg)
-        endpoints = self.discovery_endpoints
-        for season_id in self._fetch_season_ids():
-            for endpoint in endpoints:
-                start = 0
-                while True:
-                    params = {
-                        "isAggregate": "false",
-                        "isGame": "false",
-                        "start": start,
-                        "limit": PLAYER_DISCOVERY_PAGE_SIZE,
-                        "cayenneExp": f"seasonId={season_id}",
-                    }
-                    response = session.get(
-                        endpoint,
-                        params=params,
-                        timeout=PLAYER_DISCOVERY_TIMEOUT,
-                    )
-                    response.raise_for_status()
-                    payload = response.json()
-                    data = payload.get("data") or []
-                    for row in data:
-                        player_id = row.get("playerId")
-                        if player_id is not None:
-                            player_ids.add(int(player_id))
-                    total = payload.get("total") or 0
-                    start += PLAYER_DISCOVERY_PAGE_SIZE
-                    if start >= total or not data:
-                        break
-
-        return sorted(player_ids)
+        range_seasons = self.config.get("discovery_range_seasons")
+        if range_seasons is None:
+            range_seasons = PLAYER_DISCOVERY_RANGE_SEASONS
+        return PlayerDiscovery(
+            self._get_discovery_session(),
+            max_workers=self._get_discovery_concurrency(),
+            cache=self.tap.discovery_cache,
+            range_seasons=range_seasons,
+        )
+
+    def _get_discovery_endpoints(self) -> list[str]:
+        """Return the summary endpoint URLs listing this stream's players."""
+        base_url = (self.config.get("stats_api_url") or STATS_API_BASE_URL).rstrip("/")
+        return [f"{base_url}{path}" for path in self.discovery_paths]
+
+    def _get_discovery_concurrency(self) -> int:
+        """Return how many discovery pages may be requested at once."""
+        return max(
+            int(
+                self.config.get("discovery_concurrency")
+                or PLAYER_DISCOVERY_MAX_WORKERS,
+            ),
+            1,
+        )
 
     def _fetch_season_ids(self) -> list[int]:
         """Build the list of season IDs honoring the configured discovery range."""
@@ -164,53 +706,8 @@ class PlayerLandingStream(NHLStream):
         return season_ids
 
     def _get_discovery_session(self) -> requests.Session:
-        """Create or return a session with retry/backoff for discovery calls."""
-        if self._discovery_session is None:
-            retry = Retry(
-                total=PLAYER_DISCOVERY_MAX_RETRIES,
-                read=PLAYER_DISCOVERY_MAX_RETRIES,
-                connect=PLAYER_DISCOVERY_MAX_RETRIES,
-                backoff_factor=2,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-            adapter = HTTPAdapter(max_retries=retry)
-            session = requests.Session()
-            session.mount("https://", adapter)
-            session.mount("http://", adapter)
-            self._discovery_session = session
-        return self._discovery_session
-
-    def _request(
-        self,
-        prepared_request: requests.PreparedRequest,
-        context: dict | None,
-    ) -> requests.Response:
-        """Throttle outgoing API calls to avoid rate limits."""
-        self._apply_rate_limit()
-        return super()._request(prepared_request, context)
-
-    def _apply_rate_limit(self) -> None:
-        """Sleep briefly between requests to avoid 429 rate limits."""
-        now = time.monotonic()
-        if self._last_request_ts is not None:
-            elapsed = now - self._last_request_ts
-            if elapsed < self.RATE_LIMIT_SECONDS:
-                time.sleep(self.RATE_LIMIT_SECONDS - elapsed)
-        self._last_request_ts = time.monotonic()
-
-    @staticmethod
-    def _extract_default_locale(value: t.Any) -> t.Any:
-        """Return the 'default' locale value if present."""
-        if isinstance(value, dict):
-            for key in ("default", "en", "eng"):
-                if key in value and value[key]:
-                    return value[key]
-            # Fall back to first non-null value
-            for val in value.values():
-                if val:
-                    return val
-            return None
-        return value
+        """Return the tap's session with retry/backoff for discovery calls."""
+        return self.tap.discovery_session
 
     def _get_configured_player_ids(self) -> list[int]:
         """Return the configured IDs for this stream, if provided."""
@@ -226,7 +723,8 @@ class SkatersStream(PlayerLandingStream):
 
     name = "skaters"
     schema_filepath = SCHEMAS_DIR / "skaters.json"
-    discovery_endpoints = (SKATER_DISCOVERY_ENDPOINT,)
+    discovery_paths = (SKATER_DISCOVERY_PATH,)
+    roster_groups = ("forwards", "defensemen")
     config_player_ids_keys = ("skater_ids", "player_ids")
 
 
@@ -235,5 +733,310 @@ class GoaliesStream(PlayerLandingStream):
 
     name = "goalies"
     schema_filepath = SCHEMAS_DIR / "goalies.json"
-    discovery_endpoints = (GOALIE_DISCOVERY_ENDPOINT,)
+    discovery_paths = (GOALIE_DISCOVERY_PATH,)
+    roster_groups = ("goalies",)
     config_player_ids_keys = ("goalie_ids",)
+
+
+class LandingChildStream(NHLStream):
+    """Rows of one nested landing array, emitted without extra requests.
+
+    Child streams are synced right after each parent landing record is
+    processed, so the rows come from the record the parent already fetched
+    and normalized. The schema is the parent's item schema plus ``playerId``.
+    """
+
+    parent_stream_type: type[SkatersStream | GoaliesStream]
+    parent_field: t.ClassVar[str]
+    state_partitioning_keys: t.ClassVar[list[str]] = []
+
+    def __init__(self, tap: t.Any, *args: t.Any, **kwargs: t.Any) -> None:  # noqa: ANN401
+        """Build the schema from the parent stream's before initializing."""
+        kwargs.setdefault("schema", self._build_schema())
+        super().__init__(tap, *args, **kwargs)
+
+    @classmethod
+    def _build_schema(cls) -> dict:
+        parent_schema = load_schema(cls.parent_stream_type.schema_filepath)
+        item_schema = parent_schema["properties"][cls.parent_field]["items"]
+        return {
+            **item_schema,
+            "properties": {
+                "playerId": {"type": "integer"},
+                **item_schema["properties"],
+            },
+        }
+
+    def get_batch_config(self, config: t.Mapping) -> None:
+        """Emit RECORD messages; child syncs are per player, too small to batch."""
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Yield the parent record's rows, tagged with the player ID."""
+        if not context:
+            return
+        parent = t.cast(
+            "PlayerLandingStream",
+            self.tap.streams[self.parent_stream_type.name],
+        )
+        source = parent.get_child_source(context["player_id"])
+        if source is None:
+            return
+        for row in source.get(self.parent_field) or []:
+            yield {"playerId": source["playerId"], **row}
+
+
+class SkaterSeasonTotalsStream(LandingChildStream):
+    """Season-by-season totals of each synced skater."""
+
+    name = "skater_season_totals"
+    parent_stream_type = SkatersStream
+    parent_field = "seasonTotals"
+    primary_keys: t.ClassVar[list[str]] = [
+        "playerId",
+        "season",
+        "gameTypeId",
+        "sequence",
+    ]
+
+
+class GoalieSeasonTotalsStream(LandingChildStream):
+    """Season-by-season totals of each synced goalie."""
+
+    name = "goalie_season_totals"
+    parent_stream_type = GoaliesStream
+    parent_field = "seasonTotals"
+    primary_keys: t.ClassVar[list[str]] = [
+        "playerId",
+        "season",
+        "gameTypeId",
+        "sequence",
+    ]
+
+
+class SkaterGameLogStream(LandingChildStream):
+    """Last five games of each synced skater."""
+
+    name = "skater_game_log"
+    parent_stream_type = SkatersStream
+    parent_field = "last5Games"
+    primary_keys: t.ClassVar[list[str]] = ["playerId", "gameId"]
+
+
+class GoalieGameLogStream(LandingChildStream):
+    """Last five games of each synced goalie."""
+
+    name = "goalie_game_log"
+    parent_stream_type = GoaliesStream
+    parent_field = "last5Games"
+    primary_keys: t.ClassVar[list[str]] = ["playerId", "gameId"]
+
+
+class SeasonSummaryStream(NHLStream):
+    """Per-season stat lines of every player, read from the discovery pages.
+
+    The stats API summary pages scanned to discover players hold a full stat
+    line per player and season, so this stream emits them while it performs
+    the scan, and hands the IDs it found to its landing stream. Streams sync
+    in name order, so ``*_season_summary`` runs before the landing stream it
+    feeds. Sharded runs only emit the rows of their own players.
+    """
+
+    player_stream_type: t.ClassVar[type[SkatersStream | GoaliesStream]]
+    primary_keys: t.ClassVar[list[str]] = ["playerId", "seasonId"]
+
+    def get_records(self, context: Context | None) -> t.Iterable[dict]:  # noqa: ARG002
+        """Yield the summary rows of every discovery season."""
+        players = t.cast(
+            "PlayerLandingStream",
+            self.tap.streams[self.player_stream_type.name],
+        )
+        shard = self.tap.shard
+        for row in players.iter_discovery_rows():
+            if row.get("playerId") is not None and shard.owns(row["playerId"]):
+                yield row
+
+
+class SkaterSeasonSummaryStream(SeasonSummaryStream):
+    """Season summary rows of every skater from the stats API."""
+
+    name = "skater_season_summary"
+    schema_filepath = SCHEMAS_DIR / "skater_season_summary.json"
+    player_stream_type = SkatersStream
+
+
+class GoalieSeasonSummaryStream(SeasonSummaryStream):
+    """Season summary rows of every goalie from the stats API."""
+
+    name = "goalie_season_summary"
+    schema_filepath = SCHEMAS_DIR / "goalie_season_summary.json"
+    player_stream_type = GoaliesStream
+
+
+class GamesStream(NHLStream):
+    """Games of the league schedule, read one schedule week at a time.
+
+    The sync starts from the bookmarked game date, or ``games_start_date``
+    without a bookmark, and walks forward week by week up to
+    ``games_end_date`` (today by default). The bookmark is the date of the
+    last game emitted, and that day is read again on the next run so games
+    still in progress are picked up once they finish. Finished games feed the
+    ``boxscores`` and ``play_by_play`` child streams. Sharded runs only emit
+    the games of their own shard.
+    """
+
+    name = "games"
+    path = "/v1/schedule/{date}"
+    primary_keys: t.ClassVar[list[str]] = ["id"]
+    replication_key = "gameDate"
+    records_jsonpath = "$.gameWeek[*]"
+    is_sorted = True
+    schema_filepath = SCHEMAS_DIR / "games.json"
+
+    def get_url_params(
+        self,
+        context: Context | None,  # noqa: ARG002
+        next_page_token: t.Any | None,  # noqa: ANN401, ARG002
+    ) -> dict[str, t.Any]:
+        """Return no query parameters; the schedule week is part of the path."""
+        return {}
+
+    def request_records(self, context: Context | None) -> t.Iterable[dict]:
+        """Request every schedule week of the sync window and yield its games."""
+        first_day, last_day = self._get_schedule_window(context)
+        window_start, window_end = first_day.isoformat(), last_day.isoformat()
+        decorated_request = self.request_decorator(self._request)
+        shard = self.tap.shard
+        week = first_day
+        while week <= last_day:
+            if self.tap.sync_budget.exhausted():
+                self.logger.info(
+                    "Sync time budget used up; %s resumes from %s on the next run.",
+                    self.name,
+                    week.isoformat(),
+                )
+                return
+            prepared_request = self.prepare_request(
+                {"date": week.isoformat()},
+                next_page_token=None,
+            )
+            response = decorated_request(prepared_request, context)
+            self.update_sync_costs(prepared_request, response, context)
+            for day in self.parse_response(response):
+                game_date = day.get("date")
+                if not game_date or not window_start <= game_date <= window_end:
+                    continue
+                for game in day.get("games") or []:
+                    if shard.owns(game["id"]):
+                        yield {**game, "gameDate": game_date}
+            week += timedelta(days=GAME_SCHEDULE_WEEK_DAYS)
+
+    def _get_schedule_window(self, context: Context | None) -> tuple[date, date]:
+        """Return the first and last game dates this sync covers."""
+        end_date = self.config.get("games_end_date")
+        if end_date:
+            last_day = date.fromisoformat(end_date)
+        else:
+            last_day = datetime.now(UTC).date()
+        bookmark = self.get_starting_replication_key_value(context)
+        start_date = self.config.get("games_start_date")
+        if bookmark:
+            first_day = date.fromisoformat(str(bookmark)[:10])
+            if start_date:
+                first_day = max(first_day, date.fromisoformat(start_date))
+        elif start_date:
+            first_day = date.fromisoformat(start_date)
+        else:
+            first_day = last_day - timedelta(days=GAME_SCHEDULE_LOOKBACK_DAYS)
+        return first_day, last_day
+
+    def generate_child_contexts(
+        self,
+        record: dict,
+        context: Context | None,  # noqa: ARG002
+    ) -> t.Iterable[dict | None]:
+        """Pass finished games to the child streams and skip the others."""
+        if record.get("gameState") in FINISHED_GAME_STATES:
+            yield {"game_id": record["id"]}
+
+
+class GameChildStream(NHLStream):
+    """Per-game data requested for every finished game of the ``games`` stream."""
+
+    parent_stream_type = GamesStream
+    state_partitioning_keys: t.ClassVar[list[str]] = []
+    records_jsonpath = "$"
+
+    def get_new_paginator(self) -> SinglePagePaginator:  # type: ignore[override]
+        """Return a paginator stopping after the one document of the game."""
+        return SinglePagePaginator()
+
+    def get_url_params(
+        self,
+        context: Context | None,  # noqa: ARG002
+        next_page_token: t.Any | None,  # noqa: ANN401, ARG002
+    ) -> dict[str, t.Any]:
+        """Return no query parameters; the game is part of the path."""
+        return {}
+
+
+class BoxscoresStream(GameChildStream):
+    """Team and player box scores of each finished game."""
+
+    name = "boxscores"
+    path = "/v1/gamecenter/{game_id}/boxscore"
+    primary_keys: t.ClassVar[list[str]] = ["id"]
+    schema_filepath = SCHEMAS_DIR / "boxscores.json"
+
+
+class PlayByPlayStream(GameChildStream):
+    """Every play of each finished game, one record per event.
+
+    Play-by-play documents run to several megabytes. With the ``stream-json``
+    extra installed, the response is read off the connection in chunks and
+    each play is decoded and emitted as soon as it is complete, so memory
+    stays bounded by a single play instead of the whole game. Without it the
+    document is decoded in one piece.
+    """
+
+    name = "play_by_play"
+    path = "/v1/gamecenter/{game_id}/play-by-play"
+    primary_keys: t.ClassVar[list[str]] = ["gameId", "eventId"]
+    records_jsonpath = "$.plays[*]"
+    schema_filepath = SCHEMAS_DIR / "play_by_play.json"
+
+    @cached_property
+    def requests_session(self) -> requests.Session:  # type: ignore[override]
+        """Return a streaming session when plays can be decoded incrementally."""
+        return self.tap.http_transport.session(stream=self._streaming_json)
+
+    def parse_response(self, response: requests.Response) -> t.Iterable[dict]:
+        """Yield the plays of a game, decoding them as the body arrives if possible."""
+        if not self._streaming_json:
+            yield from super().parse_response(response)
+            return
+        yield from iter_items(
+            response.iter_content(chunk_size=STREAMING_JSON_CHUNK_SIZE),
+            "plays.item",
+        )
+
+    def post_process(
+        self,
+        row: dict,
+        context: Context | None = None,
+    ) -> dict | None:
+        """Add the game ID to the play."""
+        play = super().post_process(row, context)
+        if play is not None and context:
+            play["gameId"] = context["game_id"]
+        return play
+
+    @cached_property
+    def _streaming_json(self) -> bool:
+        """Return whether plays are decoded incrementally."""
+        if streaming_json_available():
+            return True
+        self.logger.warning(
+            "ijson is not installed; play-by-play documents are decoded in one "
+            "piece. Install the stream-json extra to stream them.",
+        )
+        return False
@@ -1,15 +1,55 @@
 from __future__ import annotations
 
+import json
+import sys
+import typing as t
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
 from singer_sdk import Tap
 from singer_sdk import typing as th
 
 from tap_NHL import streams
-from tap_NHL.constants import DEFAULT_API_URL
+from tap_NHL.archive import ResponseArchive
+from tap_NHL.constants import (
+    CHECKPOINT_FLUSH_INTERVAL,
+    DEAD_LETTER_BACKOFF_SECONDS,
+    DEAD_LETTER_MAX_ATTEMPTS,
+    DEFAULT_API_URL,
+    HTTP_MAX_CONNECTIONS_PER_HOST,
+    INACTIVE_PLAYER_RECHECK_DAYS,
+    PLAYER_DISCOVERY_CACHE_TTL,
+    PLAYER_DISCOVERY_MAX_RETRIES,
+    PLAYER_DISCOVERY_MAX_WORKERS,
+    PLAYER_DISCOVERY_RANGE_SEASONS,
+    RATE_LIMIT_MAX_RPS,
+    RATE_LIMIT_MIN_RPS,
+    RATE_LIMIT_SECONDS,
+    RESPONSE_CACHE_MAX_AGE,
+    RESPONSE_CACHE_MAX_BYTES,
+    STATS_API_BASE_URL,
+)
+from tap_NHL.dead_letters import DeadLetterQueue
+from tap_NHL.discovery import DiscoveryCache, RosterDiscovery
+from tap_NHL.metrics import SyncMetrics
+from tap_NHL.scheduling import SyncBudget
+from tap_NHL.sharding import Shard
+from tap_NHL.throttle import LimiterRetry, RateLimiter
+from tap_NHL.transport import ACCEPT_ENCODINGS, HTTPTransport, enable_http2
+
+if t.TYPE_CHECKING:
+    import requests
+    from singer_sdk.streams import Stream
+
+    from tap_NHL.http_cache import ResponseCache
 
 
 class TapNHL(Tap):
 
     name = "tap-nhl"
+    _finished_streams: frozenset[str] = frozenset()
+    _sync_finished = False
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -19,6 +59,13 @@ class TapNHL(Tap):
             default=DEFAULT_API_URL,
             description="The base URL for the NHL Stats API",
         ),
+        th.Property(
+            "stats_api_url",
+            th.StringType,
+            title="Stats API URL",
+            default=STATS_API_BASE_URL,
+            description="The base URL of the stats REST API used for player discovery",
+        ),
         th.Property(
             "skater_ids",
             th.ArrayType(th.IntegerType),
@@ -49,6 +96,19 @@ class TapNHL(Tap):
             ),
             default=[],
         ),
+        th.Property(
+            "discovery_mode",
+            th.StringType,
+            title="Discovery mode",
+            description=(
+                "How players are found when no IDs are configured. 'seasons' scans "
+                "the stats API summaries of every discovery season; 'active_rosters' "
+                "reads the current roster of every team instead, for quick "
+                "refreshes of the players currently in the league."
+            ),
+            allowed_values=["seasons", "active_rosters"],
+            default="seasons",
+        ),
         th.Property(
             "discovery_seasons",
             th.ArrayType(th.IntegerType),
@@ -59,8 +119,618 @@ class TapNHL(Tap):
             ),
             default=[],
         ),
+        th.Property(
+            "discovery_concurrency",
+            th.IntegerType,
+            title="Discovery concurrency",
+            description=(
+                "Number of stats API discovery pages requested at once. Seasons and "
+                "their page offsets are fanned out over a pool of this size."
+            ),
+            default=PLAYER_DISCOVERY_MAX_WORKERS,
+        ),
+        th.Property(
+            "discovery_range_seasons",
+            th.IntegerType,
+            title="Discovery range size (seasons)",
+            description=(
+                "Most consecutive finished seasons player discovery covers with a "
+                "single aggregated range query. Ranges that come back truncated are "
+                "re-scanned season by season. Set to 1 to query every season on "
+                "its own."
+            ),
+            default=PLAYER_DISCOVERY_RANGE_SEASONS,
+        ),
+        th.Property(
+            "discovery_cache_path",
+            th.StringType,
+            title="Discovery cache path",
+            description=(
+                "Optional JSON file used to persist discovered player IDs per "
+                "endpoint and season across runs. Finished seasons are stored "
+                "permanently; leave empty to disable the cache."
+            ),
+        ),
+        th.Property(
+            "discovery_cache_ttl_seconds",
+            th.IntegerType,
+            title="Discovery cache TTL (seconds)",
+            description=(
+                "How long cached discovery results for the current or upcoming "
+                "seasons are reused before being refreshed."
+            ),
+            default=PLAYER_DISCOVERY_CACHE_TTL,
+        ),
+        th.Property(
+            "inactive_recheck_days",
+            th.IntegerType,
+            title="Inactive player re-check interval (days)",
+            description=(
+                "During incremental syncs, players whose last synced landing "
+                "record had isActive=false are skipped until this many days "
+                "have passed since they were last synced."
+            ),
+            default=INACTIVE_PLAYER_RECHECK_DAYS,
+        ),
+        th.Property(
+            "games_start_date",
+            th.DateType,
+            title="Games start date",
+            description=(
+                "First schedule date the games streams sync when there is no "
+                "bookmark yet, and the earliest date synced after one. Defaults "
+                "to a week before games_end_date."
+            ),
+        ),
+        th.Property(
+            "games_end_date",
+            th.DateType,
+            title="Games end date",
+            description=(
+                "Last schedule date the games streams sync. Defaults to today (UTC)."
+            ),
+        ),
+        th.Property(
+            "response_cache_path",
+            th.StringType,
+            title="Response cache path",
+            description=(
+                "Optional SQLite file caching landing and discovery responses. "
+                "Responses with ETag/Last-Modified are revalidated with "
+                "conditional requests. Leave empty to disable the cache."
+            ),
+        ),
+        th.Property(
+            "response_cache_max_bytes",
+            th.IntegerType,
+            title="Response cache size (bytes)",
+            description=(
+                "Total size of cached response bodies before the least recently "
+                "used entries are evicted."
+            ),
+            default=RESPONSE_CACHE_MAX_BYTES,
+        ),
+        th.Property(
+            "response_cache_max_age_seconds",
+            th.IntegerType,
+            title="Response cache max age (seconds)",
+            description=(
+                "How long cached responses without ETag/Last-Modified validators "
+                "are served without contacting the API."
+            ),
+            default=RESPONSE_CACHE_MAX_AGE,
+        ),
+        th.Property(
+            "archive_path",
+            th.StringType,
+            title="Response archive path",
+            description=(
+                "Directory of the append-only archive of raw API responses used "
+                "by archive_mode."
+            ),
+        ),
+        th.Property(
+            "archive_mode",
+            th.StringType,
+            title="Response archive mode",
+            description=(
+                "'capture' appends the body of every successful response to the "
+                "archive while syncing; 'replay' serves every request from the "
+                "archive without touching the network, for offline rebuilds."
+            ),
+            allowed_values=["off", "capture", "replay"],
+            default="off",
+        ),
+        th.Property(
+            "archive_replay_as_of",
+            th.DateTimeType,
+            title="Replay responses as of",
+            description=(
+                "Replay the latest capture of each URL fetched at or before this "
+                "time instead of the latest capture overall."
+            ),
+        ),
+        th.Property(
+            "dead_letter_mode",
+            th.StringType,
+            title="Dead-letter mode",
+            description=(
+                "'isolate' retries a skater/goalie whose landing fetch or "
+                "processing fails, then records it in dead_letter_path and "
+                "carries on with the sync. 'redrive' syncs only the players in "
+                "dead_letter_path, removing those that now succeed. 'off' lets a "
+                "failing player stop the sync."
+            ),
+            allowed_values=["off", "isolate", "redrive"],
+            default="off",
+        ),
+        th.Property(
+            "dead_letter_path",
+            th.StringType,
+            title="Dead-letter file path",
+            description="JSON file listing the players that kept failing.",
+        ),
+        th.Property(
+            "dead_letter_max_attempts",
+            th.IntegerType,
+            title="Dead-letter attempts",
+            description="Tries of a failing player before it is dead-lettered.",
+            default=DEAD_LETTER_MAX_ATTEMPTS,
+        ),
+        th.Property(
+            "dead_letter_backoff_seconds",
+            th.NumberType,
+            title="Dead-letter backoff (seconds)",
+            description=(
+                "Wait before retrying a failed player; doubles for each "
+                "further attempt."
+            ),
+            default=DEAD_LETTER_BACKOFF_SECONDS,
+        ),
+        th.Property(
+            "skip_unchanged_records",
+            th.BooleanType,
+            title="Skip unchanged records",
+            description=(
+                "Keep a fingerprint of each player's last emitted record in state "
+                "and suppress records that have not changed since the previous run."
+            ),
+            default=False,
+        ),
+        th.Property(
+            "landing_concurrency",
+            th.IntegerType,
+            title="Landing concurrency",
+            description=(
+                "Number of player landing requests kept in flight at once. "
+                "Records are still emitted in partition order. "
+                "Use 1 for serial fetching."
+            ),
+            default=1,
+        ),
+        th.Property(
+            "max_requests_per_second",
+            th.NumberType,
+            title="Max requests per second",
+            description=(
+                "Starting request rate shared by every stream, worker and "
+                "discovery call. Defaults to one request every "
+                f"{RATE_LIMIT_SECONDS} seconds; the rate then adapts between "
+                "rate_limit_min_rps and rate_limit_max_rps."
+            ),
+        ),
+        th.Property(
+            "rate_limit_min_rps",
+            th.NumberType,
+            title="Rate limit floor (requests/second)",
+            description=(
+                "Lowest rate the adaptive limiter backs off to after 429 or 5xx "
+                "responses."
+            ),
+            default=RATE_LIMIT_MIN_RPS,
+        ),
+        th.Property(
+            "rate_limit_max_rps",
+            th.NumberType,
+            title="Rate limit ceiling (requests/second)",
+            description=(
+                "Highest rate the adaptive limiter probes up to while requests "
+                "keep succeeding. Set equal to max_requests_per_second for a "
+                "fixed rate."
+            ),
+            default=RATE_LIMIT_MAX_RPS,
+        ),
+        th.Property(
+            "http_max_connections_per_host",
+            th.IntegerType,
+            title="HTTP connections per host",
+            description=(
+                "Most connections kept open to each API host, shared by every "
+                "stream, landing worker and discovery call. Workers beyond this "
+                "wait for a free connection."
+            ),
+            default=HTTP_MAX_CONNECTIONS_PER_HOST,
+        ),
+        th.Property(
+            "http_keep_alive",
+            th.BooleanType,
+            title="HTTP keep-alive",
+            description="Reuse connections between requests instead of closing them.",
+            default=True,
+        ),
+        th.Property(
+            "http_compression",
+            th.StringType,
+            title="HTTP compression",
+            description=(
+                "Response encodings to accept. 'auto' offers gzip and deflate, plus "
+                "brotli and zstd when their decoders are installed (see the brotli "
+                "extra); 'gzip' offers gzip only and 'none' asks for uncompressed "
+                "bodies."
+            ),
+            allowed_values=["auto", "gzip", "none"],
+            default="auto",
+        ),
+        th.Property(
+            "http2",
+            th.BooleanType,
+            title="HTTP/2",
+            description=(
+                "Negotiate HTTP/2 with HTTPS hosts through urllib3's experimental "
+                "support. Requires the http2 extra."
+            ),
+            default=False,
+        ),
+        th.Property(
+            "fast_json_decode",
+            th.BooleanType,
+            title="Fast JSON decode",
+            description=(
+                "Decode responses with orjson (install the fast-json extra) and "
+                "only convert the numbers the stream schema declares to Decimal. "
+                "Numbers are written in their shortest float form (0.50 as 0.5)."
+            ),
+            default=False,
+        ),
+        th.Property(
+            "conformance_mode",
+            th.StringType,
+            title="Record conformance mode",
+            description=(
+                "How records are conformed to the stream schema before they are "
+                "emitted. 'sdk' uses the SDK's generic per-record conformance, "
+                "'compiled' uses an equivalent conformer compiled once per stream, "
+                "and 'trusted' additionally passes stable stat subtrees through "
+                "without walking them."
+            ),
+            allowed_values=["sdk", "compiled", "trusted"],
+            default="sdk",
+        ),
+        th.Property(
+            "shard_index",
+            th.IntegerType,
+            title="Shard index",
+            description=(
+                "Zero-based shard handled by this tap process. Only players whose "
+                "ID hashes to this shard are synced."
+            ),
+            default=0,
+        ),
+        th.Property(
+            "shard_count",
+            th.IntegerType,
+            title="Shard count",
+            description=(
+                "Number of tap processes the player-ID space is split across. "
+                "Give every shard its own state ID and share discovery_cache_path."
+            ),
+            default=1,
+        ),
+        th.Property(
+            "checkpoint_mode",
+            th.StringType,
+            title="Checkpoint mode",
+            description=(
+                "How skaters/goalies progress is kept in state. 'partitions' keeps "
+                "one SDK state entry per player. 'compact' keeps a single compressed "
+                "checkpoint per stream whose size stays bounded, and lets an "
+                "interrupted run resume at the next unfinished player without "
+                "repeating discovery."
+            ),
+            allowed_values=["partitions", "compact"],
+            default="partitions",
+        ),
+        th.Property(
+            "checkpoint_interval_seconds",
+            th.NumberType,
+            title="Checkpoint interval (seconds)",
+            description=(
+                "In compact checkpoint mode, minimum number of seconds between "
+                "STATE messages recording sync progress."
+            ),
+            default=CHECKPOINT_FLUSH_INTERVAL,
+        ),
+        th.Property(
+            "partition_order",
+            th.StringType,
+            title="Partition order",
+            description=(
+                "Order skaters/goalies are synced in. 'priority' syncs active "
+                "players first, then players seen in the latest seasons, then "
+                "players never synced, then the rest, least recently synced "
+                "first within each group. 'player_id' keeps discovery order."
+            ),
+            allowed_values=["priority", "player_id"],
+            default="priority",
+        ),
+        th.Property(
+            "max_sync_seconds",
+            th.IntegerType,
+            title="Maximum sync duration (seconds)",
+            description=(
+                "Wall-clock budget of a sync. Once it is used up, streams stop "
+                "starting new players or schedule weeks, checkpoint their "
+                "progress and exit cleanly; the next run continues from there. "
+                "Leave empty for no limit."
+            ),
+        ),
+        th.Property(
+            "metrics_path",
+            th.StringType,
+            title="Metrics output path",
+            description=(
+                "JSON file the end-of-sync metrics (per-endpoint latency "
+                "percentiles, status and retry counts, throttle time and phase "
+                "timings) are written to. They are always logged."
+            ),
+        ),
+        th.Property(
+            "metrics_log_interval_seconds",
+            th.NumberType,
+            title="Metrics log interval (seconds)",
+            description=(
+                "Seconds between progress log lines with request counts and "
+                "latency percentiles during a sync. Leave empty to disable."
+            ),
+        ),
+        th.Property(
+            "profile_path",
+            th.StringType,
+            title="Profile output path",
+            description=(
+                "Run the sync under cProfile and write the profile to this file "
+                "for inspection with pstats or snakeviz."
+            ),
+        ),
     ).to_dict()
 
+    @cached_property
+    def http_transport(self) -> HTTPTransport:
+        """Return the connection pools shared by every HTTP session of this tap."""
+        if self.config.get("http2") and not enable_http2():
+            self.logger.warning(
+                "http2 is enabled but the h2 package is not installed; "
+                "falling back to HTTP/1.1.",
+            )
+        return HTTPTransport(
+            max_connections_per_host=self.config.get("http_max_connections_per_host")
+            or HTTP_MAX_CONNECTIONS_PER_HOST,
+            keep_alive=self.config.get("http_keep_alive", True),
+            accept_encoding=ACCEPT_ENCODINGS[
+                self.config.get("http_compression") or "auto"
+            ],
+            cache=self.response_cache,
+            limiter=self.rate_limiter,
+            metrics=self.metrics,
+            archive=self.response_archive,
+        )
+
+    @cached_property
+    def response_archive(self) -> ResponseArchive | None:
+        """Return the response archive captured or replayed by this run, if enabled."""
+        mode = self.config.get("archive_mode") or "off"
+        if mode == "off":
+            return None
+        path = self.config.get("archive_path")
+        if not path:
+            msg = "archive_mode requires archive_path."
+            raise ValueError(msg)
+        as_of = self.config.get("archive_replay_as_of")
+        archive = ResponseArchive(
+            path,
+            replay=mode == "replay",
+            as_of=datetime.fromisoformat(as_of).timestamp() if as_of else None,
+        )
+        if archive.replay:
+            self.logger.info(
+                "Replaying %d archived responses from %s.",
+                len(archive),
+                path,
+            )
+        return archive
+
+    @cached_property
+    def dead_letters(self) -> DeadLetterQueue | None:
+        """Return the dead-letter file shared by the player streams, if enabled."""
+        mode = self.config.get("dead_letter_mode") or "off"
+        if mode == "off":
+            return None
+        path = self.config.get("dead_letter_path")
+        if not path:
+            msg = "dead_letter_mode requires dead_letter_path."
+            raise ValueError(msg)
+        dead_letters = DeadLetterQueue(path)
+        if len(dead_letters):
+            self.logger.info(
+                "%d players are dead-lettered in %s.",
+                len(dead_letters),
+                path,
+            )
+        return dead_letters
+
+    @cached_property
+    def discovery_session(self) -> requests.Session:
+        """Return the session with retry/backoff shared by all discovery calls."""
+        retry = LimiterRetry(
+            total=PLAYER_DISCOVERY_MAX_RETRIES,
+            read=PLAYER_DISCOVERY_MAX_RETRIES,
+            connect=PLAYER_DISCOVERY_MAX_RETRIES,
+            backoff_factor=2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            limiter=self.rate_limiter,
+            metrics=self.metrics,
+        )
+        return self.http_transport.session(max_retries=retry)
+
+    @cached_property
+    def roster_discovery(self) -> RosterDiscovery:
+        """Return the current-roster lookup shared by the skater and goalie streams."""
+        return RosterDiscovery(
+            self.discovery_session,
+            self.config.get("api_url") or DEFAULT_API_URL,
+            max_workers=(
+                self.config.get("discovery_concurrency") or PLAYER_DISCOVERY_MAX_WORKERS
+            ),
+        )
+
+    @cached_property
+    def rate_limiter(self) -> RateLimiter:
+        """Return the request budget shared by all streams of this tap."""
+        requests_per_second = (
+            self.config.get("max_requests_per_second") or 1 / RATE_LIMIT_SECONDS
+        )
+        min_rate = self.config.get("rate_limit_min_rps") or RATE_LIMIT_MIN_RPS
+        max_rate = self.config.get("rate_limit_max_rps") or RATE_LIMIT_MAX_RPS
+        return RateLimiter(
+            requests_per_second,
+            min_rate=min(min_rate, requests_per_second),
+            max_rate=max(max_rate, requests_per_second),
+        )
+
+    @cached_property
+    def shard(self) -> Shard:
+        """Return the slice of the player-ID space this process syncs."""
+        return Shard(
+            index=self.config.get("shard_index") or 0,
+            count=self.config.get("shard_count") or 1,
+        )
+
+    @cached_property
+    def discovery_cache(self) -> DiscoveryCache | None:
+        """Return the on-disk discovery index shared by all streams, if enabled."""
+        path = self.config.get("discovery_cache_path")
+        if not path:
+            return None
+        ttl_seconds = self.config.get("discovery_cache_ttl_seconds")
+        if ttl_seconds is None:
+            ttl_seconds = PLAYER_DISCOVERY_CACHE_TTL
+        return DiscoveryCache(path, ttl_seconds=ttl_seconds)
+
+    @cached_property
+    def response_cache(self) -> ResponseCache | None:
+        """Return the HTTP response cache shared by all streams, if enabled."""
+        path = self.config.get("response_cache_path")
+        if not path:
+            return None
+        from tap_NHL.http_cache import ResponseCache  # noqa: PLC0415 - needs sqlite3
+
+        max_age_seconds = self.config.get("response_cache_max_age_seconds")
+        if max_age_seconds is None:
+            max_age_seconds = RESPONSE_CACHE_MAX_AGE
+        return ResponseCache(
+            path,
+            max_bytes=self.config.get("response_cache_max_bytes")
+            or RESPONSE_CACHE_MAX_BYTES,
+            max_age_seconds=max_age_seconds,
+        )
+
+    @cached_property
+    def metrics(self) -> SyncMetrics:
+        """Return the request and phase metrics shared by all streams of this tap."""
+        return SyncMetrics(log_interval=self.config.get("metrics_log_interval_seconds"))
+
+    @cached_property
+    def sync_budget(self) -> SyncBudget:
+        """Return the wall-clock budget shared by all streams of this run.
+
+        The clock starts when the CLI begins the sync or, for a tap synced
+        programmatically, when the first stream plans its work.
+        """
+        return SyncBudget(self.config.get("max_sync_seconds"))
+
+    def finish_stream(self, stream: Stream) -> None:
+        """Note that the SDK logged ``stream``'s sync costs, its last step.
+
+        The SDK logs the costs of every stream once all of them have synced,
+        so the sync is finished after the last one.
+        """
+        self._finished_streams = self._finished_streams | {stream.name}
+        if len(self._finished_streams) == len(self.streams):
+            self.finish_sync()
+
+    def finish_sync(self) -> None:
+        """Report the sync metrics and close the response archive, once."""
+        if self._sync_finished:
+            return
+        self._sync_finished = True
+        self._report_metrics()
+        if self.response_archive is not None:
+            self.response_archive.close()
+
+    @classmethod
+    def invoke(  # type: ignore[override]
+        cls,
+        *,
+        about: bool = False,
+        about_format: str | None = None,
+        config: tuple[str, ...] = (),
+        state: Path | None = None,
+        catalog: Path | None = None,
+    ) -> None:
+        """Invoke the tap's command line interface.
+
+        Same as the SDK's, except that the sync runs under cProfile when
+        ``profile_path`` is configured, and that a failed sync still reports
+        its metrics and closes the response archive.
+        """
+        if about:
+            cls.print_about(about_format)
+            sys.exit(0)
+        cls.print_version(print_fn=cls.logger.info)
+        config_files, parse_env_config = cls.config_from_cli_args(*config)
+        tap = cls(
+            config=config_files,  # type: ignore[arg-type]
+            state=state,
+            catalog=catalog,
+            parse_env_config=parse_env_config,
+            validate_config=True,
+        )
+        tap.sync_budget  # noqa: B018 - starts the clock
+        profile_path = tap.config.get("profile_path")
+        profiler = None
+        if profile_path:
+            import cProfile  # noqa: PLC0415 - only needed when profiling
+
+            profiler = cProfile.Profile()
+        try:
+            if profiler is None:
+                tap.sync_all()
+            else:
+                profiler.runcall(tap.sync_all)
+        finally:
+            if profiler is not None and profile_path:
+                profiler.dump_stats(profile_path)
+                tap.logger.info("Wrote sync profile to %s.", profile_path)
+            tap.finish_sync()
+
+    def _report_metrics(self) -> None:
+        """Log the sync metrics and write them to metrics_path, if configured."""
+        summary = {**self.metrics.summary(), "rate_limiter": self.rate_limiter.stats()}
+        self.logger.info("Sync metrics: %s", json.dumps(summary))
+        metrics_path = self.config.get("metrics_path")
+        if metrics_path:
+            Path(metrics_path).write_text(json.dumps(summary, indent=2) + "\n")
+
     def discover_streams(self) -> list[streams.NHLStream]:
         """Return a list of discovered streams.
 
@@ -70,6 +740,15 @@ class TapNHL(Tap):
         return [
             streams.SkatersStream(self),
             streams.GoaliesStream(self),
+            streams.SkaterSeasonTotalsStream(self),
+            streams.GoalieSeasonTotalsStream(self),
+            streams.SkaterGameLogStream(self),
+            streams.GoalieGameLogStream(self),
+            streams.SkaterSeasonSummaryStream(self),
+            streams.GoalieSeasonSummaryStream(self),
+            streams.GamesStream(self),
+            streams.BoxscoresStream(self),
+            streams.PlayByPlayStream(self),
         ]
 
 
@@ -0,0 +1,217 @@
+"""Request throttling shared by every tap-nhl stream."""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+from urllib3.util import Retry
+
+if t.TYPE_CHECKING:
+    import requests
+    from urllib3 import BaseHTTPResponse
+
+    from tap_NHL.metrics import SyncMetrics
+
+
+class RateLimiter:
+    """Thread-safe token bucket whose rate adapts to the API's responses.
+
+    The bucket refills at ``rate`` tokens per second up to ``burst`` tokens.
+    Callers take a token (going into debt if needed) under a lock and sleep
+    outside of it, so any number of worker threads share one budget.
+
+    The rate follows an additive-increase/multiplicative-decrease policy:
+    every successful response nudges it up by ``increase_step`` until
+    ``max_rate``; a ``429`` or ``5xx`` response multiplies it by
+    ``decrease_factor`` down to ``min_rate`` and honours ``Retry-After`` by
+    holding back every caller until the server's deadline.
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only tuning settings
+        self,
+        requests_per_second: float,
+        *,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+        burst: float = 1.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        decrease_cooldown: float = 1.0,
+    ) -> None:
+        """Create a new limiter.
+
+        Args:
+            requests_per_second: Starting request rate across all callers.
+            min_rate: Floor the rate never drops below. Defaults to the start rate.
+            max_rate: Ceiling the rate never exceeds. Defaults to the start rate.
+            burst: Maximum number of tokens that can accumulate while idle.
+            increase_step: Requests per second added after each success.
+            decrease_factor: Multiplier applied after a throttled or failed response.
+            decrease_cooldown: Seconds during which further failures do not
+                decrease the rate again, so one burst of 429s counts once.
+
+        Raises:
+            ValueError: If the rate bounds are not positive and ordered.
+        """
+        min_rate = requests_per_second if min_rate is None else min_rate
+        max_rate = requests_per_second if max_rate is None else max_rate
+        if not 0 < min_rate <= max_rate:
+            msg = "Rate limits must satisfy 0 < min_rate <= max_rate."
+            raise ValueError(msg)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(requests_per_second, min_rate), max_rate)
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.requests = 0
+        self.throttled_requests = 0
+        self.wait_seconds = 0.0
+        self.rate_decreases = 0
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until the caller may issue its next request.
+
+        Returns:
+            The number of seconds spent waiting for a token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            wait = max(wait, self._blocked_until - now)
+            self.requests += 1
+            if wait > 0:
+                self.throttled_requests += 1
+                self.wait_seconds += wait
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def observe(self, status_code: int, retry_after: str | None = None) -> None:
+        """Adapt the rate to a response status and optional ``Retry-After`` value."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if (
+                status_code == HTTPStatus.TOO_MANY_REQUESTS
+                or status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+            ):
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                    self.rate_decreases += 1
+                    self._last_decrease = now
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    self._blocked_until = max(self._blocked_until, now + delay)
+            elif status_code < HTTPStatus.BAD_REQUEST:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def observe_response(
+        self,
+        response: requests.Response | BaseHTTPResponse,
+    ) -> None:
+        """Adapt the rate to a ``requests`` or ``urllib3`` response."""
+        status_code = getattr(response, "status_code", None)
+        if status_code is None:
+            status_code = t.cast("BaseHTTPResponse", response).status
+        self.observe(status_code, response.headers.get("Retry-After"))
+
+    def stats(self) -> dict[str, float | int]:
+        """Return counters describing how much time went to throttling."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled_requests": self.throttled_requests,
+                "throttle_wait_seconds": round(self.wait_seconds, 3),
+                "rate_decreases": self.rate_decreases,
+                "current_rate": round(self.rate, 3),
+            }
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class LimiterRetry(Retry):
+    """urllib3 retry policy that reports retried responses to a rate limiter.
+
+    Retries happen inside urllib3 and never reach the session adapter, so the
+    limiter would otherwise not learn about intermediate ``429``/``5xx`` answers
+    nor spend a token on the retried request. Each retry takes a token after
+    its backoff sleep, right before it is sent.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        limiter: RateLimiter | None = None,
+        metrics: SyncMetrics | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """Create a retry policy bound to ``limiter`` and reporting to ``metrics``."""
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+        self.metrics = metrics
+        self.retried_url: str | None = None
+
+    def new(self, **kw: t.Any) -> LimiterRetry:  # noqa: D102
+        retry = super().new(**kw)
+        retry.limiter = self.limiter
+        retry.metrics = self.metrics
+        return retry
+
+    def increment(  # noqa: D102
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> LimiterRetry:
+        response = kwargs.get("response")
+        if self.limiter is not None and response is not None:
+            self.limiter.observe_response(response)
+        if self.metrics is not None and url is not None:
+            self.metrics.observe_retry(
+                url,
+                status_code=response.status if response is not None else None,
+            )
+        retry = super().increment(method, url, *args, **kwargs)
+        retry.retried_url = url
+        return retry
+
+    def sleep(self, response: BaseHTTPResponse | None = None) -> None:  # noqa: D102
+        started = time.perf_counter()
+        super().sleep(response)
+        if self.limiter is not None:
+            self.limiter.acquire()
+        if self.metrics is not None and self.retried_url is not None:
+            slept = time.perf_counter() - started
+            self.metrics.observe_retry_sleep(self.retried_url, slept)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the delay in seconds encoded in a ``Retry-After`` header."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
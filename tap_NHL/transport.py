@@ -0,0 +1,331 @@
+"""HTTP transport shared by landing and discovery requests."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import typing as t
+from http import HTTPStatus
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.util.request import ACCEPT_ENCODING
+
+from tap_NHL.constants import HTTP_MAX_CONNECTIONS_PER_HOST, HTTP_MAX_HOSTS
+
+if t.TYPE_CHECKING:
+    from urllib3.util import Retry
+
+    from tap_NHL.archive import ResponseArchive
+    from tap_NHL.http_cache import ResponseCache
+    from tap_NHL.metrics import SyncMetrics
+    from tap_NHL.throttle import RateLimiter
+
+# Accept-Encoding values of the http_compression setting. "auto" offers every
+# encoding urllib3 can decode here (brotli and zstd only when installed).
+ACCEPT_ENCODINGS = {
+    "auto": ACCEPT_ENCODING,
+    "gzip": "gzip",
+    "none": "identity",
+}
+
+_http2_lock = threading.Lock()
+_http2_enabled = False
+
+
+def enable_http2() -> bool:
+    """Let urllib3 negotiate HTTP/2 for HTTPS connections, if ``h2`` is installed.
+
+    urllib3's HTTP/2 support is process-wide and experimental; it still uses
+    one request per connection at a time. Returns whether it is enabled.
+    """
+    global _http2_enabled  # noqa: PLW0603
+    with _http2_lock:
+        if not _http2_enabled:
+            try:
+                from urllib3.http2 import inject_into_urllib3  # noqa: PLC0415 - optional
+            except ImportError:
+                return False
+            try:
+                inject_into_urllib3()
+            except ImportError:
+                return False
+            _http2_enabled = True
+    return True
+
+
+class HTTPTransport:
+    """Connection pools and content negotiation shared by every session of the tap.
+
+    Every session handed out shares one urllib3 pool manager, so a keep-alive
+    connection opened by one stream or by discovery is reused by all of them
+    instead of paying for another TCP and TLS handshake. Each host gets one
+    pool of at most ``max_connections_per_host`` connections; threads beyond
+    that wait for a free connection rather than opening throwaway ones.
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only shared resources
+        self,
+        *,
+        max_connections_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_hosts: int = HTTP_MAX_HOSTS,
+        keep_alive: bool = True,
+        accept_encoding: str = ACCEPT_ENCODING,
+        cache: ResponseCache | None = None,
+        limiter: RateLimiter | None = None,
+        metrics: SyncMetrics | None = None,
+        archive: ResponseArchive | None = None,
+    ) -> None:
+        """Create the shared pools.
+
+        Args:
+            max_connections_per_host: Connection limit of each host's pool.
+            max_hosts: Number of host pools kept before the least recently
+                used one is closed.
+            keep_alive: Whether connections are kept open between requests.
+            accept_encoding: ``Accept-Encoding`` header sent with every request.
+            cache: Optional response cache consulted for ``GET`` requests.
+            limiter: Optional rate limiter shared by every request.
+            metrics: Optional collector of per-endpoint request statistics.
+            archive: Optional archive capturing responses, or replaying them.
+        """
+        self.max_connections_per_host = max(max_connections_per_host, 1)
+        self.max_hosts = max(max_hosts, 1)
+        self.keep_alive = keep_alive
+        self.accept_encoding = accept_encoding
+        self.cache = cache
+        self.limiter = limiter
+        self.metrics = metrics
+        self.archive = archive
+        self.poolmanager = PoolManager(
+            num_pools=self.max_hosts,
+            maxsize=self.max_connections_per_host,
+            block=True,
+        )
+
+    def adapter(self, *, max_retries: Retry | int = 0) -> NHLHTTPAdapter:
+        """Return an adapter on the shared pools with its own retry policy."""
+        return NHLHTTPAdapter(
+            max_retries=max_retries,
+            pool_connections=self.max_hosts,
+            pool_maxsize=self.max_connections_per_host,
+            pool_block=True,
+            poolmanager=self.poolmanager,
+            cache=self.cache,
+            limiter=self.limiter,
+            metrics=self.metrics,
+            archive=self.archive,
+        )
+
+    def session(
+        self,
+        *,
+        max_retries: Retry | int = 0,
+        stream: bool = False,
+    ) -> requests.Session:
+        """Return a new session sending its requests through the shared pools.
+
+        With ``stream``, response bodies are left on the connection until they
+        are read, so they can be decoded as they arrive.
+        """
+        session = requests.Session()
+        session.stream = stream
+        adapter = self.adapter(max_retries=max_retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Accept-Encoding"] = self.accept_encoding
+        # Session.request() swaps verify=True for the environment's CA bundle
+        # but Session.send(), used by the SDK, does not; the two would key
+        # separate pools for the same host and never share connections.
+        session.verify = (
+            os.environ.get("REQUESTS_CA_BUNDLE")
+            or os.environ.get("CURL_CA_BUNDLE")
+            or True
+        )
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.poolmanager.clear()
+
+
+class NHLHTTPAdapter(HTTPAdapter):
+    """Adapter adding response caching and throttling beneath a session.
+
+    Cached entries without validators are served while younger than the cache
+    max-age. Entries carrying an ``ETag`` or ``Last-Modified`` header are
+    revalidated with a conditional request, and a ``304 Not Modified`` answer
+    is replaced by the cached body. The rate limiter is only consulted when a
+    request actually goes out on the network, and it is fed every response
+    status so it can adapt the shared request rate. With ``metrics``, every
+    network response and cache hit is recorded per endpoint. Adapters given a
+    ``poolmanager`` send through it instead of owning their connection pools.
+
+    With a capturing ``archive``, the body of every successful ``GET`` is
+    also archived, whether it came from the network or the cache. With a
+    replaying one, responses come from the archive alone; requests it holds
+    no capture for are answered ``404`` without touching the network.
+    """
+
+    def __init__(
+        self,
+        *args: t.Any,
+        poolmanager: PoolManager | None = None,
+        cache: ResponseCache | None = None,
+        limiter: RateLimiter | None = None,
+        metrics: SyncMetrics | None = None,
+        archive: ResponseArchive | None = None,
+        **kwargs: t.Any,
+    ) -> None:
+        """Create a new adapter.
+
+        Args:
+            *args: Positional arguments for :class:`requests.adapters.HTTPAdapter`.
+            poolmanager: Optional pool manager shared with other adapters.
+            cache: Optional response cache consulted for ``GET`` requests.
+            limiter: Optional rate limiter shared with the tap's other sessions.
+            metrics: Optional collector of per-endpoint request statistics.
+            archive: Optional archive capturing responses, or replaying them.
+            **kwargs: Keyword arguments for :class:`requests.adapters.HTTPAdapter`.
+        """
+        self.shared_poolmanager = poolmanager
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.limiter = limiter
+        self.metrics = metrics
+        self.archive = archive
+
+    def init_poolmanager(  # noqa: D102
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,  # noqa: FBT001, FBT002
+        **pool_kwargs: t.Any,
+    ) -> None:
+        if self.shared_poolmanager is None:
+            super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+            return
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = self.shared_poolmanager
+
+    def close(self) -> None:
+        """Close the adapter, leaving shared pools to their owner."""
+        if self.shared_poolmanager is None:
+            super().close()
+            return
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+    def send(  # type: ignore[override]
+        self,
+        request: requests.PreparedRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> requests.Response:
+        """Replay or archive the response, sending it or serving it from the cache."""
+        if self.archive is not None and self.archive.replay:
+            return self._replay(request)
+        response = self._send(request, *args, **kwargs)
+        if (
+            self.archive is not None
+            and request.method == "GET"
+            and response.status_code == HTTPStatus.OK
+        ):
+            self.archive.append(response, streamed=kwargs.get("stream", False))
+        return response
+
+    def _replay(self, request: requests.PreparedRequest) -> requests.Response:
+        """Answer a request from the replayed archive."""
+        response = self.archive.get(request)  # type: ignore[union-attr]
+        if response is None:
+            response = requests.Response()
+            response.status_code = HTTPStatus.NOT_FOUND
+            response.reason = "Not in the replayed archive"
+            response.url = request.url or ""
+            response.request = request
+            response._content = b""  # noqa: SLF001
+        elif self.metrics is not None:
+            self.metrics.observe_cache_hit(response.url)
+        return response
+
+    def _send(  # noqa: C901 - cache, replay and metrics paths read best together
+        self,
+        request: requests.PreparedRequest,
+        *args: t.Any,
+        **kwargs: t.Any,
+    ) -> requests.Response:
+        """Serve from the cache when possible, otherwise send the request.
+
+        Streamed requests bypass the cache: storing or serving a cached body
+        would hold the whole document in memory.
+        """
+        url = request.url or ""
+        entry = None
+        cache = (
+            self.cache
+            if request.method == "GET" and not kwargs.get("stream", False)
+            else None
+        )
+        if cache is not None:
+            entry = cache.get(url)
+            if (
+                entry is not None
+                and not entry.has_validators
+                and entry.age() < cache.max_age_seconds
+            ):
+                if self.metrics is not None:
+                    self.metrics.observe_cache_hit(url)
+                return entry.to_response(request)
+            if entry is not None and entry.has_validators:
+                request = request.copy()
+                request.headers.update(entry.conditional_headers())
+
+        throttle_wait = self.limiter.acquire() if self.limiter is not None else 0.0
+        started = time.perf_counter()
+        response = super().send(request, *args, **kwargs)
+        response.throttle_wait_seconds = throttle_wait  # type: ignore[attr-defined]
+        if self.limiter is not None:
+            self.limiter.observe_response(response)
+        if self.metrics is not None:
+            self._observe(response, kwargs.get("stream", False), started, throttle_wait)
+
+        if cache is None:
+            return response
+        if response.status_code == HTTPStatus.NOT_MODIFIED and entry is not None:
+            response.close()
+            cache.touch(url)
+            if self.metrics is not None:
+                self.metrics.observe_cache_hit(url)
+            return entry.to_response(request)
+        if response.status_code == HTTPStatus.OK:
+            cache.put(url, response)
+        return response
+
+    def _observe(
+        self,
+        response: requests.Response,
+        stream: bool,  # noqa: FBT001
+        started: float,
+        throttle_wait: float,
+    ) -> None:
+        """Record the response, reading the body first unless it is streamed."""
+        size = wire_size = 0
+        if not stream:
+            size = len(response.content)
+            tell = getattr(response.raw, "tell", None)
+            wire_size = tell() if tell is not None else size
+        self.metrics.observe_response(  # type: ignore[union-attr]
+            response.url or "",
+            response.status_code,
+            seconds=time.perf_counter() - started,
+            size=size,
+            wire_size=wire_size,
+            rate_limit_wait=throttle_wait,
+        )
+
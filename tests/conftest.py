@@ -0,0 +1,78 @@
+"""Shared fixtures for the offline tests."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import typing as t
+
+import pytest
+
+from tap_NHL.client import NHLStream
+from tap_NHL.tap import TapNHL
+
+
+class SyncResult(t.NamedTuple):
+    """What a test sync emitted."""
+
+    tap: TapNHL
+    records: dict[str, list[dict]]
+    state: dict | None
+
+    def player_ids(self, stream: str = "skaters") -> list[int]:
+        """Return the player IDs of ``stream``'s records in emitted order."""
+        return [record["playerId"] for record in self.records.get(stream, [])]
+
+
+@pytest.fixture
+def run_sync(capsys):
+    """Return a function syncing streams of a new tap and parsing its output.
+
+    The function takes the tap's config and state, the streams to sync and
+    the exception the sync is expected to raise. It returns the records by
+    stream and the last ``STATE`` message.
+    """
+
+    def run(
+        config: dict,
+        state: dict | None = None,
+        *,
+        streams: t.Iterable[str] = ("skaters",),
+        raises: type[Exception] | None = None,
+    ) -> SyncResult:
+        tap = TapNHL(config=config, state=state)
+        with pytest.raises(raises) if raises else contextlib.nullcontext():
+            for name in streams:
+                tap.streams[name].sync()
+        records: dict[str, list[dict]] = {}
+        states = []
+        for line in capsys.readouterr().out.splitlines():
+            message = json.loads(line)
+            if message["type"] == "RECORD":
+                records.setdefault(message["stream"], []).append(message["record"])
+            elif message["type"] == "STATE":
+                states.append(message["value"])
+        return SyncResult(tap, records, states[-1] if states else None)
+
+    return run
+
+
+@pytest.fixture
+def fake_landing(monkeypatch):
+    """Give every player an inactive landing record instead of calling the API.
+
+    Returns the options of the fake: ``crash_at`` is a player whose fetch
+    fails, and the sync budget runs out after the player in ``stop_after``.
+    """
+    options: dict[str, int | None] = {"crash_at": None, "stop_after": None}
+
+    def get_records(self, context):
+        player_id = context["player_id"]
+        if player_id == options["crash_at"]:
+            raise RuntimeError("connection lost")
+        yield {"playerId": player_id, "isActive": False, "lastGameDate": "2025-01-07"}
+        if player_id == options["stop_after"]:
+            self.tap.sync_budget.max_seconds = 0
+
+    monkeypatch.setattr(NHLStream, "get_records", get_records, raising=False)
+    return options
@@ -0,0 +1,72 @@
+"""Landing payloads and the former locale handling, shared by tests and benchmarks."""
+
+from __future__ import annotations
+
+LOCALE_FIELDS = [
+    "fullTeamName",
+    "teamCommonName",
+    "teamPlaceNameWithPreposition",
+    "firstName",
+    "lastName",
+    "birthCity",
+    "birthStateProvince",
+]
+
+
+def extract_default_locale(value):
+    """Former ``PlayerLandingStream._extract_default_locale``."""
+    if isinstance(value, dict):
+        for key in ("default", "en", "eng"):
+            if key in value and value[key]:
+                return value[key]
+        for val in value.values():
+            if val:
+                return val
+        return None
+    return value
+
+
+def legacy_normalize(row):
+    """Former ``PlayerLandingStream.post_process`` locale handling."""
+    for field in LOCALE_FIELDS:
+        if field in row:
+            row[field] = extract_default_locale(row.get(field))
+    for entry in row.get("seasonTotals") or []:
+        for nested_field in ("teamName", "teamCommonName", "teamPlaceNameWithPreposition"):
+            if nested_field in entry:
+                entry[nested_field] = extract_default_locale(entry.get(nested_field))
+    return row
+
+
+def make_landing(seasons=40):
+    """Return a landing payload shaped like a long-career skater's."""
+    def name(text):
+        return {"default": text, "fr": text, "cs": text}
+
+    return {
+        "playerId": 8471214,
+        "isActive": True,
+        "fullTeamName": name("Washington Capitals"),
+        "teamCommonName": name("Capitals"),
+        "teamPlaceNameWithPreposition": name("Washington"),
+        "firstName": name("Alex"),
+        "lastName": name("Ovechkin"),
+        "birthCity": name("Moscow"),
+        "badges": [{"logoUrl": name("https://example"), "title": name("Top 100")}],
+        "draftDetails": {"year": 2004, "teamAbbrev": "WSH", "round": 1},
+        "last5Games": [
+            {"gameDate": f"2025-01-0{day}", "opponentAbbrev": "NYR", "goals": 1}
+            for day in range(1, 6)
+        ],
+        "seasonTotals": [
+            {
+                "season": 20052006 + 10001 * index,
+                "goals": 40,
+                "leagueAbbrev": "NHL",
+                "teamName": name("Washington Capitals"),
+                "teamCommonName": name("Capitals"),
+                "teamPlaceNameWithPreposition": name("Washington"),
+            }
+            for index in range(seasons)
+        ],
+    }
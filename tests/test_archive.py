@@ -0,0 +1,103 @@
+"""Offline tests for capturing and replaying raw API responses."""
+
+import threading
+
+import requests
+
+from benchmarks.fake_api import Dataset, FakeNHLAPI, ServerOptions
+from tap_NHL.archive import INDEX_FILE, ResponseArchive
+
+DATASET = Dataset(skaters=12, goalies=2, seasons=(20232024, 20242025), plays_per_game=40)
+
+
+def sync(run_sync, config):
+    """Sync skaters and games with ``config``, close the archive and return the records."""
+    config = {
+        "discovery_seasons": list(DATASET.seasons),
+        "games_start_date": "2025-01-01",
+        "games_end_date": "2025-01-03",
+        "max_requests_per_second": 1000,
+        "rate_limit_max_rps": 1000,
+        **config,
+    }
+    result = run_sync(config, streams=("skaters", "games"))
+    result.tap.response_archive.close()
+    return result.records
+
+
+def test_replay_rebuilds_the_same_records_offline(tmp_path, run_sync):
+    """Confirm that a replayed archive emits exactly the captured run's records"""
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    archive = {"archive_path": str(tmp_path / "archive")}
+    try:
+        captured = sync(
+            run_sync,
+            {
+                **archive,
+                "archive_mode": "capture",
+                "api_url": server.url,
+                "stats_api_url": f"{server.url}/stats/rest/en",
+            },
+        )
+        requests_sent = server.snapshot()["requests"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    replayed = sync(
+        run_sync,
+        {
+            **archive,
+            "archive_mode": "replay",
+            "api_url": server.url,
+            "stats_api_url": f"{server.url}/stats/rest/en",
+        },
+    )
+
+    assert set(captured) >= {"skaters", "games", "play_by_play"}
+    assert replayed == captured, "❌ Replayed records differ from the captured run."
+    index = (tmp_path / "archive" / INDEX_FILE).read_text().splitlines()
+    assert len(index) == requests_sent, "❌ Not every response was archived."
+
+
+def test_replay_ignores_a_capture_cut_short(tmp_path, run_sync):
+    """Confirm that a torn index line from an interrupted capture is skipped"""
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = {
+        "archive_path": str(tmp_path / "archive"),
+        "api_url": server.url,
+        "stats_api_url": f"{server.url}/stats/rest/en",
+        "skater_ids": [DATASET.skater_ids[0]],
+    }
+    try:
+        captured = sync(run_sync, {**config, "archive_mode": "capture"})
+    finally:
+        server.shutdown()
+        server.server_close()
+    with (tmp_path / "archive" / INDEX_FILE).open("a") as index:
+        index.write('{"url": "http://127.0.0.1/v1/player/1/lan')
+
+    assert sync(run_sync, {**config, "archive_mode": "replay"}) == captured
+
+
+def test_streamed_bodies_are_captured_as_they_are_read(tmp_path):
+    """Confirm that a streamed body is archived only once the consumer has read it"""
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        archive = ResponseArchive(tmp_path / "archive")
+        url = f"{server.url}/v1/gamecenter/202501011/play-by-play"
+        response = requests.get(url, stream=True, timeout=10)
+        archive.append(response, streamed=True)
+        assert not (tmp_path / "archive" / INDEX_FILE).read_text(), "❌ Body was read up front."
+        body = b"".join(response.iter_content(1024))
+        archive.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    replay = ResponseArchive(tmp_path / "archive", replay=True)
+    replayed = replay.get(requests.Request("GET", response.url).prepare())
+    assert replayed.content == body, "❌ Streamed capture differs from the body read."
@@ -0,0 +1,53 @@
+"""Offline tests for BATCH message output."""
+
+import gzip
+import json
+
+from tap_NHL.tap import TapNHL
+
+RECORD = {"playerId": 1, "isActive": True, "lastGameDate": "2025-01-07", "undeclared": 1}
+
+
+def sync_skaters(config, capsys, monkeypatch):
+    """Sync the skaters stream with a fixed landing record and return its messages."""
+    skaters = TapNHL(config=config).streams["skaters"]
+    monkeypatch.setattr(
+        skaters, "get_records", lambda context: iter([{**RECORD, "playerId": context["player_id"]}]),
+    )
+    skaters.sync()
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_landing_records_are_written_to_gzipped_jsonl_batches(tmp_path, capsys, monkeypatch):
+    """Confirm that only BATCH manifests reach stdout and files hold the RECORD mode rows"""
+    config = {"skater_ids": [1, 2]}
+    records = [
+        message["record"]
+        for message in sync_skaters(config, capsys, monkeypatch)
+        if message["type"] == "RECORD" and message["stream"] == "skaters"
+    ]
+    batch_config = {
+        "encoding": {"format": "jsonl", "compression": "gzip"},
+        "storage": {"root": f"file://{tmp_path}/batches"},
+        "batch_size": 1,
+    }
+    messages = sync_skaters({**config, "batch_config": batch_config}, capsys, monkeypatch)
+    batches = [message for message in messages if message["type"] == "BATCH"]
+
+    assert not [m for m in messages if m["type"] == "RECORD"], "❌ RECORD messages emitted."
+    assert len(batches) == 2, "❌ batch_size was not honoured."
+    rows = []
+    for batch in batches:
+        for path in batch["manifest"]:
+            with gzip.open(path.removeprefix("file://"), "rt") as batch_file:
+                rows.extend(json.loads(line) for line in batch_file)
+    assert len(records) == 2, "❌ RECORD mode did not emit every player."
+    assert rows == records, "❌ Batch rows differ from RECORD output."
+
+
+def test_child_streams_do_not_batch(tmp_path):
+    """Confirm that per-player child streams keep emitting RECORD messages"""
+    config = {"batch_config": {"encoding": {"format": "jsonl"}, "storage": {"root": f"file://{tmp_path}"}}}
+    tap = TapNHL(config=config)
+    assert tap.streams["skaters"].get_batch_config(tap.config) is not None
+    assert tap.streams["skater_season_totals"].get_batch_config(tap.config) is None
@@ -0,0 +1,53 @@
+"""Offline tests for compact, crash-resumable checkpoints."""
+
+from datetime import UTC, datetime
+
+from tap_NHL.checkpoint import decode_ids, encode_ids
+from tap_NHL.streams import PlayerLandingStream
+
+PLAYER_IDS = [8478402, 8471214, 8476945, 8480069]
+CONFIG = {"checkpoint_mode": "compact", "checkpoint_interval_seconds": 0}
+
+
+def test_ids_round_trip_compactly():
+    """Confirm that encoded IDs decode in order and take about a byte per player"""
+    player_ids = sorted(range(8440000, 8490000, 7)) + [8444444, 12]
+    encoded = encode_ids(player_ids)
+    assert decode_ids(encoded) == player_ids, "❌ IDs did not round-trip."
+    assert len(encoded) < len(player_ids), f"❌ Encoding is too large: {len(encoded)} chars."
+
+
+def test_interrupted_run_resumes_without_discovery(run_sync, fake_landing, monkeypatch):
+    """Confirm that a restarted run continues at the next unfinished player"""
+    monkeypatch.setattr(PlayerLandingStream, "_fetch_all_player_ids", lambda self: PLAYER_IDS)
+    fake_landing["crash_at"] = PLAYER_IDS[2]
+    result = run_sync(CONFIG, raises=RuntimeError)
+    assert result.player_ids() == PLAYER_IDS[:2]
+
+    def no_discovery(self):
+        raise AssertionError("❌ Discovery was repeated.")
+
+    monkeypatch.setattr(PlayerLandingStream, "_fetch_all_player_ids", no_discovery)
+    fake_landing["crash_at"] = None
+    result = run_sync(CONFIG, result.state)
+    assert result.player_ids() == PLAYER_IDS[2:], "❌ Resumed run did not start at the unfinished player."
+    checkpoint = result.state["bookmarks"]["skaters"]["checkpoint"]
+    assert "run" not in checkpoint, "❌ Finished run was kept in state."
+    assert sorted(decode_ids(next(iter(checkpoint["inactive"].values())))) == sorted(PLAYER_IDS)
+
+
+def test_per_player_state_is_migrated(run_sync, fake_landing):
+    """Confirm that partition state is folded into the checkpoint and still skips players"""
+    synced_at = datetime.now(UTC).isoformat()
+    partitions = [
+        {"context": {"player_id": 1}, "is_active": False, "last_synced_at": synced_at,
+         "replication_key": "lastGameDate", "replication_key_value": "2024-04-18"},
+        {"context": {"player_id": 2}, "is_active": True, "last_synced_at": synced_at},
+    ]
+    state = {"bookmarks": {"skaters": {"partitions": partitions}}}
+    result = run_sync({**CONFIG, "skater_ids": [1, 2]}, state)
+
+    skaters_state = result.state["bookmarks"]["skaters"]
+    assert result.player_ids() == [2], "❌ Recently synced inactive player was not skipped."
+    assert "partitions" not in skaters_state, "❌ Per-player entries were kept."
+    assert skaters_state["replication_key_value"] == "2025-01-07"
@@ -0,0 +1,41 @@
+"""Offline tests for the child streams built from landing records."""
+
+from tap_NHL.tap import TapNHL
+
+LANDING = {
+    "playerId": 8478402,
+    "seasonTotals": [
+        {"season": 20232024, "gameTypeId": 2, "sequence": 1, "teamName": "Edmonton Oilers", "goals": 32},
+        {"season": 20232024, "gameTypeId": 3, "sequence": 1, "teamName": "Edmonton Oilers", "goals": 8},
+    ],
+    "last5Games": [{"gameId": 2024020001, "gameDate": "2025-01-07", "goals": 1}],
+}
+
+
+def test_child_streams_reuse_the_parent_landing_record():
+    """Confirm that season totals and game logs come from the fetched landing record"""
+    tap = TapNHL(config={"skater_ids": [8478402]})
+    skaters = tap.streams["skaters"]
+    context = skaters.get_child_context(LANDING, {"player_id": 8478402})
+
+    seasons = list(tap.streams["skater_season_totals"].get_records(context))
+    games = list(tap.streams["skater_game_log"].get_records(context))
+
+    assert [row["gameTypeId"] for row in seasons] == [2, 3], "❌ Season rows not emitted."
+    assert all(row["playerId"] == 8478402 for row in seasons + games), "❌ playerId missing."
+    assert games == [{"playerId": 8478402, **LANDING["last5Games"][0]}]
+
+
+def test_child_streams_ignore_a_stale_parent_record():
+    """Confirm that rows are not emitted for a different player than the parent's"""
+    tap = TapNHL(config={"skater_ids": [8478402]})
+    tap.streams["skaters"].get_child_context(LANDING, {"player_id": 8478402})
+    assert list(tap.streams["skater_game_log"].get_records({"player_id": 1})) == []
+
+
+def test_child_schemas_extend_the_parent_item_schema():
+    """Confirm that child schemas are keyed by playerId plus the item fields"""
+    tap = TapNHL(config={"goalie_ids": [1]})
+    schema = tap.streams["goalie_season_totals"].schema
+    assert list(schema["properties"])[0] == "playerId"
+    assert "savePctg" in schema["properties"], "❌ Goalie item fields missing."
@@ -0,0 +1,89 @@
+"""Offline tests for the shared rate limiter and the landing prefetcher."""
+
+import threading
+import time
+
+from tap_NHL.prefetch import OrderedPrefetcher
+from tap_NHL.throttle import LimiterRetry, RateLimiter
+
+
+def test_rate_limiter_shares_budget_across_threads():
+    """Confirm that concurrent callers are spaced by the global interval"""
+    limiter = RateLimiter(requests_per_second=50)
+    interval = 1 / limiter.rate
+    stamps: list[float] = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+            with lock:
+                stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stamps.sort()
+    elapsed = stamps[-1] - stamps[0]
+    assert elapsed >= interval * (len(stamps) - 1) * 0.9, "❌ Limiter let requests through too fast."
+
+
+def test_rate_limiter_adapts_to_throttling():
+    """Confirm that 429s cut the rate and successes raise it within bounds"""
+    limiter = RateLimiter(4, min_rate=1, max_rate=5, increase_step=0.5)
+    limiter.observe(429, retry_after="0")
+    assert limiter.rate == 2, "❌ Rate was not halved after a 429."
+    limiter.observe(503)
+    assert limiter.rate == 2, "❌ Cooldown did not absorb the burst of failures."
+    for _ in range(10):
+        limiter.observe(200)
+    assert limiter.rate == 5, "❌ Rate exceeded the configured ceiling."
+    assert limiter.stats()["rate_decreases"] == 1
+
+
+def test_retry_after_blocks_every_caller():
+    """Confirm that Retry-After holds back the next request"""
+    limiter = RateLimiter(1000, min_rate=1, max_rate=1000)
+    limiter.observe(429, retry_after="0.2")
+    assert limiter.acquire() >= 0.15, "❌ Retry-After was ignored."
+    assert limiter.stats()["throttle_wait_seconds"] >= 0.15
+
+
+def test_urllib3_retries_take_a_limiter_token():
+    """Confirm that a retry sent by urllib3 is counted against the shared budget"""
+    limiter = RateLimiter(1000, min_rate=1, max_rate=1000)
+    retry = LimiterRetry(total=2, backoff_factor=0, limiter=limiter)
+    retry = retry.increment("GET", "/v1/standings/now")
+    retry.sleep()
+    assert limiter.stats()["requests"] == 1, "❌ Retried request skipped the limiter."
+
+
+def test_prefetcher_returns_results_in_request_order():
+    """Confirm that slow early fetches do not reorder results"""
+    def fetch(key):
+        time.sleep(0.01 * (5 - key))
+        return key * 10
+
+    prefetcher = OrderedPrefetcher(range(6), fetch, max_workers=3)
+    assert [prefetcher.get(key) for key in range(6)] == [0, 10, 20, 30, 40, 50], "❌ Results out of order."
+
+
+def test_prefetcher_reraises_fetch_errors():
+    """Confirm that a failed fetch surfaces to the consumer"""
+    def fetch(key):
+        if key == 1:
+            raise RuntimeError("boom")
+        return key
+
+    prefetcher = OrderedPrefetcher([0, 1, 2], fetch, max_workers=2)
+    assert prefetcher.get(0) == 0
+    try:
+        prefetcher.get(1)
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("❌ Fetch error was swallowed.")
+    assert prefetcher.get(2) == 2
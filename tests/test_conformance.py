@@ -0,0 +1,73 @@
+"""Offline tests for the compiled record conformer."""
+
+import copy
+
+from singer_sdk.helpers._typing import TypeConformanceLevel, _conform_record_data_types
+
+from tap_NHL.conformance import compile_record_conformer
+from tap_NHL.tap import TapNHL
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "playerId": {"type": "integer"},
+        "isActive": {"type": ["boolean", "null"]},
+        "firstName": {"type": ["string", "object", "null"]},
+        "draftDetails": {
+            "type": ["object", "null"],
+            "properties": {"year": {"type": ["integer", "null"]}},
+        },
+        "seasonTotals": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "additionalProperties": True,
+                "properties": {"goals": {"type": ["number", "null"]}},
+            },
+        },
+    },
+}
+
+RECORD = {
+    "playerId": 8478402,
+    "isActive": 1,
+    "firstName": {"default": "Connor"},
+    "draftDetails": {"year": 2015, "teamAbbrev": "EDM"},
+    "seasonTotals": [{"goals": 48, "shootingPctg": 0.17}, {"goals": 52}],
+    "extra": "dropped",
+}
+
+
+def test_compiled_conformer_matches_sdk_conformance():
+    """Confirm that the compiled conformer returns the SDK's record and unmapped paths"""
+    expected = _conform_record_data_types(
+        copy.deepcopy(RECORD), SCHEMA, TypeConformanceLevel.RECURSIVE, None,
+    )
+    actual = compile_record_conformer(SCHEMA)(copy.deepcopy(RECORD))
+
+    assert actual == expected, "❌ Compiled conformance differs from the SDK."
+    assert actual[0]["isActive"] is True, "❌ Boolean was not conformed."
+    assert "teamAbbrev" not in actual[0]["draftDetails"], "❌ Unmapped property kept."
+
+
+def test_trusted_properties_pass_through_unchanged():
+    """Confirm that trusted subtrees are not walked"""
+    conform = compile_record_conformer(SCHEMA, trusted_properties=["draftDetails"])
+    record, unmapped = conform(copy.deepcopy(RECORD))
+
+    assert record["draftDetails"] == RECORD["draftDetails"], "❌ Trusted subtree was conformed."
+    assert "draftDetails.teamAbbrev" not in unmapped
+
+
+def test_compiled_mode_replaces_sdk_conformance_on_streams():
+    """Confirm that streams emit identical records in every conformance mode"""
+    record = {"playerId": 8478402, "isActive": True, "lastGameDate": "2025-01-07"}
+    messages = {}
+    for mode in ("sdk", "compiled", "trusted"):
+        tap = TapNHL(config={"skater_ids": [1], "conformance_mode": mode})
+        skaters = tap.streams["skaters"]
+        (message,) = skaters._generate_record_messages(dict(record))
+        messages[mode] = message.record
+
+    assert messages["compiled"] == messages["sdk"] == messages["trusted"], "❌ Modes emit different records."
+    assert skaters.TYPE_CONFORMANCE_LEVEL == TypeConformanceLevel.NONE
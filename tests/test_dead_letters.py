@@ -0,0 +1,101 @@
+"""Offline tests for dead-lettering and redriving failing players."""
+
+import json
+
+import requests
+
+from tap_NHL.dead_letters import DeadLetterQueue
+from tap_NHL.streams import PlayerLandingStream
+
+PLAYER_IDS = [8478402, 8471214, 8476945]
+BROKEN_PLAYER = 8471214
+
+
+def landing_response(player_id, broken):
+    """Build a landing response, with a malformed body for ``broken`` players."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = f"https://api-web.nhle.com/v1/player/{player_id}/landing"
+    response.request = requests.Request("GET", response.url).prepare()
+    if player_id in broken:
+        response._content = b"<html>upstream timeout</html>"
+    else:
+        response._content = json.dumps({"playerId": player_id, "isActive": True}).encode()
+    return response
+
+
+def serve_landing(monkeypatch, broken):
+    """Serve landing pages without the API and return the list of fetched player IDs."""
+    fetches = []
+
+    def fetch(self, player_id):
+        fetches.append(player_id)
+        return landing_response(player_id, broken)
+
+    monkeypatch.setattr(PlayerLandingStream, "_fetch_landing_response", fetch)
+    return fetches
+
+
+def dead_letter_config(tmp_path, **config):
+    """Return a config syncing PLAYER_IDS with dead letters kept under ``tmp_path``."""
+    return {
+        "skater_ids": PLAYER_IDS,
+        "dead_letter_path": str(tmp_path / "dead_letters.json"),
+        "dead_letter_backoff_seconds": 0,
+        **config,
+    }
+
+
+def test_failing_player_is_dead_lettered(tmp_path, run_sync, monkeypatch):
+    """Confirm that a player that keeps failing is recorded and the sync carries on"""
+    fetches = serve_landing(monkeypatch, {BROKEN_PLAYER})
+    config = dead_letter_config(tmp_path, dead_letter_mode="isolate", dead_letter_max_attempts=2)
+    records = run_sync(config).player_ids()
+    assert records == [8478402, 8476945], f"❌ Sync did not carry on past the failure: {records}."
+    assert fetches.count(BROKEN_PLAYER) == 2, "❌ Failing player was not retried."
+
+    entry = json.loads((tmp_path / "dead_letters.json").read_text())["skaters"][str(BROKEN_PLAYER)]
+    assert entry["attempts"] == 2
+    assert entry["response_snippet"] == "<html>upstream timeout</html>", "❌ Response snippet missing."
+    assert "JSONDecodeError" in entry["error"], f"❌ Unexpected error: {entry['error']}."
+
+
+def test_redrive_syncs_only_dead_lettered_players(tmp_path, run_sync, monkeypatch):
+    """Confirm that redrive fetches just the dead-lettered players and clears the recovered"""
+    serve_landing(monkeypatch, {BROKEN_PLAYER})
+    run_sync(dead_letter_config(tmp_path, dead_letter_mode="isolate"))
+
+    fetches = serve_landing(monkeypatch, set())
+    records = run_sync(dead_letter_config(tmp_path, dead_letter_mode="redrive")).player_ids()
+    assert records == [BROKEN_PLAYER], f"❌ Redrive synced other players: {records}."
+    assert fetches == [BROKEN_PLAYER], f"❌ Redrive made extra requests: {fetches}."
+    assert json.loads((tmp_path / "dead_letters.json").read_text()) == {}, "❌ Recovered player was kept."
+
+
+def test_retries_stop_at_the_sync_budget(tmp_path, run_sync, monkeypatch):
+    """Confirm that a retry that would outlast max_sync_seconds dead-letters the player"""
+    fetches = serve_landing(monkeypatch, {BROKEN_PLAYER})
+    config = dead_letter_config(
+        tmp_path, dead_letter_mode="isolate", dead_letter_backoff_seconds=3600, max_sync_seconds=60,
+    )
+    records = run_sync(config).player_ids()
+    assert records == [8478402, 8476945], f"❌ Sync did not carry on past the failure: {records}."
+    assert fetches.count(BROKEN_PLAYER) == 1, "❌ Retry slept past the sync budget."
+
+    entry = json.loads((tmp_path / "dead_letters.json").read_text())["skaters"][str(BROKEN_PLAYER)]
+    assert entry["attempts"] == 1, "❌ Skipped retries were counted as attempts."
+
+
+def test_shards_sharing_the_file_keep_each_others_entries(tmp_path):
+    """Confirm that changes from two queues on one file are merged, not overwritten"""
+    path = tmp_path / "dead_letters.json"
+    first, second = DeadLetterQueue(path), DeadLetterQueue(path)
+    error = RuntimeError("connection lost")
+
+    first.add("skaters", 1, error=error, response=None, attempts=3)
+    second.add("skaters", 2, error=error, response=None, attempts=3)
+    second.add("goalies", 3, error=error, response=None, attempts=3)
+    assert first.discard("skaters", 1), "❌ Own entry was not found."
+
+    assert DeadLetterQueue(path).player_ids("skaters") == [2], "❌ Another shard's entry was lost."
+    assert DeadLetterQueue(path).player_ids("goalies") == [3]
@@ -0,0 +1,86 @@
+"""Offline tests for the fast JSON decode path."""
+
+import json
+
+import pytest
+import requests
+from singer_sdk._singerlib.json import serialize_json
+from singer_sdk.helpers._typing import conform_record_data_types
+
+from tap_NHL.tap import TapNHL
+
+LANDING = {
+    "playerId": 8478402,
+    "isActive": True,
+    "firstName": {"default": "Connor"},
+    "featuredStats": {
+        "season": 20242025,
+        "regularSeason": {
+            "subSeason": {"goals": 25, "shootingPctg": 0.131579, "plusMinus": -3},
+            "career": {"goals": 385, "shootingPctg": 0.15862},
+        },
+    },
+    "careerTotals": {"regularSeason": {"faceoffWinningPctg": 0.52471, "avgToi": "21:29"}},
+    "seasonTotals": [
+        {"season": 20152016, "shootingPctg": 0.152, "gamesPlayed": 45, "teamName": {"default": "Edmonton Oilers"}},
+        {"season": 20162017, "shootingPctg": 0.1, "gamesPlayed": 82, "faceoffWinningPctg": 0.0},
+    ],
+    "undeclaredField": 1.5e-05,
+}
+
+
+# Numbers a float cannot reproduce digit for digit, and their shortest float form.
+INEXACT_NUMBERS = (
+    ("0.131579", "0.50", ":0.5,"),
+    ("0.15862", "1E2", ":100.0}"),
+    ("0.52471", "1.0E-4", ":0.0001,"),
+    ("0.152", "0.12345678901234567890", ":0.12345678901234568,"),
+)
+
+def parse(fast, body=None):
+    tap = TapNHL(config={"skater_ids": [8478402], "fast_json_decode": fast})
+    skaters = tap.streams["skaters"]
+    response = requests.Response()
+    response._content = body or json.dumps(LANDING).encode()
+    return skaters, list(skaters.parse_response(response))
+
+
+def emitted(stream, record):
+    row = stream.post_process(record, {"player_id": 8478402})
+    row = conform_record_data_types(
+        stream.name, row, stream.schema, stream.TYPE_CONFORMANCE_LEVEL, stream.logger,
+    )
+    return serialize_json(row)
+
+
+def test_fast_decode_matches_standard_records():
+    """Confirm that the fast decoder emits the same record values"""
+    standard_stream, standard = parse(fast=False)
+    fast_stream, fast = parse(fast=True)
+
+    assert fast_stream._fast_json_decode, "❌ Fast decode was not enabled."
+    assert len(fast) == len(standard) == 1
+    fast_row = emitted(fast_stream, fast[0])
+    assert json.loads(fast_row) == json.loads(emitted(standard_stream, standard[0])), "❌ Records differ."
+    assert '"shootingPctg":0.131579' in fast_row, "❌ A declared number changed its digits."
+
+
+@pytest.mark.parametrize(("original", "inexact", "expected"), INEXACT_NUMBERS)
+def test_fast_decode_writes_shortest_floats(original, inexact, expected):
+    """Confirm that numbers a float cannot reproduce keep their value in shortest float form"""
+    body = json.dumps(LANDING).replace(original, inexact, 1).encode()
+    standard_stream, (standard,) = parse(fast=False, body=body)
+    fast_stream, (fast,) = parse(fast=True, body=body)
+    fast_row = emitted(fast_stream, fast)
+    assert expected in fast_row, f"❌ {inexact} was not written as {expected[1:-1]}."
+    assert json.loads(fast_row) == json.loads(emitted(standard_stream, standard)), f"❌ {inexact} changed value."
+
+
+def test_fast_decode_converts_only_declared_numbers():
+    """Confirm that declared numbers become Decimal and undeclared ones stay float"""
+    _, (record,) = parse(fast=True)
+    sub_season = record["featuredStats"]["regularSeason"]["subSeason"]
+    assert type(sub_season["shootingPctg"]).__name__ == "Decimal", "❌ Declared number not converted."
+    assert type(record["seasonTotals"][0]["shootingPctg"]) is float, "❌ Extra number was converted."
+    assert type(record["undeclaredField"]) is float, "❌ Extra root number was converted."
+    assert type(record["seasonTotals"][0]["gamesPlayed"]) is int, "❌ Integer was converted."
@@ -0,0 +1,173 @@
+"""Offline tests for the stats API player discovery engine."""
+
+import threading
+import time
+from datetime import UTC, datetime
+
+import requests
+
+from benchmarks.fake_api import STATS_PREFIX, Dataset, FakeNHLAPI, ServerOptions
+from tap_NHL.discovery import (
+    DiscoveryCache,
+    PlayerDiscovery,
+    is_season_complete,
+    plan_season_spans,
+    season_expression,
+)
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Serve summary pages for a fixed number of players per season."""
+
+    def __init__(self, players_per_season):
+        self.players_per_season = players_per_season
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, endpoint, params, timeout):
+        with self._lock:
+            self.calls.append((endpoint, params["cayenneExp"], params["start"]))
+        season_id = int(params["cayenneExp"].split("=")[1])
+        total = self.players_per_season[season_id]
+        start, limit = params["start"], params["limit"]
+        data = [
+            {"playerId": season_id % 10000 * 1000 + index}
+            for index in range(start, min(start + limit, total))
+        ]
+        return FakeResponse({"data": data, "total": total})
+
+
+def test_discovery_plans_every_page_from_first_page_total():
+    """Confirm that all offsets are requested exactly once and IDs are merged"""
+    session = FakeSession({19171918: 3, 20232024: 7})
+    discovery = PlayerDiscovery(session, max_workers=3, page_size=2)
+
+    player_ids = discovery.discover(["skaters"], [19171918, 20232024])
+
+    assert len(player_ids) == 10, "❌ Discovery missed player IDs."
+    assert player_ids == sorted(player_ids), "❌ Discovery result is not sorted."
+    starts = sorted(start for _, exp, start in session.calls if exp.endswith("20232024"))
+    assert starts == [0, 2, 4, 6], "❌ Unexpected page offsets requested."
+
+
+def test_discovery_skips_follow_up_pages_for_empty_seasons():
+    """Confirm that an empty first page ends discovery for that season"""
+    session = FakeSession({20042005: 0})
+    discovery = PlayerDiscovery(session, max_workers=2, page_size=2)
+
+    assert discovery.discover(["skaters"], [20042005]) == []
+    assert len(session.calls) == 1, "❌ Follow-up pages requested for an empty season."
+
+
+def test_discovery_cache_reuses_finished_seasons(tmp_path):
+    """Confirm that a finished season is served from disk on the next run"""
+    cache_path = tmp_path / "discovery.json"
+    session = FakeSession({19171918: 3})
+    PlayerDiscovery(session, page_size=2, cache=DiscoveryCache(cache_path)).discover(
+        ["skaters"], [19171918],
+    )
+    assert cache_path.exists(), "❌ Discovery cache was not written."
+
+    second_session = FakeSession({19171918: 3})
+    player_ids = PlayerDiscovery(
+        second_session, page_size=2, cache=DiscoveryCache(cache_path),
+    ).discover(["skaters"], [19171918])
+
+    assert len(player_ids) == 3
+    assert second_session.calls == [], "❌ Finished season was scanned again."
+
+
+def test_discovery_cache_expires_unfinished_seasons(tmp_path):
+    """Confirm that the current season is refreshed once its TTL has passed"""
+    cache = DiscoveryCache(tmp_path / "discovery.json", ttl_seconds=0)
+    season_id = int(f"{datetime.now(UTC).year}{datetime.now(UTC).year + 1}")
+    cache.put("skaters", season_id, [1, 2])
+
+    assert not is_season_complete(season_id, time.time())
+    assert cache.get("skaters", season_id) is None, "❌ Stale current-season entry was reused."
+
+
+def test_shards_sharing_a_cache_scan_each_season_once(tmp_path):
+    """Confirm that a shard reuses results saved by another shard's discovery"""
+    path = tmp_path / "discovery.json"
+    first, second = DiscoveryCache(path), DiscoveryCache(path)
+    first_session, second_session = FakeSession({19171918: 3}), FakeSession({19171918: 3})
+
+    first_ids = PlayerDiscovery(first_session, page_size=2, cache=first).discover(["skaters"], [19171918])
+    second_ids = PlayerDiscovery(second_session, page_size=2, cache=second).discover(["skaters"], [19171918])
+
+    assert second_ids == first_ids
+    assert second_session.calls == [], "❌ Second shard re-scanned a cached season."
+
+
+def test_planner_merges_consecutive_finished_seasons_within_blocks():
+    """Confirm that finished seasons share range spans and the current season stays alone"""
+    now = datetime(2025, 1, 15, tzinfo=UTC).timestamp()
+    seasons = [int(f"{year}{year + 1}") for year in range(2016, 2025)]
+    seasons.remove(20192020)
+
+    spans = plan_season_spans(seasons, max_seasons=5, now=now)
+
+    assert spans == [
+        (20162017, 20182019),
+        (20202021, 20232024),
+        (20242025, 20242025),
+    ], "❌ Unexpected season spans."
+    assert plan_season_spans(seasons, max_seasons=1, now=now) == [(s, s) for s in seasons]
+    assert season_expression((20162017, 20182019)) == "seasonId>=20162017 and seasonId<=20182019"
+
+
+def test_truncated_range_falls_back_to_per_season_queries(tmp_path):
+    """Confirm that a range query missing rows is re-scanned season by season"""
+    dataset = Dataset(skaters=40, goalies=1, seasons=(20202021, 20212022, 20222023))
+    server = FakeNHLAPI(ServerOptions(dataset=dataset, max_result_rows=20))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"{server.url}{STATS_PREFIX}/skater/summary"
+    cache = DiscoveryCache(tmp_path / "discovery.json")
+    try:
+        with requests.Session() as session:
+            discovery = PlayerDiscovery(session, page_size=10, cache=cache, range_seasons=10)
+            player_ids = discovery.discover([endpoint], list(dataset.seasons))
+            requests_before = server.snapshot()["summary"]
+            assert discovery.discover([endpoint], list(dataset.seasons)) == player_ids
+            assert server.snapshot()["summary"] == requests_before, "❌ Per-season entries were not reused."
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert player_ids == list(dataset.skater_ids), "❌ Players of the truncated range were lost."
+    assert cache.get(endpoint, (20202021, 20222023)) is None, "❌ A truncated range was cached."
+    assert cache.get(endpoint, 20212022) == dataset.roster(dataset.skater_ids, 20212022)
+
+
+def test_range_queries_need_fewer_requests_than_per_season_scans():
+    """Confirm that aggregated range discovery finds the same players with fewer pages"""
+    dataset = Dataset(skaters=300, goalies=1, seasons=tuple(int(f"{y}{y + 1}") for y in range(2000, 2010)))
+    server = FakeNHLAPI(ServerOptions(dataset=dataset))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    endpoint = f"{server.url}{STATS_PREFIX}/skater/summary"
+    results = {}
+    try:
+        with requests.Session() as session:
+            for range_seasons in (1, 10):
+                before = server.snapshot()["summary"]
+                discovery = PlayerDiscovery(session, page_size=50, range_seasons=range_seasons)
+                player_ids = discovery.discover([endpoint], list(dataset.seasons))
+                results[range_seasons] = (player_ids, server.snapshot()["summary"] - before)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert results[10][0] == results[1][0]
+    assert results[10][1] < results[1][1], f"❌ Range discovery was not cheaper: {results}"
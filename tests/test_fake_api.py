@@ -0,0 +1,152 @@
+"""Offline tests running the tap against the benchmark fake API."""
+
+import threading
+
+import pytest
+
+from benchmarks.fake_api import Dataset, FakeNHLAPI, ServerOptions
+from tap_NHL.tap import TapNHL
+
+DATASET = Dataset(skaters=30, goalies=4, seasons=(20232024, 20242025))
+
+
+@pytest.fixture
+def fake_api():
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET, throttle_rate=0.5))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_discovery_and_landing_use_the_configured_hosts(fake_api):
+    """Confirm that discovery finds every fake player and landing pages parse"""
+    tap = TapNHL(
+        config={
+            "api_url": fake_api.url,
+            "stats_api_url": f"{fake_api.url}/stats/rest/en",
+            "discovery_seasons": list(DATASET.seasons),
+            "max_requests_per_second": 100,
+            "rate_limit_min_rps": 100,
+        },
+    )
+    skaters = tap.streams["skaters"]
+
+    assert skaters._fetch_all_player_ids() == list(DATASET.skater_ids), "❌ Discovery missed players."
+    records = list(skaters.parse_response(skaters._fetch_landing_response(DATASET.skater_ids[3])))
+    assert [record["playerId"] for record in records] == [DATASET.skater_ids[3]]
+    assert fake_api.snapshot()["throttled"], "❌ No 429 was injected."
+
+
+def test_season_summaries_reuse_the_discovery_scan(fake_api):
+    """Confirm that season summary rows are emitted from the discovery pages"""
+    tap = TapNHL(
+        config={
+            "api_url": fake_api.url,
+            "stats_api_url": f"{fake_api.url}/stats/rest/en",
+            "discovery_seasons": list(DATASET.seasons),
+            "max_requests_per_second": 100,
+            "rate_limit_min_rps": 100,
+        },
+    )
+    rows = list(tap.streams["skater_season_summary"].get_records(None))
+    expected = {
+        (player_id, season_id)
+        for season_id in DATASET.seasons
+        for player_id in DATASET.roster(DATASET.skater_ids, season_id)
+    }
+    assert {(row["playerId"], row["seasonId"]) for row in rows} == expected
+    assert len(rows) == len(expected), "❌ Summary rows were emitted more than once."
+
+    summary_requests = fake_api.snapshot()["summary"]
+    assert tap.streams["skaters"]._get_all_player_ids() == sorted({player_id for player_id, _ in expected})
+    assert fake_api.snapshot()["summary"] == summary_requests, "❌ Discovery scanned the pages again."
+
+
+def test_next_run_discovers_from_the_summary_scan_cache(fake_api, tmp_path):
+    """Confirm that a second run discovers players from the IDs cached by the summary scan"""
+    config = {
+        "api_url": fake_api.url,
+        "stats_api_url": f"{fake_api.url}/stats/rest/en",
+        "discovery_seasons": list(DATASET.seasons),
+        "discovery_range_seasons": 10,
+        "discovery_cache_path": str(tmp_path / "discovery.json"),
+        "max_requests_per_second": 100,
+        "rate_limit_min_rps": 100,
+    }
+    rows = list(TapNHL(config=config).streams["skater_season_summary"].get_records(None))
+
+    summary_requests = fake_api.snapshot()["summary"]
+    player_ids = TapNHL(config=config).streams["skaters"]._fetch_all_player_ids()
+    assert player_ids == sorted({row["playerId"] for row in rows}), "❌ Cached players differ."
+    assert fake_api.snapshot()["summary"] == summary_requests, "❌ The next run scanned the pages again."
+
+
+@pytest.fixture
+def steady_api():
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_landing_and_discovery_share_keep_alive_connections(steady_api):
+    """Confirm that every session reuses the tap's pooled connections"""
+    tap = TapNHL(
+        config={
+            "api_url": steady_api.url,
+            "stats_api_url": f"{steady_api.url}/stats/rest/en",
+            "discovery_seasons": list(DATASET.seasons),
+            "max_requests_per_second": 100,
+            "rate_limit_min_rps": 100,
+            "discovery_concurrency": 1,
+        },
+    )
+    skaters, goalies = tap.streams["skaters"], tap.streams["goalies"]
+    skaters._fetch_all_player_ids()
+    for player_id in DATASET.skater_ids[:5]:
+        skaters._fetch_landing_response(player_id)
+    goalies._fetch_landing_response(DATASET.goalie_ids[0])
+
+    sessions = (skaters.requests_session, goalies.requests_session, skaters._get_discovery_session())
+    assert len({id(session.get_adapter(steady_api.url).poolmanager) for session in sessions}) == 1
+    stats = steady_api.snapshot()
+    assert stats["connections"] == 1, f"❌ Requests opened extra connections: {stats}"
+
+
+def test_http_settings_control_request_headers(steady_api):
+    """Confirm that http_compression "none" yields identity bodies and keep-alive can be disabled"""
+    tap = TapNHL(config={"api_url": steady_api.url, "http_compression": "none", "http_keep_alive": False})
+    session = tap.http_transport.session()
+    for player_id in DATASET.skater_ids[:2]:
+        response = session.get(f"{steady_api.url}/v1/player/{player_id}/landing")
+
+    assert response.request.headers["Accept-Encoding"] == "identity"
+    assert "Content-Encoding" not in response.headers, "❌ Compressed body for identity request."
+    assert steady_api.snapshot()["connections"] == 2, "❌ Connection was kept alive."
+
+
+def test_active_roster_discovery_feeds_skaters_and_goalies_from_one_pass(steady_api):
+    """Confirm that active_rosters mode reads each team roster once for both streams"""
+    tap = TapNHL(
+        config={
+            "api_url": steady_api.url,
+            "stats_api_url": f"{steady_api.url}/stats/rest/en",
+            "discovery_mode": "active_rosters",
+            "max_requests_per_second": 100,
+            "rate_limit_min_rps": 100,
+        },
+    )
+    last_season = DATASET.seasons[-1]
+
+    skater_ids = tap.streams["skaters"]._fetch_all_player_ids()
+    goalie_ids = tap.streams["goalies"]._fetch_all_player_ids()
+
+    assert skater_ids == sorted(DATASET.roster(DATASET.skater_ids, last_season))
+    assert goalie_ids == sorted(DATASET.roster(DATASET.goalie_ids, last_season))
+    stats = steady_api.snapshot()
+    assert stats["roster"] == DATASET.teams + 1, f"❌ Rosters were not shared: {stats}"
+    assert stats["summary"] == 0, "❌ Active roster discovery scanned season summaries."
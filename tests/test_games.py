@@ -0,0 +1,89 @@
+"""Offline tests for the schedule-driven game streams."""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from benchmarks.fake_api import Dataset, FakeNHLAPI, ServerOptions
+from tap_NHL.decoding import iter_items
+
+DATASET = Dataset(skaters=10, goalies=2, games_per_day=2, plays_per_game=5)
+
+
+@pytest.fixture
+def fake_api():
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def sync_games(run_sync, fake_api, state=None, **config):
+    """Sync the games stream and its children; return records by stream and the last state."""
+    config = {
+        "api_url": fake_api.url,
+        "games_start_date": "2025-01-01",
+        "games_end_date": "2025-01-09",
+        "max_requests_per_second": 1000,
+        "rate_limit_max_rps": 1000,
+        **config,
+    }
+    result = run_sync(config, state, streams=("games",))
+    return result.records, result.state
+
+
+def test_games_walk_schedule_weeks_and_feed_child_streams(fake_api, run_sync):
+    """Confirm that every game in the window is emitted with its box score and plays"""
+    records, state = sync_games(run_sync, fake_api)
+
+    games = records["games"]
+    assert len(games) == 9 * DATASET.games_per_day, "❌ Games outside the window were emitted."
+    assert {game["gameDate"] for game in games} == {f"2025-01-0{day}" for day in range(1, 10)}
+    assert len(records["boxscores"]) == len(games)
+    plays = records["play_by_play"]
+    assert len(plays) == len(games) * DATASET.plays_per_game
+    assert {play["gameId"] for play in plays} == {game["id"] for game in games}
+    assert fake_api.snapshot()["schedule"] == 2, "❌ Expected one request per schedule week."
+    bookmark = state["bookmarks"]["games"]["replication_key_value"]
+    assert bookmark == "2025-01-09"
+
+
+def test_games_resume_from_the_bookmarked_day(fake_api, run_sync):
+    """Confirm that the next run only re-reads the bookmarked day"""
+    _, state = sync_games(run_sync, fake_api)
+    requests_before = fake_api.snapshot()["schedule"]
+
+    records, _ = sync_games(run_sync, fake_api, state=state)
+
+    assert {game["gameDate"] for game in records["games"]} == {"2025-01-09"}
+    assert fake_api.snapshot()["schedule"] - requests_before == 1
+
+
+def test_plays_are_decoded_incrementally():
+    """Confirm that items are yielded from partial chunks of a document"""
+    pytest.importorskip("ijson")
+
+    document = json.dumps({"id": 1, "plays": [{"eventId": n, "x": 1.5} for n in range(50)]}).encode()
+    chunks = [document[index : index + 7] for index in range(0, len(document), 7)]
+
+    plays = list(iter_items(chunks, "plays.item"))
+
+    assert [play["eventId"] for play in plays] == list(range(50))
+    assert str(plays[0]["x"]) == "1.5"
+
+
+def test_streamed_plays_bypass_the_response_cache(fake_api, run_sync, tmp_path):
+    """Confirm that streamed play-by-play documents are never buffered into the cache"""
+    pytest.importorskip("ijson")
+    cache_path = tmp_path / "responses.sqlite"
+    records, _ = sync_games(run_sync, fake_api, response_cache_path=str(cache_path))
+
+    assert len(records["play_by_play"]) == len(records["games"]) * DATASET.plays_per_game
+    with sqlite3.connect(cache_path) as db:
+        urls = [url for (url,) in db.execute("SELECT url FROM responses")]
+    assert any(url.endswith("/boxscore") for url in urls), "❌ Box scores were not cached."
+    assert not any(url.endswith("/play-by-play") for url in urls), "❌ A streamed document was cached."
@@ -0,0 +1,68 @@
+"""Offline tests for the HTTP response cache and the tap's transport adapter."""
+
+import io
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from tap_NHL.http_cache import ResponseCache
+from tap_NHL.transport import NHLHTTPAdapter
+
+URL = "https://api-web.nhle.com/v1/player/8478402/landing"
+
+
+def make_session(cache, monkeypatch, responses):
+    """Return a session whose network layer replays ``responses`` in order."""
+    sent = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(dict(request.headers))
+        status, headers, body = responses.pop(0)
+        raw = HTTPResponse(
+            body=io.BytesIO(body), status=status, headers=headers, preload_content=False,
+        )
+        return self.build_response(request, raw)
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    session = requests.Session()
+    session.mount("https://", NHLHTTPAdapter(cache=cache))
+    return session, sent
+
+
+def test_conditional_request_reuses_cached_body(tmp_path, monkeypatch):
+    """Confirm that a 304 answer is replaced by the stored body"""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1024, max_age_seconds=0)
+    session, sent = make_session(cache, monkeypatch, [
+        (200, {"ETag": '"v1"'}, b'{"playerId": 8478402}'),
+        (304, {"ETag": '"v1"'}, b""),
+    ])
+
+    assert session.get(URL).json() == {"playerId": 8478402}
+    second = session.get(URL)
+
+    assert second.status_code == 200
+    assert second.json() == {"playerId": 8478402}, "❌ Cached body not served on 304."
+    assert sent[1].get("If-None-Match") == '"v1"', "❌ Conditional header not sent."
+
+
+def test_entries_without_validators_are_served_until_max_age(tmp_path, monkeypatch):
+    """Confirm that young entries without validators skip the network"""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=1024, max_age_seconds=60)
+    session, sent = make_session(cache, monkeypatch, [(200, {}, b'{"a": 1}')])
+
+    session.get(URL)
+    assert session.get(URL).json() == {"a": 1}
+    assert len(sent) == 1, "❌ Fresh cache entry triggered a network request."
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    """Confirm that the store stays within its size budget"""
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=10, max_age_seconds=60)
+    for index in range(3):
+        response = requests.Response()
+        response._content = b"12345"
+        cache.put(f"{URL}?n={index}", response)
+
+    assert cache.get(f"{URL}?n=0") is None, "❌ Oldest entry was not evicted."
+    assert cache.get(f"{URL}?n=2") is not None
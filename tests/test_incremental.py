@@ -0,0 +1,71 @@
+"""Offline tests for incremental bookmarks and inactive-player skipping."""
+
+from datetime import UTC, datetime, timedelta
+
+from tap_NHL.streams import PlayerLandingStream
+from tap_NHL.tap import TapNHL
+
+
+def make_state(is_active, synced_days_ago):
+    synced_at = datetime.now(UTC) - timedelta(days=synced_days_ago)
+    return {
+        "bookmarks": {
+            "skaters": {
+                "partitions": [
+                    {
+                        "context": {"player_id": 1},
+                        "is_active": is_active,
+                        "last_synced_at": synced_at.isoformat(),
+                    },
+                ],
+            },
+        },
+    }
+
+
+def get_skaters(state):
+    tap = TapNHL(config={"skater_ids": [1]}, state=state)
+    return tap.streams["skaters"]
+
+
+def test_last_game_date_is_latest_of_last5_games():
+    """Confirm that lastGameDate picks the most recent game"""
+    row = {"last5Games": [{"gameDate": "2025-01-03"}, {"gameDate": "2025-01-07"}, {}]}
+    assert PlayerLandingStream._get_last_game_date(row) == "2025-01-07"
+    assert PlayerLandingStream._get_last_game_date({"last5Games": None}) is None
+
+
+def test_recently_synced_inactive_player_is_skipped():
+    """Confirm that retired players are not re-fetched inside the re-check window"""
+    skaters = get_skaters(make_state(is_active=False, synced_days_ago=1))
+    assert skaters._should_skip_player({"player_id": 1}), "❌ Inactive player was not skipped."
+    assert list(skaters.get_records({"player_id": 1})) == []
+
+
+def test_inactive_player_is_rechecked_after_interval():
+    """Confirm that inactive players are fetched again once the interval passes"""
+    skaters = get_skaters(make_state(is_active=False, synced_days_ago=45))
+    assert not skaters._should_skip_player({"player_id": 1}), "❌ Re-check interval ignored."
+
+
+def test_active_player_is_never_skipped():
+    """Confirm that active players are always fetched"""
+    skaters = get_skaters(make_state(is_active=True, synced_days_ago=0))
+    assert not skaters._should_skip_player({"player_id": 1}), "❌ Active player was skipped."
+
+
+def test_unchanged_records_are_suppressed():
+    """Confirm that a record matching the stored fingerprint is not re-emitted"""
+    tap = TapNHL(config={"skater_ids": [1], "skip_unchanged_records": True})
+    skaters = tap.streams["skaters"]
+    record = {"playerId": 1, "isActive": True, "goals": 3}
+    context = {"player_id": 1}
+
+    first = list(skaters._suppress_unchanged_records([dict(record)], context))
+    second = list(skaters._suppress_unchanged_records([dict(record)], context))
+    changed = list(skaters._suppress_unchanged_records([{**record, "goals": 4}], context))
+
+    assert first == [record], "❌ New record was suppressed."
+    assert second == [], "❌ Unchanged record was re-emitted."
+    assert len(changed) == 1, "❌ Changed record was suppressed."
+    assert skaters._suppressed_records == 1
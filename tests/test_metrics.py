@@ -0,0 +1,122 @@
+"""Tests for the built-in sync metrics."""
+
+import json
+import threading
+
+import pytest
+
+from benchmarks.fake_api import Dataset, FakeNHLAPI, ServerOptions
+from tap_NHL.metrics import LatencyHistogram, SyncMetrics, endpoint_label
+from tap_NHL.tap import TapNHL
+
+DATASET = Dataset(skaters=20, goalies=2, seasons=(20232024, 20242025))
+
+
+@pytest.fixture
+def fake_api():
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET, throttle_rate=0.5))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_histogram_percentiles_stay_within_bucket_error():
+    """Confirm that percentiles are accurate to the histogram's bucket growth"""
+    histogram = LatencyHistogram(growth=1.05)
+    for millis in range(1, 1001):
+        histogram.add(millis / 1000)
+
+    for percent in (50, 90, 99):
+        expected = percent / 100
+        assert abs(histogram.percentile(percent) - expected) <= expected * 0.05, (
+            f"❌ p{percent} is off by more than one bucket."
+        )
+    assert histogram.summary()["max_ms"] == 1000.0
+    assert endpoint_label("https://x/v1/player/8478402/landing?a=1") == "/v1/player/{id}/landing"
+
+
+def test_endpoint_labels_template_dates_seasons_and_teams():
+    """Confirm that per-request path segments are collapsed into placeholders"""
+    assert endpoint_label("https://x/v1/schedule/2025-01-01") == "/v1/schedule/{date}"
+    assert endpoint_label("https://x/v1/roster/EDM/current") == "/v1/roster/{team}/current"
+    assert endpoint_label("https://x/v1/roster/EDM/20242025") == "/v1/roster/{team}/{season}"
+    assert endpoint_label("https://x/v1/gamecenter/2024020001/boxscore") == "/v1/gamecenter/{id}/boxscore"
+
+
+def test_sync_reports_requests_retries_and_phases(fake_api, tmp_path):
+    """Confirm that a sync writes per-endpoint request, 429 and phase metrics"""
+    metrics_path = tmp_path / "metrics.json"
+    tap = TapNHL(
+        config={
+            "api_url": fake_api.url,
+            "stats_api_url": f"{fake_api.url}/stats/rest/en",
+            "discovery_seasons": list(DATASET.seasons),
+            "discovery_range_seasons": 1,
+            "skater_ids": list(DATASET.skater_ids[:8]),
+            "max_requests_per_second": 1000,
+            "rate_limit_max_rps": 1000,
+            "metrics_path": str(metrics_path),
+        },
+    )
+    tap.streams["skaters"]._fetch_all_player_ids()
+    tap.metrics.add_time("post_process", 0.5)
+    tap._report_metrics()
+
+    summary = json.loads(metrics_path.read_text())
+    discovery = summary["endpoints"]["/stats/rest/en/skater/summary"]
+    assert discovery["requests"] >= 1, "❌ Discovery requests were not counted."
+    assert discovery["throttled_429"] == discovery["retries"] >= 1, "❌ Retried 429s were not counted."
+    assert discovery["latency"]["count"] == discovery["requests"]
+    assert discovery["wire_bytes"] > 0
+    assert summary["phases"]["discovery"]["count"] == 1
+    assert summary["phases"]["post_process"]["seconds"] == 0.5
+    assert "current_rate" in summary["rate_limiter"]
+
+
+def test_progress_is_only_due_after_the_log_interval():
+    """Confirm that progress lines are rate-limited by the log interval"""
+    assert not SyncMetrics().progress_due(), "❌ Progress logging should be off by default."
+    metrics = SyncMetrics(log_interval=0.0)
+    metrics.count_records("skaters", 3)
+    assert metrics.progress_due()
+    assert metrics.progress()["records"] == 3
+
+
+@pytest.fixture
+def steady_api():
+    server = FakeNHLAPI(ServerOptions(dataset=DATASET))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_cli_sync_reports_metrics_and_writes_a_profile(steady_api, tmp_path, capsys):
+    """Confirm that a CLI sync writes its metrics and profile once every stream is done"""
+    metrics_path = tmp_path / "metrics.json"
+    profile_path = tmp_path / "sync.prof"
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        "api_url": steady_api.url,
+        "stats_api_url": f"{steady_api.url}/stats/rest/en",
+        "discovery_seasons": list(DATASET.seasons),
+        "skater_ids": list(DATASET.skater_ids[:2]),
+        "goalie_ids": list(DATASET.goalie_ids[:1]),
+        "games_start_date": "2025-01-01",
+        "games_end_date": "2025-01-02",
+        "max_requests_per_second": 1000,
+        "rate_limit_max_rps": 1000,
+        "metrics_path": str(metrics_path),
+        "profile_path": str(profile_path),
+    }))
+    TapNHL.invoke(config=(str(config_path),))
+    capsys.readouterr()
+
+    assert profile_path.stat().st_size > 0, "❌ No profile was written."
+    summary = json.loads(metrics_path.read_text())
+    endpoints = summary["endpoints"]
+    assert endpoints["/v1/player/{id}/landing"]["requests"] >= 3, "❌ Landing requests missing."
+    assert endpoints["/v1/schedule/{date}"]["requests"] == 1, "❌ Last stream's requests missing."
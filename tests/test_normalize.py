@@ -0,0 +1,50 @@
+"""Offline tests for the schema-compiled locale normalizer."""
+
+from tap_NHL.normalize import compile_locale_normalizer
+from tap_NHL.tap import TapNHL
+from tests.locale_fixtures import legacy_normalize, make_landing
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "firstName": {"type": ["string", "object", "null"]},
+        "badges": {
+            "type": ["array", "null"],
+            "items": {"type": "object", "properties": {"title": {"type": ["object", "null"]}}},
+        },
+        "draftDetails": {
+            "type": ["object", "null"],
+            "properties": {"teamName": {"type": ["string", "null"]}},
+        },
+        "positions": {"type": ["array", "null"], "items": {"type": ["string", "null"]}},
+    },
+}
+
+
+def test_normalizer_flattens_localized_values_wherever_the_schema_expects_text():
+    """Confirm that nested localized objects are flattened and object fields kept"""
+    normalize = compile_locale_normalizer(SCHEMA)
+    row = normalize({
+        "firstName": {"default": "Connor", "fr": "Connor"},
+        "badges": [{"title": {"default": "Top 100"}}],
+        "draftDetails": {"teamName": {"fr": "", "cs": "Oilers"}},
+        "positions": [{"en": "C"}, "LW"],
+    })
+
+    assert row["firstName"] == "Connor", "❌ Top-level name not flattened."
+    assert row["draftDetails"]["teamName"] == "Oilers", "❌ Nested name not flattened."
+    assert row["positions"] == ["C", "LW"], "❌ Array of names not flattened."
+    assert row["badges"][0]["title"] == {"default": "Top 100"}, "❌ Object field was flattened."
+
+
+def test_normalizer_matches_former_locale_handling():
+    """Confirm that the landing streams flatten the same fields as the old loops"""
+    skaters = TapNHL(config={"skater_ids": [1]}).streams["skaters"]
+    compiled = skaters._locale_normalizer(make_landing(seasons=3))
+    legacy = legacy_normalize(make_landing(seasons=3))
+
+    for field in ("firstName", "lastName", "birthCity", "fullTeamName", "teamCommonName"):
+        assert compiled[field] == legacy[field], f"❌ {field} differs."
+    for ours, theirs in zip(compiled["seasonTotals"], legacy["seasonTotals"]):
+        assert ours["teamName"] == theirs["teamName"]
+        assert ours["teamCommonName"] == theirs["teamCommonName"]
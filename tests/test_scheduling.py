@@ -0,0 +1,55 @@
+"""Offline tests for priority scheduling and time-budgeted syncs."""
+
+import json
+from datetime import UTC, date, datetime
+
+from tap_NHL.checkpoint import CompactCheckpoint
+from tap_NHL.streams import PlayerLandingStream
+
+PLAYER_IDS = [8478402, 8471214, 8476945, 8480069]
+
+
+def test_partitions_sync_by_priority(run_sync, fake_landing):
+    """Confirm that active, recent, unsynced and other players sync in that order"""
+    today = datetime.now(UTC).date().isoformat()
+    partitions = [
+        {"context": {"player_id": 1}, "is_active": False, "last_synced_at": "2020-01-01T00:00:00+00:00",
+         "replication_key": "lastGameDate", "replication_key_value": "2010-03-01"},
+        {"context": {"player_id": 2}, "is_active": True, "last_synced_at": "2020-01-01T00:00:00+00:00"},
+        {"context": {"player_id": 4}, "is_active": False, "last_synced_at": "2020-01-01T00:00:00+00:00",
+         "replication_key": "lastGameDate", "replication_key_value": today},
+    ]
+    state = {"bookmarks": {"skaters": {"partitions": partitions}}}
+    config = {"skater_ids": [1, 2, 3, 4]}
+    records = run_sync(config, json.loads(json.dumps(state))).player_ids()
+    assert records == [2, 4, 3, 1], f"❌ Players were not synced by priority: {records}."
+
+    records = run_sync({**config, "partition_order": "player_id"}, state).player_ids()
+    assert records == [1, 2, 3, 4], f"❌ player_id order was not kept: {records}."
+
+    checkpoint_state = {}
+    checkpoint = CompactCheckpoint(checkpoint_state, flush_interval=0, recheck_days=7)
+    long_ago = date(2020, 1, 1)
+    checkpoint.mark(1, is_active=False, synced_on=long_ago, last_game_date="2010-03-01")
+    checkpoint.mark(2, is_active=True, synced_on=long_ago)
+    checkpoint.mark(4, is_active=False, synced_on=long_ago, last_game_date=today)
+    checkpoint.save()
+    assert not checkpoint_state["inactive"], "❌ Expired inactive players were kept."
+    state = {"bookmarks": {"skaters": {"checkpoint": checkpoint_state}}}
+    records = run_sync({**config, "checkpoint_mode": "compact"}, state).player_ids()
+    assert records == [2, 4, 3, 1], f"❌ Compact checkpoint lost the priorities: {records}."
+
+
+def test_budgeted_run_resumes_where_it_stopped(run_sync, fake_landing, monkeypatch):
+    """Confirm that a run stopped by max_sync_seconds leaves the rest for the next run"""
+    monkeypatch.setattr(PlayerLandingStream, "_fetch_all_player_ids", lambda self: PLAYER_IDS)
+    config = {"checkpoint_mode": "compact", "max_sync_seconds": 3600}
+    fake_landing["stop_after"] = PLAYER_IDS[1]
+    result = run_sync(config)
+    assert result.player_ids() == PLAYER_IDS[:2], "❌ Run did not stop when the budget ran out."
+    assert result.state["bookmarks"]["skaters"]["checkpoint"]["run"]["completed"] == 2
+
+    fake_landing["stop_after"] = None
+    result = run_sync(config, result.state)
+    assert result.player_ids() == PLAYER_IDS[2:], "❌ Next run did not continue with the remaining players."
+    assert "run" not in result.state["bookmarks"]["skaters"]["checkpoint"], "❌ Finished run was kept."
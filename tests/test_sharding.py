@@ -0,0 +1,40 @@
+"""Offline tests for splitting the player-ID space across tap processes."""
+
+import pytest
+
+from tap_NHL.sharding import Shard, shard_of
+from tap_NHL.tap import TapNHL
+
+PLAYER_IDS = list(range(8470000, 8474000))
+
+
+def test_shards_cover_every_player_exactly_once():
+    """Confirm that shards are disjoint, complete and roughly balanced"""
+    shards = [Shard(index, 4) for index in range(4)]
+    owners = [[shard for shard in shards if shard.owns(player_id)] for player_id in PLAYER_IDS]
+
+    assert all(len(owner) == 1 for owner in owners), "❌ A player is owned by zero or several shards."
+    sizes = [sum(shard.owns(player_id) for player_id in PLAYER_IDS) for shard in shards]
+    assert min(sizes) > len(PLAYER_IDS) / 4 * 0.9, f"❌ Unbalanced shards: {sizes}"
+
+
+def test_shard_assignment_is_stable_across_runs():
+    """Confirm that the assignment does not depend on the process"""
+    assert [shard_of(player_id, 4) for player_id in (8478402, 8471214, 8476945)] == [1, 2, 0]
+
+
+def test_invalid_shard_is_rejected():
+    """Confirm that out-of-range shard settings fail fast"""
+    with pytest.raises(ValueError):
+        Shard(index=4, count=4)
+
+
+def test_stream_partitions_only_include_the_shard_players():
+    """Confirm that each tap process syncs only its own players"""
+    synced = []
+    for index in range(3):
+        config = {"skater_ids": PLAYER_IDS[:300], "shard_index": index, "shard_count": 3}
+        skaters = TapNHL(config=config).streams["skaters"]
+        synced.extend(partition["player_id"] for partition in skaters.partitions)
+
+    assert sorted(synced) == PLAYER_IDS[:300], "❌ Shards did not split the configured players."
@@ -0,0 +1,46 @@
+"""Tests keeping tap startup and discovery cheap."""
+
+import subprocess
+import sys
+
+import requests
+
+from tap_NHL.streams import PlayerLandingStream
+from tap_NHL.tap import TapNHL
+
+
+def test_discovery_makes_no_requests_and_opens_no_caches(monkeypatch, tmp_path):
+    """Confirm that building the catalog never touches the network or the caches"""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("❌ Discovery made a request.")
+
+    monkeypatch.setattr(requests.Session, "send", fail)
+    monkeypatch.setattr(PlayerLandingStream, "_fetch_all_player_ids", fail)
+    tap = TapNHL(
+        config={
+            "response_cache_path": str(tmp_path / "responses.db"),
+            "discovery_cache_path": str(tmp_path / "discovery.json"),
+            "conformance_mode": "compiled",
+        },
+    )
+
+    catalog = tap.catalog_dict
+    assert {entry["tap_stream_id"] for entry in catalog["streams"]} >= {"skaters", "goalies"}
+    assert not list(tmp_path.iterdir()), "❌ Discovery created cache files."
+    assert tap.streams["skater_game_log"].schema["properties"]["playerId"] == {"type": "integer"}
+
+
+def test_importing_the_tap_defers_optional_modules():
+    """Confirm that modules only needed by optional features are not imported at startup"""
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, tap_NHL.tap; print(sorted({'sqlite3', 'cProfile'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert output.stdout.strip() == "[]", f"❌ Eagerly imported: {output.stdout.strip()}"